@@ -0,0 +1,181 @@
+# Gruppe 3 – Battlesnake Projekt (SS2025)
+# Mitglieder:
+# Eren Temizkan, 223201982
+# Dominik Ide, 220200046
+# Dogukan Karakoyun, 223202023
+# Alexandra Holsten, 221200813
+# Yuxiao Wu, 223200006
+
+import time
+import typing
+
+from Battlesnake.lookahead import leaf_regions
+from Battlesnake.safety import MOVES, MoveSafety
+from Battlesnake.utils import debug
+
+DEFAULT_TIMEOUT_MS = 500   # Standard-Timeout der Engine, falls der Request keinen nennt
+DEFAULT_NETWORK_MS = 100   # angenommene Netzwerkzeit, solange noch keine Latenz gemessen wurde
+MIN_NETWORK_MS = 20        # untere Grenze für die Netzwerkzeit
+SAFETY_MS = 40             # Reserve für Sicherheitsprüfung, Logging und Serialisierung
+GROWTH = 1.5               # angenommener Zeitzuwachs von einer Tiefe zur nächsten
+
+
+class SearchTimeout(Exception):
+    """Wird geworfen, wenn eine Suchtiefe das Zeitbudget überschreitet."""
+
+
+class Deadline:
+    """
+    Zeitbudget eines Zugs.
+
+    Das Budget ist der Timeout des Spiels abzüglich der Netzwerkzeit und einer festen
+    Reserve. Die Netzwerkzeit wird aus der Latenz geschätzt, die die Engine für den letzten
+    Zug gemessen hat (you.latency), abzüglich der Rechenzeit, die wir selbst dafür gebraucht
+    haben.
+
+    :ivar started: Zeitpunkt (perf_counter) des Request-Eingangs
+    :ivar budget_ms: Verfügbare Rechenzeit in ms
+    """
+    __slots__ = ('started', 'budget_ms')
+
+    def __init__(self, budget_ms: float, started: float | None = None):
+        """
+        :param budget_ms: Verfügbare Rechenzeit in ms
+        :param started: Startzeitpunkt (perf_counter), Standard: jetzt
+        """
+        self.started = time.perf_counter() if started is None else started
+        self.budget_ms = max(0.0, budget_ms)
+
+    @classmethod
+    def from_request(cls, game_state: typing.Dict, started: float | None = None,
+                     last_compute_ms: float | None = None) -> 'Deadline':
+        """
+        Leitet das Budget aus game.timeout und you.latency des Requests ab.
+
+        :param game_state: JSON-Zustand des Zugs
+        :param started: Startzeitpunkt (perf_counter) des Zugs
+        :param last_compute_ms: eigene Rechenzeit des letzten Zugs (aus der Session)
+        :return: Deadline des Zugs
+        """
+        timeout = game_state.get('game', {}).get('timeout') or DEFAULT_TIMEOUT_MS
+        try:
+            latency = float(game_state['you'].get('latency') or 0)
+        except (TypeError, ValueError):
+            latency = 0.0
+
+        if latency > 0 and last_compute_ms is not None:
+            network = max(MIN_NETWORK_MS, latency - last_compute_ms)
+        else:
+            network = DEFAULT_NETWORK_MS
+        return cls(float(timeout) - network - SAFETY_MS, started)
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+    def remaining_ms(self) -> float:
+        return self.budget_ms - self.elapsed_ms()
+
+    def expired(self) -> bool:
+        return self.remaining_ms() <= 0
+
+    def check(self) -> None:
+        """
+        Bricht eine laufende Suchtiefe ab, sobald das Budget verbraucht ist.
+
+        :raises SearchTimeout: wenn die Deadline überschritten ist
+        """
+        if self.expired():
+            raise SearchTimeout()
+
+
+def iterative_deepening(deadline: Deadline,
+                        search: typing.Callable[[int], str | None],
+                        best_move: str | None,
+                        max_depth: int,
+                        min_depth: int = 1) -> tuple[str | None, int]:
+    """
+    Vertieft die Suche Tiefe für Tiefe, bis das Budget fast verbraucht ist.
+
+    Nach jeder vollständig abgeschlossenen Tiefe wird deren Zug übernommen; eine Tiefe, die
+    mit SearchTimeout abbricht, wird verworfen. Eine neue Tiefe wird nur begonnen, wenn die
+    Restzeit für die geschätzten Kosten (letzte Tiefe * GROWTH) reicht.
+
+    :param deadline: Zeitbudget des Zugs
+    :param search: Suche für eine feste Tiefe, liefert den besten Zug oder None
+    :param best_move: Zug, der ohne jede abgeschlossene Tiefe gilt
+    :param max_depth: größte sinnvolle Tiefe
+    :param min_depth: erste Tiefe
+    :return: (bester Zug, größte abgeschlossene Tiefe; 0 = keine)
+    """
+    reached = 0
+    last_ms = 0.0
+    for depth in range(min_depth, max_depth + 1):
+        if deadline.remaining_ms() < last_ms * GROWTH:
+            break
+        depth_start = time.perf_counter()
+        try:
+            move = search(depth)
+        except SearchTimeout:
+            break
+        last_ms = (time.perf_counter() - depth_start) * 1000
+        if move is not None:
+            best_move = move
+        reached = depth
+    return best_move, reached
+
+
+def lookahead_move(index, move_scores: typing.Dict[str, int], my_length: int,
+                   deadline: Deadline, max_depth: int | None = None) -> tuple[str | None, int]:
+    """
+    Verfeinert den Heatmap-Zug mit einer Vorausschau, die so tief geht, wie die Zeit reicht.
+
+    Pro legalem Zug wächst eine Frontier-Maske Tiefe für Tiefe weiter (Schwänze rücken nach,
+    siehe BoardIndex.free_masks). In jeder Tiefe zählt der größte Platz unter den Blättern,
+    gedeckelt auf die eigene Länge: Züge, die genug Platz behalten, sind gleichwertig und
+    werden weiter nach der Heatmap sortiert; nur Fallen mit zu wenig Platz fallen zurück.
+
+    :param index: BoardIndex des aktuellen Zugs
+    :param move_scores: Heatmap-Wert pro Richtung
+    :param my_length: eigene Länge
+    :param deadline: Zeitbudget des Zugs
+    :param max_depth: größte Tiefe (Standard: bis sich die freien Felder nicht mehr ändern)
+    :return: (bester Zug, erreichte Tiefe)
+    """
+    best_move = max(move_scores, key=move_scores.get) if move_scores else None
+    safety = MoveSafety(index)
+    candidates = [name for name, _ in MOVES if name in move_scores and safety.is_legal(name)]
+    if len(candidates) < 2:
+        return best_move, 0  # nichts zu entscheiden
+
+    board = index.board
+    head = index.state.head(index.state.you)
+    hx, hy = head % index.width, head // index.width
+    offsets = dict(MOVES)
+    frontiers = {name: board.bit(hx + offsets[name][0], hy + offsets[name][1]) for name in candidates}
+
+    # Ab der Tiefe, in der das letzte Schlangenteil frei wird, ändern sich die freien Felder
+    # nicht mehr; eine Frontier bleibt dann in ihren Regionen und das Ergebnis steht fest.
+    depth_limit = min(index.width * index.height, max(index.free_turns(), default=0) + 1)
+    if max_depth is not None:
+        depth_limit = min(depth_limit, max_depth)
+    free_masks = index.free_masks(depth_limit + 1)
+
+    def search(depth: int) -> str | None:
+        # Tiefe d: die Frontier steht nach Zug 1 auf dem Nachbarfeld und wächst auf die Felder,
+        # die nach d + 1 Zügen frei sind (free_masks[d])
+        free = free_masks[depth]
+        grown = {}
+        spaces = {}
+        for name, frontier in frontiers.items():
+            deadline.check()
+            frontier = board.neighbours(frontier) & free
+            grown[name] = frontier
+            regions = leaf_regions(board, free, frontier)
+            spaces[name] = min(my_length, max((board.count(r) for r in regions), default=0))
+        frontiers.update(grown)  # erst nach vollständiger Tiefe übernehmen
+        return max(candidates, key=lambda name: (spaces[name], move_scores[name]))
+
+    move, depth = iterative_deepening(deadline, search, best_move, depth_limit)
+    if move != best_move:
+        debug(f"[Anytime] Tiefe {depth}: {best_move} → {move}")
+    return move, depth
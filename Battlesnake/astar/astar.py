@@ -7,10 +7,8 @@
 
 
 from abc import ABC, abstractmethod
-from typing import Callable, Dict, Iterable, Union, TypeVar, Generic
+from typing import Any, Callable, Dict, Hashable, Iterable, Union, TypeVar, Generic
 from math import inf as infinity
-from operator import attrgetter
-import heapq
 
 # introduce generic type
 T = TypeVar("T")
@@ -20,7 +18,7 @@ T = TypeVar("T")
 class SearchNode(Generic[T]):
     """Representation of a search node"""
 
-    __slots__ = ("data", "gscore", "fscore", "closed", "came_from", "in_openset", "cache")
+    __slots__ = ("data", "gscore", "fscore", "closed", "came_from", "in_openset", "heap_index", "cache")
 
     def __init__(
             self, data: T, gscore: float = infinity, fscore: float = infinity
@@ -30,6 +28,7 @@ class SearchNode(Generic[T]):
         self.fscore = fscore
         self.closed = False
         self.in_openset = False
+        self.heap_index = -1
         self.came_from: Union[None, SearchNode[T]] = None
         self.cache: Any = None
 
@@ -39,13 +38,30 @@ class SearchNode(Generic[T]):
 
 
 ################################################################################
-class SearchNodeDict(Dict[T, SearchNode[T]]):
-    """A dict that returns a new SearchNode when a key is missing"""
+class SearchNodeStore(Generic[T]):
+    """
+    Node store keyed by AStar.node_key instead of by the node data itself.
 
-    def __missing__(self, k) -> SearchNode[T]:
-        v = SearchNode(k)
-        self.__setitem__(k, v)
-        return v
+    With an integer key (e.g. a flat cell index) lookups avoid hashing the
+    node objects, and equal nodes built as separate objects share one SearchNode.
+    """
+
+    __slots__ = ("nodes", "key")
+
+    def __init__(self, key: Callable[[T], Hashable]) -> None:
+        self.nodes: Dict[Hashable, SearchNode[T]] = {}
+        self.key = key
+
+    def get(self, data: T) -> SearchNode[T]:
+        k = self.key(data)
+        node = self.nodes.get(k)
+        if node is None:
+            node = self.nodes[k] = SearchNode(data)
+        return node
+
+    def add(self, node: SearchNode[T]) -> SearchNode[T]:
+        self.nodes[self.key(node.data)] = node
+        return node
 
 
 ################################################################################
@@ -53,27 +69,86 @@ SNType = TypeVar("SNType", bound=SearchNode)
 
 
 class OpenSet(Generic[SNType]):
+    """
+    Indexed binary heap ordered by fscore.
+
+    Every node remembers its position in the heap (heap_index), so
+    decrease_key and remove run in O(log n) instead of a linear search.
+    """
+
     def __init__(self) -> None:
         self.heap: list[SNType] = []
 
     def push(self, item: SNType) -> None:
         item.in_openset = True
-        heapq.heappush(self.heap, item)
+        item.heap_index = len(self.heap)
+        self.heap.append(item)
+        self._sift_up(item.heap_index)
 
     def pop(self) -> SNType:
-        item = heapq.heappop(self.heap)
+        heap = self.heap
+        last = heap.pop()
+        if heap:
+            item = heap[0]
+            heap[0] = last
+            last.heap_index = 0
+            self._sift_down(0)
+        else:
+            item = last
         item.in_openset = False
+        item.heap_index = -1
         return item
 
+    def decrease_key(self, item: SNType) -> None:
+        """Restores the heap order after item.fscore has been lowered."""
+        self._sift_up(item.heap_index)
+
     def remove(self, item: SNType) -> None:
-        idx = self.heap.index(item)
+        heap = self.heap
+        idx = item.heap_index
         item.in_openset = False
-        item = self.heap.pop()
-        if idx < len(self.heap):
-            self.heap[idx] = item
+        item.heap_index = -1
+        last = heap.pop()
+        if idx < len(heap):
+            heap[idx] = last
+            last.heap_index = idx
             # Fix heap invariants
-            heapq._siftup(self.heap, idx)
-            heapq._siftdown(self.heap, 0, idx)
+            self._sift_up(idx)
+            self._sift_down(last.heap_index)
+
+    def _sift_up(self, idx: int) -> None:
+        heap = self.heap
+        item = heap[idx]
+        while idx > 0:
+            parent_idx = (idx - 1) >> 1
+            parent = heap[parent_idx]
+            if not item.fscore < parent.fscore:
+                break
+            heap[idx] = parent
+            parent.heap_index = idx
+            idx = parent_idx
+        heap[idx] = item
+        item.heap_index = idx
+
+    def _sift_down(self, idx: int) -> None:
+        heap = self.heap
+        size = len(heap)
+        item = heap[idx]
+        while True:
+            child_idx = 2 * idx + 1
+            if child_idx >= size:
+                break
+            right_idx = child_idx + 1
+            if right_idx < size and heap[right_idx].fscore < heap[child_idx].fscore:
+                child_idx = right_idx
+            child = heap[child_idx]
+            if not child.fscore < item.fscore:
+                break
+            heap[idx] = child
+            child.heap_index = idx
+            idx = child_idx
+        heap[idx] = item
+        item.heap_index = idx
 
     def __len__(self) -> int:
         return len(self.heap)
@@ -130,8 +205,17 @@ class AStar(ABC, Generic[T]):
         """
         return self.neighbors(node.data)
 
-    def _neighbors(self, current: SearchNode[T], search_nodes: SearchNodeDict[T]) -> Iterable[SearchNode]:
-        return (search_nodes[n] for n in self.path_neighbors(current))
+    def node_key(self, node: T) -> Hashable:
+        """
+        Key under which the search node for 'node' is stored.
+        Defaults to the node itself; subclasses can return a cheap integer
+        (e.g. a flat grid index) to avoid hashing the node objects.
+        """
+        return node
+
+    def _neighbors(self, current: SearchNode[T], search_nodes: SearchNodeStore[T]) -> Iterable[SearchNode]:
+        get = search_nodes.get
+        return (get(n) for n in self.path_neighbors(current))
 
     def is_goal_reached(self, current: T, goal: T) -> bool:
         """
@@ -160,10 +244,10 @@ class AStar(ABC, Generic[T]):
             return [start]
 
         openSet: OpenSet[SearchNode[T]] = OpenSet()
-        searchNodes: SearchNodeDict[T] = SearchNodeDict()
-        startNode = searchNodes[start] = SearchNode(
+        searchNodes: SearchNodeStore[T] = SearchNodeStore(self.node_key)
+        startNode = searchNodes.add(SearchNode(
             start, gscore=0.0, fscore=self.heuristic_cost_estimate(start, goal)
-        )
+        ))
         openSet.push(startNode)
 
         while openSet:
@@ -192,8 +276,12 @@ class AStar(ABC, Generic[T]):
                         # the new path to this node isn't better
                         continue
 
-                    # we have to remove the item from the heap, as its score has changed
-                    openSet.remove(neighbor)
+                    # better path to a queued node: lower its key in place
+                    neighbor.came_from = current
+                    neighbor.gscore = gscore
+                    neighbor.fscore = fscore
+                    openSet.decrease_key(neighbor)
+                    continue
 
                 # update the node
                 neighbor.came_from = current
@@ -0,0 +1,160 @@
+# Gruppe 3 – Battlesnake Projekt (SS2025)
+# Mitglieder:
+# Eren Temizkan, 223201982
+# Dominik Ide, 220200046
+# Dogukan Karakoyun, 223202023
+# Alexandra Holsten, 221200813
+# Yuxiao Wu, 223200006
+
+import functools
+import typing
+
+
+class Bitboard:
+    """
+    Geometrie-Hilfsklasse für Bitmasken über einem Spielfeld der Größe width x height.
+
+    Jede Zelle entspricht genau einem Bit in einem Python-int (beliebige Genauigkeit),
+    Bit-Index = y * width + x. Belegungen (Schlangen, Futter, Wände, ...) sind damit
+    einfache Integer, und Nachbarschaft, Flood-Fill und Kollisionstests laufen über
+    Shift-, And- und Or-Operationen statt über Mengen von Tupeln.
+
+    :ivar width: Spielfeldbreite
+    :ivar height: Spielfeldhöhe
+    :ivar full: Maske mit allen Zellen des Spielfelds
+    :ivar border: Maske des äußeren Rings (wird im Flood-Fill als Wand behandelt)
+    """
+    __slots__ = ('width', 'height', 'full', 'not_left', 'not_right', 'border')
+
+    def __init__(self, width: int, height: int):
+        """
+        Berechnet die Spalten- und Randmasken für die gegebene Feldgröße.
+
+        :param width: Spielfeldbreite
+        :param height: Spielfeldhöhe
+        """
+        self.width = width
+        self.height = height
+        self.full = (1 << (width * height)) - 1
+
+        left_column = 0
+        for y in range(height):
+            left_column |= 1 << (y * width)
+        right_column = left_column << (width - 1)
+        bottom_row = (1 << width) - 1
+        top_row = bottom_row << (width * (height - 1))
+
+        self.not_left = self.full & ~left_column  # Zellen mit x > 0
+        self.not_right = self.full & ~right_column  # Zellen mit x < width - 1
+        self.border = left_column | right_column | bottom_row | top_row
+
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def for_size(width: int, height: int) -> 'Bitboard':
+        """
+        Liefert eine (gecachte) Bitboard-Geometrie für die Feldgröße.
+
+        :param width: Spielfeldbreite
+        :param height: Spielfeldhöhe
+        :return: Bitboard-Instanz
+        """
+        return Bitboard(width, height)
+
+    def bit(self, x: int, y: int) -> int:
+        """
+        Maske mit genau einer gesetzten Zelle.
+
+        :param x: X-Koordinate
+        :param y: Y-Koordinate
+        :return: 1 << (y * width + x)
+        """
+        return 1 << (y * self.width + x)
+
+    def contains(self, mask: int, x: int, y: int) -> bool:
+        """
+        Prüft, ob die Zelle (x, y) auf dem Feld liegt und in der Maske gesetzt ist.
+
+        :param mask: Bitmaske
+        :param x: X-Koordinate
+        :param y: Y-Koordinate
+        :return: True oder False
+        """
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return False
+        return (mask >> (y * self.width + x)) & 1 == 1
+
+    def mask_of(self, points: typing.Iterable[typing.Tuple[int, int]]) -> int:
+        """
+        Baut eine Maske aus (x, y)-Koordinaten. Punkte außerhalb des Felds werden ignoriert.
+
+        :param points: Iterable von (x, y)-Tupeln
+        :return: Bitmaske
+        """
+        width, height = self.width, self.height
+        mask = 0
+        for x, y in points:
+            if 0 <= x < width and 0 <= y < height:
+                mask |= 1 << (y * width + x)
+        return mask
+
+    def mask_of_json(self, points: typing.Iterable[typing.Dict]) -> int:
+        """
+        Baut eine Maske direkt aus JSON-Koordinaten wie {'x': 3, 'y': 5}.
+
+        :param points: Iterable von Dictionaries mit 'x' und 'y'
+        :return: Bitmaske
+        """
+        return self.mask_of((p["x"], p["y"]) for p in points)
+
+    def neighbours(self, mask: int) -> int:
+        """
+        Alle Zellen, die orthogonal an eine Zelle der Maske angrenzen (ohne die Maske selbst
+        zu entfernen). Die Spaltenmasken verhindern ein Umbrechen über den Rand.
+
+        :param mask: Bitmaske
+        :return: Maske der Nachbarzellen
+        """
+        width = self.width
+        return (((mask & self.not_right) << 1)
+                | ((mask & self.not_left) >> 1)
+                | (mask << width)
+                | (mask >> width)) & self.full
+
+    def flood(self, free: int, start: int) -> int:
+        """
+        Flood-Fill per Bit-Operationen: wächst von start aus über alle freien Zellen.
+
+        :param free: Maske der begehbaren Zellen
+        :param start: Startmaske (meist eine einzelne Zelle)
+        :return: Maske der erreichbaren Region (leer, wenn start nicht frei ist)
+        """
+        region = start & free
+        while True:
+            grown = (region | self.neighbours(region)) & free
+            if grown == region:
+                return region
+            region = grown
+
+    def cells(self, mask: int) -> typing.Iterator[typing.Tuple[int, int]]:
+        """
+        Iteriert über alle gesetzten Zellen der Maske.
+
+        :param mask: Bitmaske
+        :return: Generator von (x, y)-Tupeln
+        """
+        width = self.width
+        while mask:
+            low = mask & -mask
+            index = low.bit_length() - 1
+            yield index % width, index // width
+            mask ^= low
+
+    @staticmethod
+    def count(mask: int) -> int:
+        """
+        Anzahl gesetzter Zellen.
+
+        :param mask: Bitmaske
+        :return: Anzahl (int)
+        """
+        return mask.bit_count()
@@ -0,0 +1,595 @@
+# Gruppe 3 – Battlesnake Projekt (SS2025)
+# Mitglieder:
+# Eren Temizkan, 223201982
+# Dominik Ide, 220200046
+# Dogukan Karakoyun, 223202023
+# Alexandra Holsten, 221200813
+# Yuxiao Wu, 223200006
+
+import functools
+import typing
+
+from Battlesnake.bitboard import Bitboard
+from Battlesnake.board_state import BoardState
+
+
+@functools.lru_cache(maxsize=16)
+def neighbour_table(width: int, height: int) -> tuple[tuple[int, ...], ...]:
+    """
+    Vorberechnete Nachbarn jeder Zelle als flache Indizes (y * width + x).
+
+    :param width: Spielfeldbreite
+    :param height: Spielfeldhöhe
+    :return: Tupel mit einem Tupel von Nachbar-Indizes pro Zelle
+    """
+    table = []
+    for y in range(height):
+        for x in range(width):
+            cell = []
+            if x > 0:
+                cell.append(y * width + x - 1)  # links
+            if x < width - 1:
+                cell.append(y * width + x + 1)  # rechts
+            if y > 0:
+                cell.append((y - 1) * width + x)  # unten
+            if y < height - 1:
+                cell.append((y + 1) * width + x)  # oben
+            table.append(tuple(cell))
+    return tuple(table)
+
+
+def free_turn_grid(width: int, height: int, bodies: typing.Iterable[typing.Sequence[int]],
+                   food: typing.Container[int]) -> list[int]:
+    """
+    Zug, ab dem jede Zelle frei ist, in einem Durchlauf über alle Schlangenteile.
+
+    Segment i (0 = Kopf) einer Schlange der Länge L ist nach L - i Zügen frei, weil der Schwanz
+    so lange nachrückt. Liegt Futter neben dem Kopf, kann die Schlange wachsen und der Schwanz
+    bleibt einen Zug länger liegen (+1). Bei übereinanderliegenden Teilen zählt das spätere.
+
+    :param width: Spielfeldbreite
+    :param height: Spielfeldhöhe
+    :param bodies: Körper jeder Schlange als flache Indizes (y * width + x), Kopf zuerst
+    :param food: Futterfelder als flache Indizes
+    :return: Liste mit dem Zug pro Zelle (0 = schon jetzt frei)
+    """
+    neighbours = neighbour_table(width, height)
+    free_turn = [0] * (width * height)
+    for body in bodies:
+        length = len(body)
+        grows = 1 if any(n in food for n in neighbours[body[0]]) else 0
+        for i, cell in enumerate(body):
+            turn = length - i + grows
+            if turn > free_turn[cell]:
+                free_turn[cell] = turn
+    return free_turn
+
+
+def timed_space(width: int, height: int, free_turn: list[int], wall_mask: int,
+                start: int, arrival: int = 1) -> int:
+    """
+    Zeitabhängiger Flood-Fill: eine Zelle zählt, wenn wir sie frühestens dann erreichen,
+    wenn sie laut free_turn schon frei ist.
+
+    Da eine freie Zelle frei bleibt, ist die früheste Ankunft (Breitensuche) immer die beste.
+    Der Rand gilt wie im normalen Flood-Fill als Wand.
+
+    :param width: Spielfeldbreite
+    :param height: Spielfeldhöhe
+    :param free_turn: Ergebnis von free_turn_grid
+    :param wall_mask: Bitmaske der Wandzellen
+    :param start: flacher Index der Startzelle
+    :param arrival: Zug, in dem wir die Startzelle betreten (1 = Nachbar des Kopfes)
+    :return: Anzahl erreichbarer Zellen
+    """
+    if (wall_mask >> start) & 1 or free_turn[start] > arrival:
+        return 0
+    neighbours = neighbour_table(width, height)
+    seen = bytearray(width * height)
+    seen[start] = 1
+    frontier = [start]
+    count = 1
+    while frontier:
+        arrival += 1
+        next_frontier = []
+        for cell in frontier:
+            for n in neighbours[cell]:
+                if seen[n] or free_turn[n] > arrival or (wall_mask >> n) & 1:
+                    continue
+                seen[n] = 1
+                next_frontier.append(n)
+        count += len(next_frontier)
+        frontier = next_frontier
+    return count
+
+
+class BoardIndex:
+    """
+    Vorberechneter Index über das Spielfeld eines einzelnen /move-Requests.
+
+    Wird genau einmal pro Zug aus dem game_state gebaut und an Heatmap, Path-Fallback
+    und ml_features weitergereicht, damit die blockierten Felder nicht bei jedem
+    Flood-Fill neu eingesammelt werden müssen.
+
+    :ivar state: Kompakter BoardState, aus dem der Index gebaut wurde
+    :ivar occupancy: Anzahl Schlangenteile pro Zelle (Index y * width + x)
+    :ivar body_mask: Bitmaske aller Schlangenteile
+    :ivar wall_mask: Bitmaske des Rands (im Flood-Fill als Wand behandelt)
+    :ivar blocked_mask: body_mask | wall_mask
+    :ivar heads: Kopfposition (x, y) -> Schlangen-JSON
+    :ivar tails: Schwanzposition (x, y) -> Schlangen-JSON
+    :ivar regions: Bitmaske jeder freien Region (Index = Regions-ID), erst nach label_regions() gesetzt
+    :ivar region_sizes: Größe jeder Region, Index = Regions-ID
+    :ivar region_labels: Regions-ID pro Zelle (-1 = blockiert), Index y * width + x
+    :ivar snake_ids: Reihenfolge der Schlangen für distances/owner/territory
+    :ivar distances: echte Wegdistanz vom Kopf jeder Schlange pro Zelle (-1 = unerreichbar),
+        erst nach distance_fields() gesetzt
+    :ivar owner: Voronoi-Besitzer pro Zelle (Position in snake_ids, -1 = neutral/unerreichbar)
+    :ivar territory: Anzahl Zellen im Besitz jeder Schlange
+    :ivar free_turn: Zug, ab dem jede Zelle frei ist (0 = frei), erst nach free_turns() gesetzt
+    :ivar adjacent: Zellindex -> Köpfe direkt daneben als (Schlangen-ID, Länge), erst nach
+        head_neighbourhood() gesetzt
+    :ivar cut_cells: Engpässe (Artikulationspunkte der freien Zellen) -> Größen der Teile, in die
+        die Region ohne diese Zelle zerfällt, erst nach chokepoints() gesetzt
+    """
+    __slots__ = ('game_state', 'state', 'width', 'height', 'board', 'occupancy', 'body_mask', 'wall_mask',
+                 'blocked_mask', 'free_mask', 'heads', 'tails', 'snakes_by_id', 'you_id',
+                 'regions', 'region_sizes', 'region_labels', 'snake_ids', 'distances', 'owner', 'territory',
+                 'free_turn', 'cut_cells', 'adjacent')
+
+    builds = 0  # Zähler für Benchmarks: wie oft wurde die Belegung aufgebaut
+
+    def __init__(self, game_state: typing.Dict, state: BoardState | None = None):
+        """
+        Baut Belegungsgitter, Wandmaske und Kopf-/Schwanz-Lookup aus dem Spielzustand.
+
+        Alle Koordinaten kommen aus dem kompakten BoardState (flache Zellindizes); wird keiner
+        übergeben, wird er hier aus dem game_state erzeugt.
+
+        :param game_state: Der aktuelle Spielzustand (Board, Snakes, etc.)
+        :param state: Bereits dekodierter BoardState desselben Zustands (z. B. vom Server)
+        """
+        BoardIndex.builds += 1
+
+        if state is None:
+            state = BoardState(game_state)
+        self.game_state = game_state
+        self.state = state
+        self.width: int = state.width
+        self.height: int = state.height
+        self.board: Bitboard = Bitboard.for_size(self.width, self.height)
+        self.you_id: str = state.snake_ids[state.you]
+
+        width = self.width
+        occupancy = bytearray(width * self.height)
+        body_mask = 0
+        heads: dict[tuple[int, int], typing.Dict] = {}
+        tails: dict[tuple[int, int], typing.Dict] = {}
+        snakes_by_id: dict[str, typing.Dict] = {}
+
+        for snake, body in zip(game_state["board"]["snakes"], state.bodies):
+            snakes_by_id[snake["id"]] = snake
+            for index in body:
+                occupancy[index] += 1
+                body_mask |= 1 << index
+            heads[(body[0] % width, body[0] // width)] = snake
+            tails[(body[-1] % width, body[-1] // width)] = snake
+
+        self.occupancy = occupancy
+        self.body_mask = body_mask
+        self.wall_mask = self.board.border
+        self.blocked_mask = body_mask | self.wall_mask
+        self.free_mask = self.board.full & ~self.blocked_mask
+        self.heads = heads
+        self.tails = tails
+        self.snakes_by_id = snakes_by_id
+        self.regions: list[int] | None = None
+        self.region_sizes: list[int] = []
+        self.region_labels: list[int] = []
+        self.snake_ids: list[str] = state.snake_ids
+        self.distances: list[list[int]] | None = None
+        self.owner: list[int] = []
+        self.territory: list[int] = []
+        self.free_turn: list[int] | None = None
+        self.cut_cells: dict[int, tuple[int, ...]] | None = None
+        self.adjacent: dict[int, list[tuple[str, int]]] | None = None
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        """Prüft, ob (x, y) auf dem Spielfeld liegt."""
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def is_occupied(self, x: int, y: int) -> bool:
+        """
+        Prüft, ob auf (x, y) ein Schlangenteil liegt.
+
+        :param x: X-Koordinate
+        :param y: Y-Koordinate
+        :return: True oder False
+        """
+        return self.in_bounds(x, y) and self.occupancy[y * self.width + x] > 0
+
+    def is_blocked(self, x: int, y: int) -> bool:
+        """
+        Prüft, ob (x, y) im Flood-Fill als blockiert gilt (Schlange oder Rand).
+
+        :param x: X-Koordinate
+        :param y: Y-Koordinate
+        :return: True oder False
+        """
+        return self.board.contains(self.blocked_mask, x, y)
+
+    def head_neighbourhood(self) -> dict[int, list[tuple[str, int]]]:
+        """
+        Für jede Zelle die Köpfe direkt daneben, in einem Durchlauf über alle Schlangen.
+
+        Damit sind umkämpftes Futter, Kopf-an-Kopf-Gefahr und Angriffsmöglichkeiten
+        pro Zelle ein einzelner Lookup.
+
+        :return: Zellindex (y * width + x) -> Liste von (Schlangen-ID, Länge)
+        """
+        if self.adjacent is None:
+            neighbours = neighbour_table(self.width, self.height)
+            adjacent: dict[int, list[tuple[str, int]]] = {}
+            for snake_id, body in zip(self.state.snake_ids, self.state.bodies):
+                entry = (snake_id, len(body))
+                for n in neighbours[body[0]]:
+                    adjacent.setdefault(n, []).append(entry)
+            self.adjacent = adjacent
+        return self.adjacent
+
+    def adjacent_heads(self, x: int, y: int) -> list[tuple[str, int]]:
+        """
+        Köpfe, die direkt neben (x, y) liegen (auch der eigene).
+
+        :param x: X-Koordinate
+        :param y: Y-Koordinate
+        :return: Liste von (Schlangen-ID, Länge)
+        """
+        if not self.in_bounds(x, y):
+            return []
+        return self.head_neighbourhood().get(y * self.width + x, [])
+
+    def is_contested(self, x: int, y: int) -> bool:
+        """
+        Prüft, ob irgendein Schlangenkopf direkt neben (x, y) liegt (umkämpftes Futter).
+
+        :param x: X-Koordinate
+        :param y: Y-Koordinate
+        :return: True oder False
+        """
+        return bool(self.adjacent_heads(x, y))
+
+    def head_to_head_danger(self, snake_id: str, x: int, y: int) -> bool:
+        """
+        Prüft, ob ein gegnerischer Kopf, der mindestens so lang ist, (x, y) ebenfalls im
+        nächsten Zug erreichen kann.
+
+        :param snake_id: ID der eigenen Schlange
+        :param x: X-Koordinate
+        :param y: Y-Koordinate
+        :return: True oder False
+        """
+        length = len(self.snakes_by_id[snake_id]["body"])
+        return any(other != snake_id and other_length >= length
+                   for other, other_length in self.adjacent_heads(x, y))
+
+    def kill_target(self, snake_id: str, x: int, y: int) -> bool:
+        """
+        Prüft, ob auf (x, y) der Kopf einer kürzeren gegnerischen Schlange liegt.
+
+        :param snake_id: ID der eigenen Schlange
+        :param x: X-Koordinate
+        :param y: Y-Koordinate
+        :return: True oder False
+        """
+        other = self.heads.get((x, y))
+        if other is None or other["id"] == snake_id:
+            return False
+        return len(other["body"]) < len(self.snakes_by_id[snake_id]["body"])
+
+    def label_regions(self) -> list[int]:
+        """
+        Zerlegt alle freien Zellen in einem Durchlauf in zusammenhängende Regionen.
+
+        Jede Region wird genau einmal per Bitboard-Flood-Fill bestimmt (Start ist jeweils
+        die niedrigste noch nicht zugeordnete freie Zelle). Dabei bekommt jede Zelle ihre
+        Regions-ID, danach ist die Platz-Abfrage für jede Zelle ein einzelner Lookup.
+
+        :return: Liste der Regionsmasken
+        """
+        if self.regions is not None:
+            return self.regions
+
+        board = self.board
+        regions: list[int] = []
+        sizes: list[int] = []
+        labels = [-1] * (self.width * self.height)
+        remaining = self.free_mask
+        while remaining:
+            region = board.flood(remaining, remaining & -remaining)
+            remaining &= ~region
+            label = len(regions)
+            cells = region
+            while cells:
+                low = cells & -cells
+                labels[low.bit_length() - 1] = label
+                cells ^= low
+            regions.append(region)
+            sizes.append(board.count(region))
+
+        self.regions = regions
+        self.region_sizes = sizes
+        self.region_labels = labels
+        return regions
+
+    def region_id(self, x: int, y: int) -> int:
+        """
+        Regions-ID der Zelle (x, y).
+
+        :param x: X-Koordinate
+        :param y: Y-Koordinate
+        :return: ID der Region oder -1, wenn die Zelle blockiert bzw. außerhalb ist
+        """
+        if not self.in_bounds(x, y):
+            return -1
+        self.label_regions()
+        return self.region_labels[y * self.width + x]
+
+    def region_size(self, x: int, y: int) -> int:
+        """
+        Größe der Region, in der (x, y) liegt.
+
+        :param x: X-Koordinate
+        :param y: Y-Koordinate
+        :return: Anzahl Zellen der Region (0, wenn blockiert)
+        """
+        label = self.region_id(x, y)
+        return self.region_sizes[label] if label >= 0 else 0
+
+    def flood_fill_space(self, start) -> int:
+        """
+        Zählt die freien Felder, die von start aus erreichbar sind.
+
+        Nutzt die Regionen aus label_regions(), sodass jede weitere Abfrage O(1) ist.
+
+        :param start: Cell-Objekt, von dem aus gesucht wird
+        :return: Anzahl erreichbarer freier Felder (int)
+        """
+        return self.region_size(start.x, start.y)
+
+    def distance_fields(self) -> list[list[int]]:
+        """
+        Multi-Source-BFS von allen Schlangenköpfen gleichzeitig.
+
+        Alle Köpfe werden Schicht für Schicht parallel expandiert, Schlangenkörper blockieren.
+        Dabei entstehen die Distanzfelder jeder Schlange und die Voronoi-Aufteilung: eine Zelle
+        gehört der Schlange, die sie als erste erreicht; bei Gleichstand der längsten, sonst
+        niemandem.
+
+        :return: Distanzfeld pro Schlange (flach, -1 = unerreichbar)
+        """
+        if self.distances is not None:
+            return self.distances
+
+        size = self.width * self.height
+        neighbours = neighbour_table(self.width, self.height)
+        occupancy = self.occupancy
+        bodies = self.state.bodies
+        lengths = [len(body) for body in bodies]
+
+        distances = [[-1] * size for _ in bodies]
+        owner = [-1] * size
+        claimed = bytearray(size)  # Zelle wurde in einer früheren Schicht erreicht
+        frontiers: list[list[int]] = []
+        for slot, body in enumerate(bodies):
+            start = body[0]
+            distances[slot][start] = 0
+            owner[start] = slot
+            claimed[start] = 1
+            frontiers.append([start])
+
+        depth = 0
+        while any(frontiers):
+            depth += 1
+            arrivals: dict[int, list[int]] = {}  # Zelle -> Schlangen, die sie in dieser Schicht erreichen
+            for slot, frontier in enumerate(frontiers):
+                dist = distances[slot]
+                next_frontier = []
+                for cell in frontier:
+                    for n in neighbours[cell]:
+                        if dist[n] < 0 and not occupancy[n]:
+                            dist[n] = depth
+                            next_frontier.append(n)
+                            if not claimed[n]:
+                                arrivals.setdefault(n, []).append(slot)
+                frontiers[slot] = next_frontier
+
+            for cell, slots in arrivals.items():
+                claimed[cell] = 1
+                if len(slots) == 1:
+                    owner[cell] = slots[0]
+                else:
+                    longest = max(lengths[slot] for slot in slots)
+                    winners = [slot for slot in slots if lengths[slot] == longest]
+                    owner[cell] = winners[0] if len(winners) == 1 else -1
+
+        territory = [0] * len(bodies)
+        for slot in owner:
+            if slot >= 0:
+                territory[slot] += 1
+
+        self.distances = distances
+        self.owner = owner
+        self.territory = territory
+        return distances
+
+    def path_distance(self, snake_id: str, x: int, y: int) -> int:
+        """
+        Echte Wegdistanz vom Kopf einer Schlange zur Zelle (x, y).
+
+        Ist die Zelle selbst belegt (z. B. ein gegnerischer Kopf), zählt der Weg bis zu
+        einem freien Nachbarn plus ein Schritt.
+
+        :param snake_id: ID der Schlange
+        :param x: X-Koordinate
+        :param y: Y-Koordinate
+        :return: Anzahl Schritte oder -1, wenn unerreichbar
+        """
+        if not self.in_bounds(x, y):
+            return -1
+        dist = self.distance_fields()[self.snake_ids.index(snake_id)]
+        cell = y * self.width + x
+        if dist[cell] >= 0:
+            return dist[cell]
+        reachable = [dist[n] for n in neighbour_table(self.width, self.height)[cell] if dist[n] >= 0]
+        return min(reachable) + 1 if reachable else -1
+
+    def territory_of(self, snake_id: str) -> int:
+        """
+        Anzahl Zellen, die die Schlange vor allen anderen erreicht (Voronoi-Territorium).
+
+        :param snake_id: ID der Schlange
+        :return: Anzahl Zellen
+        """
+        self.distance_fields()
+        return self.territory[self.snake_ids.index(snake_id)]
+
+    def owns(self, snake_id: str, x: int, y: int) -> bool:
+        """
+        Prüft, ob die Schlange die Zelle (x, y) vor allen anderen erreicht.
+
+        :param snake_id: ID der Schlange
+        :param x: X-Koordinate
+        :param y: Y-Koordinate
+        :return: True oder False
+        """
+        if not self.in_bounds(x, y):
+            return False
+        self.distance_fields()
+        return self.owner[y * self.width + x] == self.snake_ids.index(snake_id)
+
+    def free_turns(self) -> list[int]:
+        """
+        Zug, ab dem jede Zelle frei ist (siehe free_turn_grid), einmal pro Zug berechnet.
+
+        :return: Liste pro Zelle (Index y * width + x)
+        """
+        if self.free_turn is None:
+            self.free_turn = free_turn_grid(self.width, self.height, self.state.bodies,
+                                            set(self.state.food))
+        return self.free_turn
+
+    def timed_flood_fill_space(self, start, arrival: int = 1) -> int:
+        """
+        Platz ab start, wenn Schwänze während des Wegs nachrücken (siehe timed_space).
+
+        :param start: Cell-Objekt, das wir im Zug `arrival` betreten
+        :param arrival: Ankunftszug an start (1 = Nachbar des Kopfes)
+        :return: Anzahl erreichbarer Felder
+        """
+        if not self.in_bounds(start.x, start.y):
+            return 0
+        return timed_space(self.width, self.height, self.free_turns(), self.wall_mask,
+                           start.y * self.width + start.x, arrival)
+
+    def free_masks(self, turns: int) -> list[int]:
+        """
+        Freie Zellen nach 1, 2, ..., turns Zügen: heute freie Zellen plus alle bis dahin frei
+        gewordenen Schlangenteile (der Rand bleibt Wand). Ein Durchlauf über free_turn.
+
+        :param turns: Suchtiefe
+        :return: Liste von Bitmasken, Index 0 = nach einem Zug
+        """
+        released = [0] * (turns + 1)  # Zellen, die genau in Zug t frei werden
+        for cell, free_at in enumerate(self.free_turns()):
+            if 0 < free_at <= turns:
+                released[free_at] |= 1 << cell
+
+        masks = []
+        free = self.free_mask
+        for turn in range(1, turns + 1):
+            free |= released[turn] & ~self.wall_mask
+            masks.append(free)
+        return masks
+
+    def chokepoints(self) -> dict[int, tuple[int, ...]]:
+        """
+        Engpässe des Spielfelds: freie Zellen, deren Wegfall ihre Region zerteilt.
+
+        Ein einziger iterativer Tarjan-Durchlauf (Tiefensuche mit Entdeckungszeit und low-Wert)
+        über den Graphen der freien Zellen findet alle Artikulationspunkte. Die Teilbaumgrößen
+        der Tiefensuche liefern dabei direkt die Größen der abgetrennten Teile, sodass dafür
+        keine zusätzlichen Flood-Fills nötig sind.
+
+        :return: Zellindex (y * width + x) -> Größen der abgetrennten Teile
+        """
+        if self.cut_cells is not None:
+            return self.cut_cells
+
+        width, height = self.width, self.height
+        size = width * height
+        neighbours = neighbour_table(width, height)
+        free = self.free_mask
+        is_free = bytearray(size)
+        for cell in range(size):
+            if (free >> cell) & 1:
+                is_free[cell] = 1
+
+        discovered = [0] * size  # Entdeckungszeit, 0 = noch nicht besucht
+        low = [0] * size
+        subtree = [0] * size
+        cut_cells: dict[int, tuple[int, ...]] = {}
+        clock = 0
+
+        for root in range(size):
+            if not is_free[root] or discovered[root]:
+                continue
+            clock += 1
+            discovered[root] = low[root] = clock
+            subtree[root] = 1
+            separated: dict[int, list[int]] = {}  # Zelle -> Größen der abgetrennten Kind-Teilbäume
+            stack = [(root, -1, iter(neighbours[root]))]
+            while stack:
+                cell, parent, pending = stack[-1]
+                for n in pending:
+                    if not is_free[n]:
+                        continue
+                    if not discovered[n]:
+                        clock += 1
+                        discovered[n] = low[n] = clock
+                        subtree[n] = 1
+                        stack.append((n, cell, iter(neighbours[n])))
+                        break
+                    if n != parent and discovered[n] < low[cell]:
+                        low[cell] = discovered[n]
+                else:
+                    stack.pop()
+                    if parent >= 0:
+                        if low[cell] < low[parent]:
+                            low[parent] = low[cell]
+                        subtree[parent] += subtree[cell]
+                        if low[cell] >= discovered[parent]:
+                            separated.setdefault(parent, []).append(subtree[cell])
+
+            region = subtree[root]
+            for cell, pieces in separated.items():
+                if cell == root:
+                    if len(pieces) >= 2:  # Wurzel ist nur Engpass mit mindestens zwei Teilbäumen
+                        cut_cells[cell] = tuple(pieces)
+                else:
+                    cut_cells[cell] = tuple(pieces) + (region - 1 - sum(pieces),)
+
+        self.cut_cells = cut_cells
+        return cut_cells
+
+    def chokepoint(self, x: int, y: int) -> tuple[int, ...]:
+        """
+        Größen der Teile, in die die Region ohne die Zelle (x, y) zerfällt.
+
+        :param x: X-Koordinate
+        :param y: Y-Koordinate
+        :return: Tupel der Teilgrößen, leer wenn (x, y) kein Engpass ist
+        """
+        if not self.in_bounds(x, y):
+            return ()
+        return self.chokepoints().get(y * self.width + x, ())
@@ -0,0 +1,147 @@
+# Gruppe 3 – Battlesnake Projekt (SS2025)
+# Mitglieder:
+# Eren Temizkan, 223201982
+# Dominik Ide, 220200046
+# Dogukan Karakoyun, 223202023
+# Alexandra Holsten, 221200813
+# Yuxiao Wu, 223200006
+
+import json
+import typing
+from array import array
+
+try:
+    import orjson  # optional: deutlich schnellerer JSON-Parser
+except ImportError:
+    orjson = None
+
+
+def loads(payload: bytes) -> typing.Dict:
+    """
+    Parst den Request-Body, mit orjson wenn installiert, sonst mit dem json-Modul.
+
+    :param payload: Roher Request-Body
+    :return: game_state als Dictionary
+    """
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+class BoardState:
+    """
+    Kompakte Form eines Spielzustands: alle Koordinaten als flache Zellindizes (y * width + x)
+    in array('H')-Puffern statt als verschachtelte Dictionaries.
+
+    Wird pro Request einmal aus dem Body dekodiert; der BoardIndex baut daraus Belegung,
+    Masken und free_turn, ohne die JSON-Struktur erneut abzulaufen.
+
+    :ivar game_state: Das geparste JSON (für Stufen, die noch mit Dictionaries arbeiten)
+    :ivar snake_ids: IDs der Schlangen in der Reihenfolge von board.snakes
+    :ivar bodies: Körper jeder Schlange als array('H') von Zellindizes, Kopf zuerst
+    :ivar health: Lebenspunkte jeder Schlange
+    :ivar food: Futterfelder als Zellindizes
+    :ivar hazards: Hazard-Felder als Zellindizes
+    :ivar you: Position der eigenen Schlange in snake_ids
+    """
+    __slots__ = ('game_state', 'game_id', 'turn', 'timeout', 'width', 'height',
+                 'snake_ids', 'bodies', 'health', 'food', 'hazards', 'you')
+
+    def __init__(self, game_state: typing.Dict):
+        """
+        Überführt ein geparstes game_state in die kompakte Form.
+
+        :param game_state: JSON-Zustand des Spiels
+        """
+        board = game_state["board"]
+        width = board["width"]
+        self.game_state = game_state
+        self.game_id: str = game_state["game"]["id"]
+        self.turn: int = game_state["turn"]
+        self.timeout: int = game_state["game"].get("timeout", 500)
+        self.width: int = width
+        self.height: int = board["height"]
+
+        snakes = board["snakes"]
+        self.snake_ids: list[str] = [snake["id"] for snake in snakes]
+        self.bodies: list[array] = [
+            array('H', [seg["y"] * width + seg["x"] for seg in snake["body"]]) for snake in snakes
+        ]
+        self.health = array('H', [snake["health"] for snake in snakes])
+        self.food = array('H', [f["y"] * width + f["x"] for f in board["food"]])
+        self.hazards = array('H', [h["y"] * width + h["x"] for h in board.get("hazards", [])])
+        self.you: int = self.snake_ids.index(game_state["you"]["id"])
+
+    @staticmethod
+    def decode(payload: bytes) -> 'BoardState':
+        """
+        Dekodiert den rohen /move-Body direkt in einen BoardState.
+
+        :param payload: Roher Request-Body
+        :return: BoardState
+        """
+        return BoardState(loads(payload))
+
+    def length(self, slot: int) -> int:
+        """Länge der Schlange an Position slot."""
+        return len(self.bodies[slot])
+
+    def head(self, slot: int) -> int:
+        """Zellindex des Kopfes der Schlange an Position slot."""
+        return self.bodies[slot][0]
+
+    def pack(self) -> bytes:
+        """
+        Binäre Form für Prozessgrenzen (z. B. Shared Memory der MCTS-Worker): ein array('I')
+        mit Puffergrößen, Zug und Timeout (können 65535 überschreiten), ein array('H') mit
+        Feldgröße, Längen, Lebenspunkten und allen Zellindizes, danach die IDs als UTF-8.
+        Das game_state-Dictionary wird nicht mitgenommen.
+
+        :return: Bytes für unpack
+        """
+        header = array('H', [self.width, self.height, self.you,
+                             len(self.bodies), len(self.food), len(self.hazards)])
+        header.extend(len(body) for body in self.bodies)
+        header.extend(self.health)
+        for body in self.bodies:
+            header.extend(body)
+        header.extend(self.food)
+        header.extend(self.hazards)
+        names = "\0".join([self.game_id] + self.snake_ids).encode()
+        prefix = array('I', [len(header), len(names), self.turn, self.timeout])
+        return prefix.tobytes() + header.tobytes() + names
+
+    @staticmethod
+    def unpack(buffer) -> 'BoardState':
+        """
+        Gegenstück zu pack; game_state ist danach None.
+
+        :param buffer: Bytes oder memoryview aus pack
+        :return: BoardState
+        """
+        prefix = array('I')
+        prefix.frombytes(bytes(buffer[:prefix.itemsize * 4]))
+        header_size, names_size, turn, timeout = prefix
+        start = prefix.itemsize * 4
+        values = array('H')
+        values.frombytes(bytes(buffer[start:start + header_size * values.itemsize]))
+        names = bytes(buffer[start + header_size * values.itemsize:][:names_size]).decode().split("\0")
+
+        state = BoardState.__new__(BoardState)
+        state.game_state = None
+        state.turn, state.timeout = turn, timeout
+        state.width, state.height, state.you, snakes, food, hazards = values[:6]
+        position = 6
+        lengths = values[position:position + snakes]
+        position += snakes
+        state.health = values[position:position + snakes]
+        position += snakes
+        state.bodies = []
+        for length in lengths:
+            state.bodies.append(values[position:position + length])
+            position += length
+        state.food = values[position:position + food]
+        state.hazards = values[position + food:position + food + hazards]
+        state.game_id = names[0]
+        state.snake_ids = names[1:]
+        return state
@@ -0,0 +1,83 @@
+# Gruppe 3 – Battlesnake Projekt (SS2025)
+# Mitglieder:
+# Eren Temizkan, 223201982
+# Dominik Ide, 220200046
+# Dogukan Karakoyun, 223202023
+# Alexandra Holsten, 221200813
+# Yuxiao Wu, 223200006
+
+import functools
+
+import numpy as np
+
+
+class BoardTemplate:
+    """
+    Alles, was nur von der Feldgröße abhängt: statische Heatmap-Layer und Distanzgitter.
+
+    Wird pro (width, height) einmal berechnet (beim /start über die Session) und danach
+    für jede neue Heatmap nur noch kopiert. Alle Arrays haben die Form (width, height)
+    und sind schreibgeschützt.
+
+    :ivar wall_layer: Randfelder -20, Reihe dahinter -5 (Ecken doppelt)
+    :ivar center_distance: Manhattan-Distanz zum Zentrum (width // 2, height // 2)
+    :ivar center_bonus: max(0, 10 - center_distance)
+    :ivar static_layer: wall_layer + center_bonus, Startwert jeder Heatmap
+    :ivar wall_distance: Abstand zur nächsten Wand
+    """
+    __slots__ = ('width', 'height', 'wall_layer', 'center_distance', 'center_bonus',
+                 'static_layer', 'wall_distance')
+
+    def __init__(self, width: int, height: int):
+        """
+        :param width: Spielfeldbreite
+        :param height: Spielfeldhöhe
+        """
+        self.width = width
+        self.height = height
+
+        wall_layer = np.zeros((width, height), dtype=np.int64)
+        wall_layer[:, 0] -= 20
+        wall_layer[:, height - 1] -= 20
+        wall_layer[0, :] -= 20
+        wall_layer[width - 1, :] -= 20
+        wall_layer[:, 1] -= 5
+        wall_layer[:, height - 2] -= 5
+        wall_layer[1, :] -= 5
+        wall_layer[width - 2, :] -= 5
+
+        xs = np.arange(width)[:, None]
+        ys = np.arange(height)[None, :]
+        center_distance = np.abs(xs - width // 2) + np.abs(ys - height // 2)
+        center_bonus = np.maximum(0, 10 - center_distance)
+        wall_distance = np.minimum(np.minimum(xs, width - 1 - xs), np.minimum(ys, height - 1 - ys))
+
+        self.wall_layer = wall_layer
+        self.center_distance = center_distance
+        self.center_bonus = center_bonus
+        self.static_layer = wall_layer + center_bonus
+        self.wall_distance = wall_distance
+        for array in (self.wall_layer, self.center_distance, self.center_bonus,
+                      self.static_layer, self.wall_distance):
+            array.setflags(write=False)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def for_size(width: int, height: int) -> 'BoardTemplate':
+        """
+        Liefert das (gecachte) Template für die Feldgröße. Der Cache ist auf wenige
+        Feldgrößen begrenzt.
+
+        :param width: Spielfeldbreite
+        :param height: Spielfeldhöhe
+        :return: BoardTemplate-Instanz
+        """
+        return BoardTemplate(width, height)
+
+    def new_heatmap(self) -> np.ndarray:
+        """
+        Neue Heatmap mit den statischen Layern (Wand + Zentrum) als Startwert.
+
+        :return: beschreibbare Kopie von static_layer
+        """
+        return self.static_layer.copy()
@@ -6,32 +6,47 @@
 # Alexandra Holsten, 221200813
 # Yuxiao Wu, 223200006
 
+import functools
 import typing
+from collections import deque
+
+from Battlesnake.bitboard import Bitboard
+from Battlesnake.board_index import neighbour_table
+from Battlesnake.zobrist import food_hash, health_bucket, snake_keys
 
 
 class Cell:
     """
     Repräsentiert eine Zelle auf dem Battlesnake-Spielfeld.
 
-    Kann z. B. aus JSON-Daten erstellt werden und wird für Koordinaten, Distanzen usw. verwendet.
+    Kann z. B. aus JSON-Daten erstellt werden und wird für Koordinaten, Distanzen usw. verwendet.
+    Zellen werden über Cell.at(x, y) interniert: jede Koordinate existiert nur einmal und wird
+    deshalb nie verändert. Interniert wird nur der Bereich 0 <= x, y < INTERN_LIMIT (größer als
+    jedes Standardfeld); Zellen außerhalb, z. B. Nachbarn jenseits der Wand, werden jedes Mal neu
+    gebaut, damit die Tabelle begrenzt bleibt.
 
     :ivar x: X-Koordinate der Zelle.
     :ivar y: Y-Koordinate der Zelle.
+    :ivar code: Kompakte Integer-Kodierung der Position (y * 2**16 + x).
     """
-    __slots__ = ('x', 'y', 'prime_encode')
+    __slots__ = ('x', 'y', 'code')
+
+    INTERN_LIMIT = 32
+    _interned: typing.Dict[int, 'Cell'] = {}
 
     def __init__(self, x: int, y: int):
         """
         Erstellt eine neue Cell mit x- und y-Koordinaten.
 
-        Kodiert die Position zusätzlich eindeutig mit Primzahlen.
+        Kodiert die Position zusätzlich eindeutig als kleinen Integer.
+        Für Spielfeldzellen besser Cell.at(x, y) verwenden.
 
         :param x: horizontale Position
         :param y: vertikale Position
         """
         self.x = x
         self.y = y
-        self.prime_encode = 2 ** self.x * 3 ** self.y
+        self.code = (y << 16) + x
 
     def __str__(self):
         """String-Darstellung wie (3, 5)"""
@@ -45,20 +60,25 @@ class Cell:
         """
         Zwei Zellen gelten als gleich, wenn X und Y übereinstimmen.
 
+        Verglichen wird x/y statt code, weil code bei negativen Koordinaten nicht eindeutig ist
+        (z. B. (-1, 1) und (65535, 0)).
+
         :param other: Vergleichszelle
         :return: True oder False
         """
+        if self is other:
+            return True
         if not isinstance(other, Cell):
             return False
         return self.x == other.x and self.y == other.y
 
     def __hash__(self):
         """
-        Hash-Wert auf Basis der Primzahlkodierung.
+        Hash-Wert auf Basis der Integer-Kodierung.
 
         Dadurch können Cells effizient in Mengen und Dictionaries verwendet werden.
         """
-        return hash(self.prime_encode)
+        return self.code
 
     def distance(self, other: typing.Self) -> int:
         """
@@ -71,35 +91,113 @@ class Cell:
         """
         return abs(self.x - other.x) + abs(self.y - other.y)
 
+    @staticmethod
+    def at(x: int, y: int) -> 'Cell':
+        """
+        Liefert die internierte Cell für (x, y) und legt sie beim ersten Zugriff an.
+
+        Außerhalb von 0 <= x, y < INTERN_LIMIT wird eine neue, nicht internierte Cell gebaut;
+        innerhalb ist der Schlüssel (y << 16) + x eindeutig.
+
+        :param x: horizontale Position
+        :param y: vertikale Position
+        :return: Geteilte Cell-Instanz (bzw. neue Cell außerhalb des Bereichs)
+        """
+        if not (0 <= x < Cell.INTERN_LIMIT and 0 <= y < Cell.INTERN_LIMIT):
+            return Cell(x, y)
+        code = (y << 16) + x
+        cell = Cell._interned.get(code)
+        if cell is None:
+            cell = Cell._interned[code] = Cell(x, y)
+        return cell
+
     @staticmethod
     def from_json(json: typing.Dict):
         """
-        Erstellt eine Cell aus einem JSON-Objekt wie {'x': 3, 'y': 5}
+        Liefert die Cell zu einem JSON-Objekt wie {'x': 3, 'y': 5}
 
         :param json: Dictionary mit 'x' und 'y'
-        :return: Neue Cell-Instanz
+        :return: Internierte Cell-Instanz (siehe Cell.at)
+        """
+        return Cell.at(int(json['x']), int(json['y']))
+
+
+class CellGrid:
+    """
+    Tabelle der internierten Zellen einer Feldgröße, Index = y * width + x.
+
+    Enthält zusätzlich die Nachbarn jeder Zelle als fertige Tupel (links, rechts, unten, oben),
+    sodass Pfadsuche und Heatmap keine neuen Cell-Objekte erzeugen müssen.
+
+    :ivar cells: Alle Zellen des Felds
+    :ivar neighbours: Nachbarzellen pro Zelle
+    """
+    __slots__ = ('width', 'height', 'cells', 'neighbours')
+
+    def __init__(self, width: int, height: int):
         """
-        return Cell(int(json['x']), int(json['y']))
+        Legt die Zellen und Nachbartupel für die Feldgröße an.
+
+        :param width: Spielfeldbreite
+        :param height: Spielfeldhöhe
+        """
+        self.width = width
+        self.height = height
+        self.cells: list[Cell] = [Cell.at(x, y) for y in range(height) for x in range(width)]
+        self.neighbours: list[tuple[Cell, ...]] = [
+            tuple(self.cells[n] for n in table_entry)
+            for table_entry in neighbour_table(width, height)
+        ]
+
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def for_size(width: int, height: int) -> 'CellGrid':
+        """
+        Liefert die (gecachte) Zelltabelle für die Feldgröße.
+
+        :param width: Spielfeldbreite
+        :param height: Spielfeldhöhe
+        :return: CellGrid-Instanz
+        """
+        return CellGrid(width, height)
+
+    def at(self, x: int, y: int) -> Cell:
+        """Zelle (x, y) aus der Tabelle."""
+        return self.cells[y * self.width + x]
+
+    def neighbours_of(self, cell: Cell) -> tuple[Cell, ...]:
+        """
+        Vorberechnete Nachbarn einer Zelle.
+
+        :param cell: Zelle auf dem Feld
+        :return: Tupel der Nachbarzellen
+        """
+        return self.neighbours[cell.y * self.width + cell.x]
 
 
 class Snake:
     """
     Repräsentiert eine Schlange im Spiel.
 
-    Besteht aus einem Body (Liste von Zellen) und einer ID.
+    Besteht aus einem Body (Deque von Zellen, Kopf vorne) und einer ID. Pro Zug wird
+    vorne der neue Kopf angehängt und hinten der Schwanz entfernt, beides in O(1).
+    zobrist ist der Zobrist-Hash der Schlange (siehe zobrist.SnakeKeys), den das Game pflegt.
     """
-    __slots__ = ('game_id', 'body', 'length')
+    __slots__ = ('game_id', 'body', 'length', 'health', 'zobrist')
 
-    def __init__(self, game_id: str, body: list[Cell]):
+    def __init__(self, game_id: str, body: typing.Iterable[Cell], health: int = 100):
         """
         Erstellt eine neue Snake mit ID und Body.
 
         :param game_id: Eindeutige ID der Schlange
-        :param body: Liste der Zellen, beginnend mit dem Kopf
+        :param body: Zellen, beginnend mit dem Kopf
+        :param health: Lebenspunkte
         """
         self.game_id = game_id
-        self.body = body
+        self.body: deque[Cell] = deque(body)
         self.length = len(self.body)
+        self.health = health
+        self.zobrist = 0
 
     def __str__(self):
         """Kurze Darstellung der Schlange"""
@@ -122,37 +220,47 @@ class Snake:
 
     def __hash__(self):
         """
-        Hash-Funktion zur Nutzung der Snake in Mengen/Dictionaries.
+        Hash-Funktion zur Nutzung der Snake in Mengen/Dictionaries (über die ID).
         """
-        return hash((self.game_id, self.body))
+        return hash(self.game_id)
 
-    def update_from_json(self, json: typing.Dict):
+    def update_from_json(self, json: typing.Dict) -> tuple[Cell, Cell | None, Cell | None]:
         """
         Aktualisiert die Schlange basierend auf dem JSON-State des neuen Zugs.
 
         Fügt neue Kopfposition ein und entfernt ggf. das letzte Element,
-        falls die Länge gleich bleibt (kein Fressen passiert).
+        falls die Länge gleich bleibt (kein Fressen passiert). Nach dem Fressen
+        verdoppeln die Standard-Regeln das neue Schwanzende; dann wird der alte
+        Schwanz durch das Schwanzende aus dem JSON ersetzt.
 
         :param json: JSON-Daten für die Schlange im neuen Zug
+        :return: (neuer Kopf, entfernter Schwanz oder None, hinzugefügter Schwanz oder None)
         """
-        self.body.insert(0, Cell.from_json(json['head']))
+        head = Cell.from_json(json['head'])
+        self.body.appendleft(head)
+        self.health = int(json['health'])
 
         if int(json['length']) == self.length:
-            self.body.pop(-1)
-        else:
-            self.length = len(self.body)
+            return head, self.body.pop(), None
+        self.length = len(self.body)
+
+        tail = Cell.from_json(json['body'][-1])
+        if tail != self.body[-1]:
+            removed = self.body.pop()
+            self.body.append(tail)
+            return head, removed, tail
+        return head, None, None
 
     @staticmethod
     def from_json(json: typing.Dict):
         """
         Erstellt eine neue Snake aus JSON-Daten.
 
-        :param json: Dictionary mit 'id' und 'body'
+        :param json: Dictionary mit 'id', 'body' und 'health'
         :return: Snake-Instanz
         """
         game_id: str = json['id']
-        body: list[Cell] = [Cell.from_json(cell_obj) for cell_obj in json['body']]
-        return Snake(game_id, body)
+        return Snake(game_id, (Cell.from_json(cell_obj) for cell_obj in json['body']), int(json['health']))
 
 
 class Game:
@@ -160,8 +268,18 @@ class Game:
     Hält den Gesamtzustand des Spiels (Feldgröße, eigene Schlange, Gegner usw.)
 
     Wird bei jedem Zug aktualisiert.
+
+    Zusätzlich wird das Feld als Bitboard gehalten: Körper, Köpfe, Futter, Hazards und
+    Wände sind je ein Integer mit einem Bit pro Zelle (siehe Bitboard). Das Zählgitter
+    occupancy (Schlangenteile pro Zelle) wird pro Zug nur um Köpfe und Schwänze angepasst;
+    diese Änderungen stehen danach in occupancy_changes (None nach einem Neuaufbau).
+
+    Der Zobrist-Hash (Körper, Futter, Lebenspunkte-Stufen) wird ebenso nur um die Änderungen
+    des Zugs nachgeführt; er stimmt mit dem Hash des Suchfelds (search.SearchBoard) überein.
     """
-    __slots__ = ('turn', 'width', 'height', 'snakes', 'you', 'ownfood', 'hazards')
+    __slots__ = ('turn', 'width', 'height', 'snakes', 'snakes_by_id', 'you', 'ownfood', 'hazards',
+                 'board', 'occupancy', 'body_mask', 'head_mask', 'food_mask', 'hazard_mask', 'wall_mask',
+                 'occupancy_changes', 'zobrist')
 
     def __init__(self, game_state: typing.Dict):
         """
@@ -173,10 +291,17 @@ class Game:
         self.width: int = int(game_state['board']['width'])
         self.height: int = int(game_state['board']['height'])
         self.snakes: list[Snake] = [Snake.from_json(snake_obj) for snake_obj in game_state['board']['snakes']]
-        self.you: Snake = next(x for x in self.snakes if x.game_id == game_state['you']['id'])
+        self.snakes_by_id: dict[str, Snake] = {snake.game_id: snake for snake in self.snakes}
+        self.you: Snake = self.snakes_by_id[game_state['you']['id']]
         self.ownfood: list[Cell] = [Cell.from_json(food_obj) for food_obj in game_state['board']['food']]
         self.hazards: list[Cell] = [Cell.from_json(hazard_obj) for hazard_obj in game_state['board']['hazards']]
 
+        self.board: Bitboard = Bitboard.for_size(self.width, self.height)
+        self.wall_mask: int = self.board.border
+        self.occupancy_changes: list[tuple[int, int]] | None = None
+        self.build_masks()
+        self.zobrist: int = self.build_hash()
+
     def __str__(self):
         """Zeigt nur Turn und die Liste der Schlangen"""
         return f"Turn {self.turn}: {self.snakes}"
@@ -190,20 +315,159 @@ class Game:
         :param game_state: Neuer JSON-Zustand des Spiels
         """
         self.turn = int(game_state['turn'])
+        self.occupancy_changes = None
         if self.turn == 0:
             return  # Runde 0 → nichts machen
 
         self.ownfood = [Cell.from_json(food_obj) for food_obj in game_state['board']['food']]
+        self.hazards = [Cell.from_json(hazard_obj) for hazard_obj in game_state['board']['hazards']]
+
+        width = self.width
+        occupancy = self.occupancy
+        body_mask = self.body_mask
+        head_mask = 0
+        alive: set[str] = set()
+        changes: list[tuple[int, int]] = []  # (Zellindex, +1/-1) für occupancy_changes
+
+        cells = width * self.height
+        for snake_obj in game_state['board']['snakes']:
+            snake = self.snakes_by_id.get(snake_obj['id'])
+            if snake is None:
+                continue  # neue Schlangen gibt es mitten im Spiel nicht; matches() erkennt das
+            alive.add(snake.game_id)
+            keys = snake_keys(snake.game_id, cells)
+            old_head = snake.body[0]
+            zobrist = (snake.zobrist ^ keys.head[old_head.y * width + old_head.x]
+                       ^ keys.length[len(snake.body)] ^ keys.health[health_bucket(snake.health)])
+            head, tail, grown = snake.update_from_json(snake_obj)
+
+            index = head.y * width + head.x
+            occupancy[index] += 1
+            body_mask |= 1 << index
+            head_mask |= 1 << index
+            changes.append((index, 1))
+            zobrist ^= keys.body[index] ^ keys.head[index]
+            if grown is not None:
+                index = grown.y * width + grown.x
+                occupancy[index] += 1
+                body_mask |= 1 << index
+                changes.append((index, 1))
+                zobrist ^= keys.body[index]
+            if tail is not None:
+                index = tail.y * width + tail.x
+                occupancy[index] -= 1
+                if not occupancy[index]:
+                    body_mask &= ~(1 << index)
+                changes.append((index, -1))
+                zobrist ^= keys.body[index]
+            snake.zobrist = zobrist ^ keys.length[len(snake.body)] ^ keys.health[health_bucket(snake.health)]
+
+        if len(alive) != len(self.snakes):
+            # tote Schlangen einmalig aus dem Zählgitter austragen
+            for snake in self.snakes:
+                if snake.game_id in alive:
+                    continue
+                for cell in snake.body:
+                    index = cell.y * width + cell.x
+                    occupancy[index] -= 1
+                    if not occupancy[index]:
+                        body_mask &= ~(1 << index)
+                    changes.append((index, -1))
+                del self.snakes_by_id[snake.game_id]
+            self.snakes = [snake for snake in self.snakes if snake.game_id in alive]
+
+        self.body_mask = body_mask
+        self.head_mask = head_mask
+        self.occupancy_changes = changes
+        board = self.board
+        self.food_mask = board.mask_of((cell.x, cell.y) for cell in self.ownfood)
+        self.hazard_mask = board.mask_of((cell.x, cell.y) for cell in self.hazards)
+        self.zobrist = self._combine_hash()
+
+    def matches(self, game_state: typing.Dict) -> bool:
+        """
+        Prüft, ob das Game-Objekt zum übergebenen Spielzustand passt (gleiche Schlangen,
+        Köpfe und Längen). Wird nach einem inkrementellen update() zur Kontrolle genutzt.
 
-        sn_ids: list[str] = [sn['id'] for sn in game_state['board']['snakes']]
-        to_delete: list[Snake] = []
+        :param game_state: JSON-Zustand des Spiels
+        :return: True, wenn der Zustand übereinstimmt
+        """
+        json_snakes = game_state['board']['snakes']
+        if len(json_snakes) != len(self.snakes):
+            return False
+        for json_snake in json_snakes:
+            snake = self.snakes_by_id.get(json_snake['id'])
+            if snake is None or len(snake.body) != len(json_snake['body']):
+                return False
+            if snake.body[0] != Cell.from_json(json_snake['body'][0]):
+                return False
+        return True
+
+    def build_masks(self) -> None:
+        """
+        Baut Zählgitter und Bitmasken für Körper, Köpfe, Futter und Hazards komplett neu auf.
+        """
+        board = self.board
+        width = self.width
+        occupancy = bytearray(width * self.height)
+        for snake in self.snakes:
+            for cell in snake.body:
+                occupancy[cell.y * width + cell.x] += 1
+        self.occupancy = occupancy
+        self.body_mask = board.mask_of((cell.x, cell.y) for snake in self.snakes for cell in snake.body)
+        self.head_mask = board.mask_of((snake.body[0].x, snake.body[0].y) for snake in self.snakes)
+        self.food_mask = board.mask_of((cell.x, cell.y) for cell in self.ownfood)
+        self.hazard_mask = board.mask_of((cell.x, cell.y) for cell in self.hazards)
+
+    def build_hash(self) -> int:
+        """
+        Berechnet die Zobrist-Hashes aller Schlangen komplett neu.
 
+        :return: Zobrist-Hash des Spielzustands
+        """
+        width = self.width
+        cells = width * self.height
+        for snake in self.snakes:
+            snake.zobrist = snake_keys(snake.game_id, cells).hash(
+                (cell.y * width + cell.x for cell in snake.body), snake.health)
+        return self._combine_hash()
+
+    def _combine_hash(self) -> int:
+        """XOR der Schlangen-Hashes und des Futters (Futter wird pro Zug ohnehin neu gelesen)."""
+        width = self.width
+        zobrist = food_hash((cell.y * width + cell.x for cell in self.ownfood), width * self.height)
         for snake in self.snakes:
-            if snake.game_id in sn_ids:
-                snake.update_from_json(game_state['board']['snakes'][sn_ids.index(snake.game_id)])
-            else:
-                to_delete.append(snake)
-
-        for snake in to_delete:
-            self.snakes.remove(snake)
-
+            zobrist ^= snake.zobrist
+        return zobrist
+
+    def blocked_mask(self) -> int:
+        """
+        Alle Zellen, die im Flood-Fill als blockiert gelten: Schlangenkörper und der Rand.
+
+        :return: Bitmaske
+        """
+        return self.body_mask | self.wall_mask
+
+    def is_occupied(self, x: int, y: int) -> bool:
+        """
+        Prüft per Bit-Test, ob auf (x, y) ein Schlangenteil liegt.
+
+        :param x: X-Koordinate
+        :param y: Y-Koordinate
+        :return: True oder False
+        """
+        return self.board.contains(self.body_mask, x, y)
+
+    def flood_fill_space(self, start: Cell) -> int:
+        """
+        Zählt die freien Felder, die von start aus erreichbar sind (Bitboard-Flood-Fill).
+
+        :param start: Startzelle
+        :return: Anzahl erreichbarer freier Felder
+        """
+        board = self.board
+        if not (0 <= start.x < board.width and 0 <= start.y < board.height):
+            return 0
+        free = board.full & ~self.blocked_mask()
+        return board.count(board.flood(free, board.bit(start.x, start.y)))
+
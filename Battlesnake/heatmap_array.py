@@ -0,0 +1,262 @@
+# Gruppe 3 – Battlesnake Projekt (SS2025)
+# Mitglieder:
+# Eren Temizkan, 223201982
+# Dominik Ide, 220200046
+# Dogukan Karakoyun, 223202023
+# Alexandra Holsten, 221200813
+# Yuxiao Wu, 223200006
+
+import os
+
+import numpy as np
+
+from Battlesnake.utils import debug
+from Battlesnake.game import Cell
+from Battlesnake.board_index import BoardIndex, neighbour_table
+from Battlesnake.board_template import BoardTemplate
+
+# HEATMAP_CHECK=1 vergleicht jede inkrementelle Heatmap mit einem vollständigen Neuaufbau
+CHECK_INCREMENTAL = os.environ.get("HEATMAP_CHECK", "0") == "1"
+
+# NumPy-Variante der Heatmap aus heatmap.py und die maßgebliche Heatmap (strategy.move nutzt sie
+# über die IncrementalHeatmap der Session): gleiche Layer und gleiche Punktwerte, aber jeder Layer
+# ist eine Array-Operation. Die Heatmap ist ein int-Array der Form (width, height), sodass
+# heatmap[x][y] wie bei der Listen-Variante funktioniert.
+
+
+def apply_food_layer(heatmap, game_state, health, index):
+    """
+    Hebt die Attraktivität von Futterfeldern hervor (siehe heatmap.apply_food_layer).
+
+    :param heatmap: Heatmap-Array (width, height)
+    :param game_state: Spielzustand
+    :param health: Lebenspunkte der eigenen Schlange
+    :param index: BoardIndex des aktuellen Zugs
+    """
+    my_id = game_state["you"]["id"]
+    multiplier = 50 if health < 60 else 20
+
+    xs, ys, weights = [], [], []
+    for food in game_state["board"]["food"]:
+        x, y = food["x"], food["y"]
+        if index.path_distance(my_id, x, y) < 0:
+            continue  # für uns nicht erreichbar
+        contested = index.is_contested(x, y) or not index.owns(my_id, x, y)
+        xs.append(x)
+        ys.append(y)
+        weights.append(5 if contested else multiplier)
+    if xs:
+        np.add.at(heatmap, (xs, ys), weights)  # doppelte Futterfelder zählen mehrfach
+
+
+def apply_snake_penalty_layer(heatmap, game_state, index):
+    """
+    Bestraft Schlangenfelder (-100 pro Segment) und Felder um alle Köpfe (-50).
+
+    Die Segmente kommen direkt aus dem Belegungsgitter des BoardIndex (Anzahl Teile pro Zelle),
+    die Kopf-Nachbarn aus der vorberechneten Nachbartabelle.
+
+    :param heatmap: Heatmap-Array (width, height)
+    :param game_state: Spielzustand
+    :param index: BoardIndex des aktuellen Zugs
+    """
+    width, height = heatmap.shape
+    occupancy = np.frombuffer(index.occupancy, dtype=np.uint8).reshape(height, width)
+    heatmap -= 100 * occupancy.T.astype(np.int64)
+
+    neighbours = neighbour_table(width, height)
+    around = [n for snake in game_state["board"]["snakes"]
+              for n in neighbours[snake["body"][0]["y"] * width + snake["body"][0]["x"]]]
+    if around:
+        heatmap -= 50 * np.bincount(around, minlength=width * height).reshape(height, width).T
+
+
+def apply_flood_fill_layer(heatmap, my_head, index):
+    """
+    Bonus für die Nachbarn des Kopfes je nach freiem Platz dahinter (höchstens 50).
+
+    :param heatmap: Heatmap-Array (width, height)
+    :param my_head: Kopfposition (Cell)
+    :param index: BoardIndex des aktuellen Zugs
+    """
+    for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+        nx, ny = my_head.x + dx, my_head.y + dy
+        if index.in_bounds(nx, ny):
+            heatmap[nx, ny] += min(index.flood_fill_space(Cell.at(nx, ny)), 50)
+
+
+def apply_chokepoint_layer(heatmap, game_state, index):
+    """
+    Bestraft Engpässe (siehe heatmap.apply_chokepoint_layer): -25, wenn ein abgetrenntes Teil
+    kleiner als unsere Länge ist, sonst -5.
+
+    :param heatmap: Heatmap-Array (width, height)
+    :param game_state: Spielzustand
+    :param index: BoardIndex des aktuellen Zugs
+    """
+    cut_cells = index.chokepoints()
+    if not cut_cells:
+        return
+    width = index.width
+    my_length = len(game_state["you"]["body"])
+    cells = np.fromiter(cut_cells.keys(), dtype=np.int64, count=len(cut_cells))
+    weights = [25 if min(pieces) < my_length else 5 for pieces in cut_cells.values()]
+    heatmap[cells % width, cells // width] -= weights
+
+
+def apply_tail_priority(heatmap, game_state):
+    """
+    Bonus für den eigenen Schwanz.
+
+    :param heatmap: Heatmap-Array (width, height)
+    :param game_state: Spielzustand
+    """
+    tail = game_state["you"]["body"][-1]
+    width, height = heatmap.shape
+    if 0 <= tail["x"] < width and 0 <= tail["y"] < height:
+        heatmap[tail["x"], tail["y"]] += 20
+
+
+def build_heatmap(game_state, my_head, health, index=None, template=None):
+    """
+    Baut die gesamte Heatmap als NumPy-Array.
+
+    Wand- und Zentrums-Layer hängen nur von der Feldgröße ab und kommen als fertige
+    Kopie aus dem BoardTemplate.
+
+    :param game_state: Spielzustand
+    :param my_head: Kopfposition der Schlange (Cell)
+    :param health: Lebenspunkte (int)
+    :param index: BoardIndex des aktuellen Zugs (wird sonst einmalig gebaut)
+    :param template: BoardTemplate der Feldgröße (z. B. aus der Session)
+    :return: int-Array der Form (width, height)
+    """
+    debug("[build_heatmap] Building the heatmap array...")
+
+    width = game_state["board"]["width"]
+    height = game_state["board"]["height"]
+    if template is None:
+        template = BoardTemplate.for_size(width, height)
+    heatmap = template.new_heatmap()  # Wand- und Zentrums-Layer
+    if index is None:
+        index = BoardIndex(game_state)
+
+    apply_food_layer(heatmap, game_state, health, index)
+    apply_snake_penalty_layer(heatmap, game_state, index)
+    apply_flood_fill_layer(heatmap, my_head, index)
+    apply_chokepoint_layer(heatmap, game_state, index)
+    apply_tail_priority(heatmap, game_state)
+
+    return heatmap
+
+
+class IncrementalHeatmap:
+    """
+    Heatmap, die über die Züge eines Spiels erhalten bleibt (Teil der GameSession).
+
+    Der Grundanteil (Wand, Zentrum, Schlangenfelder, Felder um die Köpfe) wird pro Zug nur um
+    die Änderungen aus Game.update korrigiert: neue Köpfe, frei gewordene Schwänze und tote
+    Schlangen. Futter, Flood-Fill, Engpässe und Schwanzbonus hängen von den Distanzfeldern bzw.
+    Regionen des Zugs ab und werden in build() auf einer Kopie des Grundanteils neu gesetzt; sie
+    betreffen nur die Futterfelder, die vier Nachbarn des Kopfes, die Engpässe und den Schwanz.
+
+    :ivar base: Grundanteil der Heatmap (width, height)
+    :ivar heads: Kopf-Indizes (y * width + x) des letzten Zugs
+    :ivar turn: Zug, auf dem base steht
+    :ivar check: Jede Heatmap mit einem vollständigen Neuaufbau vergleichen
+    :ivar mismatches: Anzahl gefundener Abweichungen im Prüfmodus
+    """
+    __slots__ = ('template', 'base', 'heads', 'turn', 'check', 'mismatches')
+
+    def __init__(self, game, template, check=None):
+        """
+        :param game: Game-Objekt der Session
+        :param template: BoardTemplate der Feldgröße
+        :param check: Prüfmodus; Standard ist die Umgebungsvariable HEATMAP_CHECK
+        """
+        self.template = template
+        self.check = CHECK_INCREMENTAL if check is None else check
+        self.mismatches = 0
+        self.reset(game)
+
+    def reset(self, game):
+        """
+        Baut den Grundanteil komplett aus dem Game-Objekt neu auf.
+
+        :param game: Game-Objekt
+        """
+        width, height = game.width, game.height
+        base = self.template.new_heatmap()
+        occupancy = np.frombuffer(game.occupancy, dtype=np.uint8).reshape(height, width)
+        base -= 100 * occupancy.T.astype(np.int64)
+
+        neighbours = neighbour_table(width, height)
+        heads = [snake.body[0].y * width + snake.body[0].x for snake in game.snakes]
+        around = [n for head in heads for n in neighbours[head]]
+        if around:
+            base -= 50 * np.bincount(around, minlength=width * height).reshape(height, width).T
+
+        self.base = base
+        self.heads = heads
+        self.turn = game.turn
+
+    def advance(self, game):
+        """
+        Bringt den Grundanteil auf den Stand des Game-Objekts.
+
+        Folgt der Zug direkt auf den letzten, werden nur die Änderungen der Belegung und der
+        Köpfe eingerechnet; sonst (neues Game, Lücke) wird neu aufgebaut.
+
+        :param game: Game-Objekt nach session.advance
+        """
+        changes = game.occupancy_changes
+        if changes is None or game.turn not in (self.turn, self.turn + 1):
+            self.reset(game)
+            return
+        if game.turn == self.turn:
+            return  # gleicher Zug noch einmal angefragt
+
+        width, height = game.width, game.height
+        neighbours = neighbour_table(width, height)
+        heads = [snake.body[0].y * width + snake.body[0].x for snake in game.snakes]
+
+        # alle Korrekturen sammeln (Zellindex y * width + x) und in einem Schritt eintragen
+        cells = [index for index, _ in changes]
+        weights = [-100 * delta for _, delta in changes]
+        for head in self.heads:
+            cells.extend(neighbours[head])
+            weights.extend([50] * len(neighbours[head]))
+        for head in heads:
+            cells.extend(neighbours[head])
+            weights.extend([-50] * len(neighbours[head]))
+        if cells:
+            cells = np.asarray(cells)
+            np.add.at(self.base, (cells % width, cells // width), weights)
+
+        self.heads = heads
+        self.turn = game.turn
+
+    def build(self, game_state, my_head, health, index):
+        """
+        Fertige Heatmap des Zugs: Kopie des Grundanteils plus Futter, Flood-Fill und Schwanz.
+
+        :param game_state: Spielzustand
+        :param my_head: Kopfposition der Schlange (Cell)
+        :param health: Lebenspunkte (int)
+        :param index: BoardIndex des aktuellen Zugs
+        :return: int-Array der Form (width, height)
+        """
+        heatmap = self.base.copy()
+        apply_food_layer(heatmap, game_state, health, index)
+        apply_flood_fill_layer(heatmap, my_head, index)
+        apply_chokepoint_layer(heatmap, game_state, index)
+        apply_tail_priority(heatmap, game_state)
+
+        if self.check:
+            full = build_heatmap(game_state, my_head, health, index, self.template)
+            if not np.array_equal(full, heatmap):
+                self.mismatches += 1
+                debug(f"[IncrementalHeatmap] Abweichung in Zug {game_state['turn']} → Neuaufbau")
+                self.base = full - (heatmap - self.base)  # Grundanteil aus dem Neuaufbau übernehmen
+                return full
+        return heatmap
@@ -0,0 +1,78 @@
+# Gruppe 3 – Battlesnake Projekt (SS2025)
+# Mitglieder:
+# Eren Temizkan, 223201982
+# Dominik Ide, 220200046
+# Dogukan Karakoyun, 223202023
+# Alexandra Holsten, 221200813
+# Yuxiao Wu, 223200006
+
+from Battlesnake.bitboard import Bitboard
+
+
+def frontier_masks(board: Bitboard, start: int, free_masks: list[int]) -> list[int]:
+    """
+    Erreichbare Zellen pro Tiefe als Bitmasken.
+
+    Statt jeden einzelnen Pfad rekursiv abzulaufen, wächst eine einzige Frontier-Maske pro
+    Zug um ihre Nachbarn und wird mit den in diesem Zug freien Zellen geschnitten. Die Kosten
+    sind damit linear in der Tiefe statt exponentiell in der Anzahl der Pfade.
+
+    :param board: Bitboard-Geometrie des Spielfelds
+    :param start: Startmaske (meist nur der Kopf)
+    :param free_masks: freie Zellen für Zug 1, 2, ... (Länge = Suchtiefe)
+    :return: Liste der Frontier-Masken, Index 0 = start, Index d = nach d Zügen
+    """
+    frontiers = [start]
+    frontier = start
+    for free in free_masks:
+        frontier = board.neighbours(frontier) & free
+        frontiers.append(frontier)
+        if not frontier:
+            break  # in dieser Tiefe ist kein Feld mehr erreichbar
+    return frontiers
+
+
+def leaf_regions(board: Bitboard, free: int, leaves: int) -> list[int]:
+    """
+    Zerlegt die Blätter der letzten Tiefe in ihre Regionen und füllt jede Region nur einmal.
+
+    :param board: Bitboard-Geometrie des Spielfelds
+    :param free: freie Zellen in der letzten Tiefe
+    :param leaves: Frontier-Maske der letzten Tiefe
+    :return: Liste der unterschiedlichen Regionsmasken, die ein Blatt enthalten
+    """
+    regions = []
+    remaining = leaves & free
+    while remaining:
+        region = board.flood(free, remaining & -remaining)
+        remaining &= ~region  # alle Blätter dieser Region sind damit erledigt
+        regions.append(region)
+    return regions
+
+
+def future_space(index, start, turns: int = 2) -> int:
+    """
+    Größter Platz, den die Schlange nach genau `turns` Zügen noch erreichen kann.
+
+    In Tiefe d gelten die Schlangenteile als frei, deren free_turn höchstens d ist; die
+    Blatt-Regionen werden auf den freien Zellen der letzten Tiefe gezählt. Der eigene Weg
+    blockiert dabei nicht (Obergrenze).
+
+    :param index: BoardIndex des aktuellen Zugs
+    :param start: Kopfposition als Cell
+    :param turns: Suchtiefe (Kosten wachsen linear, auch 6-10 Züge sind günstig)
+    :return: Größe der größten Region unter den Blättern (0, wenn kein Blatt existiert)
+    """
+    board = index.board
+    if not index.in_bounds(start.x, start.y):
+        return 0
+    if turns <= 0:
+        return index.flood_fill_space(start)
+
+    free_masks = index.free_masks(turns)  # Schwänze rücken Zug für Zug nach
+    frontiers = frontier_masks(board, board.bit(start.x, start.y), free_masks)
+    if len(frontiers) <= turns:
+        return 0  # Frontier ist vor der letzten Tiefe ausgestorben
+
+    regions = leaf_regions(board, free_masks[-1], frontiers[-1])
+    return max((board.count(region) for region in regions), default=0)
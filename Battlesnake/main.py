@@ -8,7 +8,8 @@
 
 
 from Battlesnake.utils import debug
-from Battlesnake.strategy import choose_strategy, move
+from Battlesnake.strategy import choose_strategy, move, ml_model
+from Battlesnake.session import sessions
 from Battlesnake.server import run_server
 
 import typing
@@ -37,16 +38,18 @@ def info() -> typing.Dict:
 
 def start(game_state: typing.Dict):
     """
-    Wird beim Start des Spiels aufgerufen. Kann für Debugging genutzt werden.
+    Wird beim Start des Spiels aufgerufen. Eröffnet die Session für das Spiel.
     """
     debug("Game started and debug function")
     debug("[start] Game started.")
+    sessions.open(game_state, ml_model)  # Session mit Game-Objekt und Tabellen anlegen
 
 def end(game_state: typing.Dict):
     """
-    Wird am Ende des Spiels aufgerufen.
+    Wird am Ende des Spiels aufgerufen. Gibt die Session wieder frei.
     """
     debug("[end] Game ended.")
+    sessions.close(game_state)
 
 if __name__ == "__main__":
     print("main.py is running")
@@ -55,13 +58,13 @@ if __name__ == "__main__":
         "start": start,
         "move": move,
         "end": end
-    })
-
-
-
-
-
-
-
-
-
+    })
+
+
+
+
+
+
+
+
+
@@ -0,0 +1,417 @@
+# Gruppe 3 – Battlesnake Projekt (SS2025)
+# Mitglieder:
+# Eren Temizkan, 223201982
+# Dominik Ide, 220200046
+# Dogukan Karakoyun, 223202023
+# Alexandra Holsten, 221200813
+# Yuxiao Wu, 223200006
+
+import atexit
+import math
+import multiprocessing
+import os
+import random
+import time
+from array import array
+from multiprocessing.shared_memory import SharedMemory
+
+from Battlesnake.anytime import Deadline
+from Battlesnake.board_index import BoardIndex
+from Battlesnake.board_state import BoardState
+from Battlesnake.safety import MOVES, MoveSafety
+from Battlesnake.search import SearchBoard
+from Battlesnake.utils import debug
+
+EXPLORATION = 1.4          # UCT-Konstante
+ROLLOUT_TURNS = 20         # Länge eines Rollouts in Zügen
+MAX_TREE_DEPTH = 12        # tiefer wird der Baum nicht ausgebaut
+ROLLOUTS_PER_TASK = 16     # Rollouts pro Auftrag an einen Worker
+TEMPERATURE = 25.0         # Temperatur der Heatmap-Policy (größer = zufälliger)
+SHM_SIZE = 1 << 16         # Größe des Shared-Memory-Blocks für Brett und Heatmap
+OPPOSITE = (1, 0, 3, 2)    # Gegenrichtung zu up, down, left, right (Index in MOVES)
+
+
+def worker_limit() -> int:
+    """
+    Worker-Prozesse pro Server-Prozess: die Kerne werden auf die gunicorn-Worker verteilt
+    (SERVER_MODE=production, Anzahl wie in server.server_workers), damit nicht jeder
+    Server-Prozess einen eigenen Pool in voller Kernzahl forkt.
+
+    :return: Höchstzahl der MCTS-Worker in diesem Prozess (mindestens 1)
+    """
+    cores = os.cpu_count() or 1
+    servers = 1
+    if os.environ.get("SERVER_MODE") == "production":
+        from Battlesnake.server import server_workers
+        servers = server_workers()
+    return max(1, cores // servers)
+
+
+# MCTS_WORKERS=0 rechnet die Rollouts im eigenen Prozess, sonst in so vielen Worker-Prozessen
+# (höchstens worker_limit(), Standard: worker_limit())
+MCTS_WORKERS = min(int(os.environ.get("MCTS_WORKERS", worker_limit())), worker_limit())
+
+
+class Rollouts:
+    """
+    Führt Rollouts auf einem Suchfeld aus; lebt in jedem Worker und wird nur neu gebaut, wenn
+    im Shared Memory ein neues Brett liegt.
+
+    Eigene Züge kommen bis zum Ende des Pfads aus dem Baum, danach ziehen alle Schlangen nach
+    einer Heatmap-Policy: unter den nicht sofort tödlichen Feldern wird mit Gewicht
+    exp(Heatmap / TEMPERATURE) gezogen. Nach dem Rollout wird das Feld per unmake
+    zurückgesetzt, ein Rollout kopiert also nichts.
+    """
+
+    def __init__(self, state: BoardState, values):
+        """
+        :param state: BoardState des Zugs
+        :param values: Heatmap-Wert pro Zelle (Index y * width + x)
+        """
+        self.board = SearchBoard(state)
+        self.you = state.you
+        self.width = state.width
+        self.height = state.height
+        top = max(values, default=0)
+        self.weights = [math.exp((value - top) / TEMPERATURE) for value in values]
+        self.opponents = sum(1 for slot in range(len(state.bodies)) if slot != state.you)
+
+    def run(self, path: tuple[int, ...], rng: random.Random) -> float:
+        """
+        Ein Rollout: erst die eigenen Züge aus path, dann die Policy.
+
+        :param path: eigene Züge als Index in MOVES
+        :param rng: Zufallsgenerator
+        :return: Ergebnis aus unserer Sicht (0 = ausgeschieden, 1 = gewonnen)
+        """
+        board = self.board
+        you = self.you
+        weights = self.weights
+        undo = []
+        for turn in range(max(ROLLOUT_TURNS, len(path))):
+            movers = [slot for slot, alive in enumerate(board.alive) if alive]
+            tails = board.tails(movers)
+            targets = {}
+            for slot in movers:
+                if slot == you and turn < len(path):
+                    targets[slot] = self._target(board.bodies[you][0], path[turn])
+                    continue
+                moves = board.moves(slot, tails)
+                targets[slot] = rng.choices(moves, [weights[cell] for cell in moves])[0] if moves else None
+            undo.append(board.make(targets))
+            if not board.alive[you] or len(movers) == 1:
+                break
+
+        survivors = sum(1 for slot, alive in enumerate(board.alive) if alive and slot != you)
+        if not board.alive[you]:
+            result = 0.25 if not survivors else 0.0
+        elif not survivors and self.opponents:
+            result = 1.0
+        else:
+            result = 0.5 + 0.4 * (self.opponents - survivors) / max(1, self.opponents)
+        for entry in reversed(undo):
+            board.unmake(entry)
+        return result
+
+    def _target(self, head: int, move: int) -> int | None:
+        """Zielfeld eines eigenen Zugs (None außerhalb des Bretts)."""
+        dx, dy = MOVES[move][1]
+        x, y = head % self.width + dx, head // self.width + dy
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return y * self.width + x
+        return None
+
+
+class SharedBoard:
+    """
+    Shared-Memory-Block, über den die Worker Brett und Heatmap des Zugs erhalten.
+
+    Aufbau: [Generation, Länge Brett, Anzahl Werte] als uint32, danach BoardState.pack() und
+    die Heatmap-Werte als int32. Die Worker lesen den Block nur, wenn die Generation sich
+    geändert hat; pro Auftrag wird nur der Pfad übertragen.
+    """
+
+    def __init__(self, size: int = SHM_SIZE):
+        self.memory = SharedMemory(create=True, size=size)
+        self.generation = 0
+
+    @property
+    def name(self) -> str:
+        return self.memory.name
+
+    def publish(self, state: BoardState, values: list[int]) -> int:
+        """
+        Schreibt Brett und Heatmap in den Block.
+
+        :param state: BoardState des Zugs
+        :param values: Heatmap-Wert pro Zelle
+        :return: neue Generation
+        """
+        board = state.pack()
+        heat = array('i', values).tobytes()
+        self.generation += 1
+        header = array('I', [self.generation, len(board), len(values)]).tobytes()
+        payload = header + board + heat
+        if len(payload) > self.memory.size:
+            self.close()
+            self.memory = SharedMemory(create=True, size=max(len(payload), 2 * self.memory.size))
+        self.memory.buf[:len(payload)] = payload
+        return self.generation
+
+    def close(self) -> None:
+        self.memory.close()
+        self.memory.unlink()
+
+
+def read_shared(buffer) -> tuple[int, BoardState, array]:
+    """
+    Liest Generation, Brett und Heatmap aus dem Shared-Memory-Block (siehe SharedBoard).
+
+    :param buffer: memoryview des Blocks
+    :return: (Generation, BoardState, Heatmap-Werte)
+    """
+    header = array('I')
+    header.frombytes(bytes(buffer[:12]))
+    generation, board_size, count = header
+    state = BoardState.unpack(buffer[12:12 + board_size])
+    values = array('i')
+    values.frombytes(bytes(buffer[12 + board_size:12 + board_size + 4 * count]))
+    return generation, state, values
+
+
+_worker: dict = {}  # Zustand im Worker: Shared Memory, Generation und Rollouts
+
+
+def run_task(task: tuple) -> list[float]:
+    """
+    Auftrag eines Workers: mehrere Rollouts auf dem Brett im Shared Memory.
+
+    :param task: (Name des Blocks, Generation, Pfade, Seed)
+    :return: Ergebnis pro Pfad
+    """
+    name, generation, paths, seed = task
+    if _worker.get("name") != name:
+        if "memory" in _worker:
+            _worker["memory"].close()
+        _worker.update(name=name, memory=SharedMemory(name=name), generation=None)
+    if _worker["generation"] != generation:
+        _, state, values = read_shared(_worker["memory"].buf)
+        _worker.update(generation=generation, rollouts=Rollouts(state, values))
+    rng = random.Random(seed)
+    rollouts = _worker["rollouts"]
+    return [rollouts.run(path, rng) for path in paths]
+
+
+class Node:
+    """
+    Knoten des Suchbaums über unsere Züge (open loop: die Gegner werden in jedem Rollout neu
+    gezogen und sind nicht Teil des Baums).
+
+    :ivar children: Zugindex (in MOVES) -> Node
+    :ivar visits: Anzahl Rollouts durch den Knoten
+    :ivar value: Summe der Rollout-Ergebnisse
+    """
+    __slots__ = ('children', 'visits', 'value')
+
+    def __init__(self):
+        self.children: dict[int, Node] = {}
+        self.visits = 0
+        self.value = 0.0
+
+    def select(self, moves: tuple[int, ...]) -> int:
+        """
+        Nächster Zug nach UCT; noch nicht besuchte Züge zuerst.
+
+        :param moves: erlaubte Züge in diesem Knoten
+        :return: Zugindex
+        """
+        for move in moves:
+            if move not in self.children:
+                return move
+        log_visits = math.log(self.visits)
+        return max(moves, key=lambda move: self.children[move].score(log_visits))
+
+    def score(self, log_parent: float) -> float:
+        return self.value / self.visits + EXPLORATION * math.sqrt(log_parent / self.visits)
+
+
+class Tree:
+    """
+    Suchbaum einer GameSession; wird über die Züge hinweg weiterverwendet.
+
+    :ivar root: Wurzelknoten
+    :ivar turn: Zug, für den die Wurzel gilt
+    :ivar head: unser Kopf (Zellindex) in diesem Zug
+    """
+    __slots__ = ('root', 'turn', 'head')
+
+    def __init__(self):
+        self.root = Node()
+        self.turn = -1
+        self.head = -1
+
+    def advance(self, turn: int, head: int, width: int) -> bool:
+        """
+        Macht das Kind des tatsächlich gespielten Zugs zur neuen Wurzel, wenn turn direkt
+        folgt; der Zug ergibt sich aus altem und neuem Kopf.
+
+        :param turn: aktueller Zug
+        :param head: unser Kopf (Zellindex) im aktuellen Zug
+        :param width: Spielfeldbreite
+        :return: True, wenn Statistiken übernommen wurden
+        """
+        if turn == self.turn and head == self.head:
+            return True
+        child = None
+        if turn == self.turn + 1:
+            step = (head % width - self.head % width, head // width - self.head // width)
+            for move, (_, offset) in enumerate(MOVES):
+                if offset == step:
+                    child = self.root.children.get(move)
+        self.root = child if child is not None else Node()
+        self.turn = turn
+        self.head = head
+        return child is not None
+
+
+class Engine:
+    """
+    MCTS mit einem dauerhaften Pool warmer Worker-Prozesse.
+
+    Pro Zug wird das Brett einmal in den Shared-Memory-Block geschrieben; danach gehen nur
+    noch Pfade (Tupel von Zugindizes) und Seeds an die Worker. Jeder Worker hält sein
+    Suchfeld, bis eine neue Generation im Block liegt.
+    """
+
+    def __init__(self, workers: int = MCTS_WORKERS):
+        """
+        :param workers: Anzahl Worker-Prozesse (0 = Rollouts im eigenen Prozess)
+        """
+        self.workers = workers
+        self.shared: SharedBoard | None = None
+        self.pool = None
+        self.local: Rollouts | None = None
+        if workers:
+            self.shared = SharedBoard()
+            # fork: die Worker erben alle geladenen Module und sind sofort warm
+            method = "fork" if "fork" in multiprocessing.get_all_start_methods() else None
+            self.pool = multiprocessing.get_context(method).Pool(workers)
+            atexit.register(self.close)
+
+    def close(self) -> None:
+        """Beendet den Pool und gibt den Shared-Memory-Block frei."""
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool = None
+        if self.shared is not None:
+            self.shared.close()
+            self.shared = None
+
+    def search(self, index: BoardIndex, heatmap, deadline: Deadline,
+               tree: Tree | None = None) -> tuple[str | None, int]:
+        """
+        UCT-Suche über unsere Züge, bis das Zeitbudget fast verbraucht ist.
+
+        :param index: BoardIndex des aktuellen Zugs
+        :param heatmap: Heatmap des Zugs (heatmap[x][y])
+        :param deadline: Zeitbudget des Zugs
+        :param tree: Baum der GameSession (Standard: neuer Baum)
+        :return: (bester Zug oder None, Anzahl Rollouts)
+        """
+        state = index.state
+        safety = MoveSafety(index)
+        root_moves = (tuple(bit for bit, (name, _) in enumerate(MOVES) if safety.is_legal(name))
+                      or tuple(bit for bit, (name, _) in enumerate(MOVES) if safety.will_be_free(name)))
+        if not root_moves:
+            return None, 0
+
+        tree = tree if tree is not None else Tree()
+        reused = tree.advance(state.turn, state.head(state.you), state.width)
+        root = tree.root
+        values = [int(heatmap[cell % state.width][cell // state.width])
+                  for cell in range(state.width * state.height)]
+        if self.pool is not None:
+            generation = self.shared.publish(state, values)
+        else:
+            self.local = Rollouts(state, values)
+
+        rng = random.Random(state.turn)
+        batch = ROLLOUTS_PER_TASK * max(1, self.workers)
+        rollouts = 0
+        last_ms = 0.0
+        while deadline.remaining_ms() > last_ms * 1.5:
+            batch_start = time.perf_counter()
+            selected = [self._select(root, root_moves) for _ in range(batch)]
+            paths = [path for path, _ in selected]
+            if self.pool is not None:
+                tasks = [(self.shared.name, generation, paths[i:i + ROLLOUTS_PER_TASK], rng.getrandbits(32))
+                         for i in range(0, len(paths), ROLLOUTS_PER_TASK)]
+                results = [value for chunk in self.pool.map(run_task, tasks) for value in chunk]
+            else:
+                local_rng = random.Random(rng.getrandbits(32))
+                results = [self.local.run(path, local_rng) for path in paths]
+            for (_, chain), result in zip(selected, results):
+                for node in chain:
+                    node.value += result
+            rollouts += len(paths)
+            last_ms = (time.perf_counter() - batch_start) * 1000
+
+        visited = [move for move in root_moves if move in root.children and root.children[move].visits]
+        if not visited:
+            debug("[MCTS] keine Rollouts fertig → kein Zug")
+            return None, rollouts
+        best = max(visited, key=lambda move: root.children[move].visits)
+        debug(f"[MCTS] {rollouts} Rollouts, Baum {'übernommen' if reused else 'neu'}, "
+              f"Besuche {[(MOVES[m][0], root.children[m].visits) for m in root_moves if m in root.children]}")
+        return MOVES[best][0], rollouts
+
+    @staticmethod
+    def _select(root: Node, root_moves: tuple[int, ...]) -> tuple[tuple[int, ...], list[Node]]:
+        """
+        Läuft per UCT bis zu einem neuen Blatt und zählt den Besuch sofort (virtueller Verlust),
+        damit die übrigen Pfade desselben Batches andere Wege nehmen.
+
+        :return: (Pfad als Zugindizes, Knoten entlang des Pfads)
+        """
+        node = root
+        node.visits += 1
+        chain = [node]
+        path = []
+        moves = root_moves
+        while len(path) < MAX_TREE_DEPTH:
+            move = node.select(moves)
+            expanded = move not in node.children
+            if expanded:
+                node.children[move] = Node()
+            node = node.children[move]
+            node.visits += 1
+            chain.append(node)
+            path.append(move)
+            if expanded:
+                break
+            moves = tuple(m for m in range(len(MOVES)) if m != OPPOSITE[move])
+        return tuple(path), chain
+
+
+_engine: Engine | None = None
+
+
+def engine() -> Engine:
+    """Der Engine des Prozesses; Pool und Shared Memory entstehen beim ersten MCTS-Zug."""
+    global _engine
+    if _engine is None:
+        _engine = Engine()
+    return _engine
+
+
+def mcts_move(index: BoardIndex, heatmap, deadline: Deadline, tree: Tree | None = None) -> tuple[str | None, int]:
+    """
+    Zug per MCTS (siehe Engine.search) mit dem Engine des Prozesses.
+
+    :param index: BoardIndex des aktuellen Zugs
+    :param heatmap: Heatmap des Zugs (heatmap[x][y])
+    :param deadline: Zeitbudget des Zugs
+    :param tree: Baum der GameSession
+    :return: (bester Zug oder None, Anzahl Rollouts)
+    """
+    return engine().search(index, heatmap, deadline, tree)
@@ -8,8 +8,8 @@
 
 from typing import Iterable
 from Battlesnake.astar.astar import AStar
-from Battlesnake.game import Game, Cell
-from Battlesnake.heatmap import flood_fill_space
+from Battlesnake.game import Game, Cell, CellGrid
+from Battlesnake.board_index import BoardIndex, neighbour_table, timed_space
 
 class PathSolver(AStar):
     def __init__(self, game: Game):
@@ -19,6 +19,7 @@ class PathSolver(AStar):
         :param game: Das aktuelle Game-Objekt
         """
         self.game = game
+        self.grid = CellGrid.for_size(game.width, game.height)  # internierte Zellen + Nachbartupel
         self.forbidden_cells: set[Cell] = set()  # Zellen, in die wir lieber nicht gehen sollten, z. B. weil dort Schlangen sind
 
     def heuristic_cost_estimate(self, current: Cell, goal: Cell) -> float:
@@ -44,6 +45,15 @@ class PathSolver(AStar):
             return float("inf")
         return 1  # Normalerweise kostet jeder Schritt gleich viel
 
+    def node_key(self, node: Cell) -> int:
+        """
+        Schlüssel für den Knotenspeicher der A*-Suche: flacher Zell-Index statt Cell-Hash.
+
+        :param node: Zelle
+        :return: y * width + x
+        """
+        return node.y * self.game.width + node.x
+
     def neighbors(self, node: Cell) -> Iterable[Cell]:
         """
         Gibt alle gültigen Nachbarzellen der übergebenen Zelle zurück.
@@ -51,42 +61,125 @@ class PathSolver(AStar):
         :param node: Aktuelle Zelle
         :return: Liste von benachbarten Zellen
         """
-        neighbors: list[Cell] = []
-        if node.x > 0:
-            neighbors.append(Cell(node.x - 1, node.y))  # links
-        if node.x < self.game.width - 1:
-            neighbors.append(Cell(node.x + 1, node.y))  # rechts
-        if node.y > 0:
-            neighbors.append(Cell(node.x, node.y - 1))  # unten
-        if node.y < self.game.height - 1:
-            neighbors.append(Cell(node.x, node.y + 1))  # oben
-        return neighbors
+        return self.grid.neighbours_of(node)
+
 
+class GridPathSolver:
+    """
+    Gitter-spezialisierte Wegsuche auf flachen Zell-Indizes (y * width + x).
 
-def next_step(game: Game) -> Cell | None:
+    Statt pro Ziel eine A*-Suche zu starten, findet eine einzige Breitensuche die kürzesten
+    Wege zu allen Zielen gleichzeitig. Die Nachbarn kommen aus einer vorberechneten Tabelle,
+    verbotene Zellen verhalten sich wie beim PathSolver (sie werden nie betreten, und von
+    einem verbotenen Start aus gibt es keinen Weg).
     """
-    Berechnet den besten nächsten Schritt für unsere Schlange, basierend auf A* Pfadfindung.
+    __slots__ = ('width', 'height', 'neighbour_table', 'grid', 'forbidden_cells')
+
+    def __init__(self, width: int, height: int):
+        """
+        Initialisiert den Solver für die Feldgröße.
+
+        :param width: Spielfeldbreite
+        :param height: Spielfeldhöhe
+        """
+        self.width = width
+        self.height = height
+        self.neighbour_table = neighbour_table(width, height)
+        self.grid = CellGrid.for_size(width, height)
+        self.forbidden_cells: set[Cell] = set()
+
+    def neighbors(self, node: Cell) -> tuple[Cell, ...]:
+        """
+        Gibt alle Nachbarzellen der übergebenen Zelle zurück (links, rechts, unten, oben).
+
+        :param node: Aktuelle Zelle
+        :return: Tupel von benachbarten Zellen
+        """
+        return self.grid.neighbours_of(node)
+
+    def paths_to(self, start: Cell, goals: Iterable[Cell]) -> list[tuple[Cell, int, Cell]]:
+        """
+        Sucht die kürzesten Wege vom Start zu allen Zielen in einer Breitensuche.
+
+        :param start: Startzelle (unser Kopf)
+        :param goals: Zielzellen
+        :return: Liste von (erster Schritt, Pfadlänge inkl. Start, erreichtes Ziel)
+        """
+        width = self.width
+        size = width * self.height
+        forbidden = bytearray(size)
+        for cell in self.forbidden_cells:
+            if 0 <= cell.x < width and 0 <= cell.y < self.height:
+                forbidden[cell.y * width + cell.x] = 1
+
+        start_index = start.y * width + start.x
+        remaining = {goal.y * width + goal.x: goal for goal in goals}
+        results: list[tuple[Cell, int, Cell]] = []
+
+        if start_index in remaining:
+            results.append((start, 1, remaining.pop(start_index)))
+        if not remaining or forbidden[start_index]:
+            return results
+
+        table = self.neighbour_table
+        first_step = [-1] * size  # erster Schritt des kürzesten Wegs zu jeder Zelle
+        first_step[start_index] = start_index
+        frontier = [start_index]
+        length = 1
+        while frontier and remaining:
+            length += 1
+            next_frontier = []
+            for cell in frontier:
+                origin = first_step[cell]
+                for n in table[cell]:
+                    if first_step[n] >= 0 or forbidden[n]:
+                        continue
+                    first_step[n] = n if origin == start_index else origin
+                    next_frontier.append(n)
+                    goal = remaining.pop(n, None)
+                    if goal is not None:
+                        results.append((self.grid.cells[first_step[n]], length, goal))
+            frontier = next_frontier
+
+        return results
+
+
+def next_step(game: Game, index: BoardIndex) -> Cell | None:
+    """
+    Berechnet den besten nächsten Schritt für unsere Schlange, basierend auf einer Wegsuche zu allen Futterzielen.
     Bewertet erreichbare Futtersorten, verbotene Felder und den Raum, der nach dem Zug verfügbar ist.
 
     :param game: Aktuelles Game-Objekt
+    :param index: BoardIndex des aktuellen Zugs (Distanzfelder, Kopf-Nachbarschaft, free_turn); dieselben
+        Regeln wie in MoveSafety
     :return: Nächste Zelle, in die sich die Schlange bewegen sollte (oder None)
     """
-    path_solver = PathSolver(game)
+    return plan_step(game, index)[0]
+
+
+def plan_step(game: Game, index: BoardIndex) -> tuple[Cell | None, int]:
+    """
+    Wie next_step, liefert aber zusätzlich die Länge des gewählten Wegs zum Futter.
+
+    :param game: Aktuelles Game-Objekt
+    :param index: BoardIndex des aktuellen Zugs
+    :return: (nächste Zelle oder None, Schritte bis zum Futter; 0 ohne Weg zum Futter)
+    """
+    path_solver = GridPathSolver(game.width, game.height)
+    width, height = game.width, game.height
+
+    # Zug, ab dem jede Zelle frei ist (Schwänze rücken nach), einmal für alle Auswertungen
+    free_turn = index.free_turns()
+
+    def flood_fill_space(cell: Cell) -> int:
+        # Platz ab einem Nachbarn des Kopfes, frei werdende Schwanzfelder zählen mit
+        return timed_space(width, height, free_turn, game.wall_mask, cell.y * width + cell.x)
 
     # Mögliche gültige Food-Zellen bestimmen
     goals: set[Cell] = set()
     for food in game.ownfood:
-        is_valid_food = True
-        for snake in game.snakes:
-            if snake == game.you:
-                continue
-            snake_head = snake.body[0]
-            if food.distance(snake_head) == 1:
-                # Gegner ist näher oder genauso lang => besser vermeiden
-                if food.distance(game.you.body[0]) > 1 or snake.length >= game.you.length:
-                    is_valid_food = False
-                    break
-        if is_valid_food:
+        # Distanzfeld: nur Futter, das wir vor allen Gegnern erreichen (Gleichstand nur als Längere)
+        if index.owns(game.you.game_id, food.x, food.y):
             goals.add(food)
 
     #  Verbotene Felder sammeln
@@ -94,60 +187,38 @@ def next_step(game: Game) -> Cell | None:
     forbidden_cells: set[Cell] = set()
 
     # Berücksichtige Wände als verbotene Zellen
-    width, height = game.width, game.height
     for x in range(width):
-        forbidden_cells.add(Cell(x, 0))  # obere Wand
-        forbidden_cells.add(Cell(x, height - 1))  # untere Wand
+        forbidden_cells.add(Cell.at(x, 0))  # obere Wand
+        forbidden_cells.add(Cell.at(x, height - 1))  # untere Wand
     for y in range(height):
-        forbidden_cells.add(Cell(0, y))  # linke Wand
-        forbidden_cells.add(Cell(width - 1, y))  # rechte Wand
+        forbidden_cells.add(Cell.at(0, y))  # linke Wand
+        forbidden_cells.add(Cell.at(width - 1, y))  # rechte Wand
 
+    # Kopf-an-Kopf: Zellen neben einem mindestens gleich langen Gegnerkopf (Lookup pro Zelle)
+    for cell in (your_head, *path_solver.neighbors(your_head)):
+        if index.head_to_head_danger(game.you.game_id, cell.x, cell.y):
+            forbidden_cells.add(cell)
+
+    # Schlangenteile (auch die eigenen, ohne Kopf), die noch belegt sind, wenn wir ankommen
     for snake in game.snakes:
+        body = iter(snake.body)
         if snake == game.you:
-            continue
-
-        is_by_food = False
-        snake_head = snake.body[0]
-
-        # Direkte Nachbarn vom Kopf der anderen Schlangen
-        for cell in path_solver.neighbors(snake_head):
-            if cell == snake.body[1]:  # Verhindert rückwärts gehen
-                continue
-            if cell in game.ownfood:
-                is_by_food = True  # Wenn Kopf in der Nähe von Futter ist
-            if snake.length >= game.you.length and cell.distance(your_head) < 2:
+            next(body)  # Kopf auslassen
+        for cell in body:
+            if free_turn[cell.y * width + cell.x] >= cell.distance(your_head):
                 forbidden_cells.add(cell)
 
-        # Der restliche Körper der Schlange
-        for i, cell in enumerate(snake.body):
-            move_time = snake.length - i + 1 if is_by_food else snake.length - i
-            if move_time >= cell.distance(your_head):
-                forbidden_cells.add(cell)
-
-    # Auch die eigenen Körperteile als gefährlich markieren
-    for i, cell in enumerate(game.you.body):
-        if i == 0:
-            continue  # Kopf auslassen
-        move_time = game.you.length - i + 1
-        if move_time >= cell.distance(your_head):
-            forbidden_cells.add(cell)
-
     path_solver.forbidden_cells = forbidden_cells
 
-    # Schritt 3: Versuche Pfade zu gültigen Zielen zu berechnen
+    # Schritt 3: Kürzeste Pfade zu allen gültigen Zielen in einer Suche berechnen
     paths: list[tuple[Cell, int, int]] = []
-    for goal in goals:
-        path = path_solver.astar(your_head, goal)
-        if path is None:
-            continue
-        path = list(path)  # Convert to list for indexing
-        length = len(path)
-        first_step = path[1] if length > 1 else path[0]
-        area = flood_fill_space(game, first_step)
+    for first_step, length, _ in path_solver.paths_to(your_head, goals):
+        area = flood_fill_space(first_step)
         paths.append((first_step, length, area))  # Startfeld, Pfadlänge und Platz speichern
 
     # Schritt 4: Entscheide über den nächsten Schritt
     next_cell: Cell | None = None
+    steps = 0
 
     if not paths:
         # Kein Pfad gefunden → suche alternatives sicheres Feld mit größtem Freiraum
@@ -155,7 +226,7 @@ def next_step(game: Game) -> Cell | None:
         for cell in path_solver.neighbors(your_head):
             if cell in forbidden_cells:
                 continue
-            area = flood_fill_space(game, cell)  # Wie viel Platz haben wir dort?
+            area = flood_fill_space(cell)  # Wie viel Platz haben wir dort?
             if area > max_area:
                 max_area = area
                 next_cell = cell
@@ -163,13 +234,14 @@ def next_step(game: Game) -> Cell | None:
         # Wähle den Pfad mit bester Kombination aus Länge und Freiraum
         # Priorität auf kürzere Pfade, aber Raum beachten
         paths.sort(key=lambda x: (x[1], -x[2]))
-        next_cell = paths[0][0]
+        next_cell, length = paths[0][0], paths[0][1]
 
         # Falls gewählter Schritt wenig Platz bietet, prüfe Alternativen
         for candidate in paths[1:]:
-            if flood_fill_space(game, next_cell) < 10 and candidate[2] > paths[0][2]:
-                next_cell = candidate[0]
+            if flood_fill_space(next_cell) < 10 and candidate[2] > paths[0][2]:
+                next_cell, length = candidate[0], candidate[1]
                 break
+        steps = length - 1  # Pfadlänge zählt das Startfeld mit
+
+    return next_cell, steps
 
-    return next_cell
-
@@ -0,0 +1,82 @@
+# Gruppe 3 – Battlesnake Projekt (SS2025)
+# Mitglieder:
+# Eren Temizkan, 223201982
+# Dominik Ide, 220200046
+# Dogukan Karakoyun, 223202023
+# Alexandra Holsten, 221200813
+# Yuxiao Wu, 223200006
+
+from Battlesnake.board_index import BoardIndex
+
+# Reihenfolge der Richtungen = Bit-Position in den Masken
+MOVES = (("up", (0, 1)), ("down", (0, -1)), ("left", (-1, 0)), ("right", (1, 0)))
+
+
+class MoveSafety:
+    """
+    Sicherheit der vier möglichen Züge der eigenen Schlange, als 4-Bit-Masken.
+
+    :ivar legal: Bit gesetzt, wenn das Zielfeld auf dem Brett und jetzt unbelegt ist
+    :ivar free: Bit gesetzt, wenn das Zielfeld auf dem Brett ist und spätestens bei unserer
+        Ankunft frei wird (z. B. ein Schwanz, der nachrückt)
+    :ivar own_tail: Bit gesetzt, wenn das Zielfeld auf dem Brett ist und höchstens von
+        unserem eigenen Schwanzende belegt wird (gegnerische Schwänze zählen als belegt)
+    """
+    __slots__ = ('legal', 'free', 'own_tail')
+
+    def __init__(self, index: BoardIndex):
+        """
+        Bewertet alle vier Richtungen in einem Durchlauf über Belegungsgitter und free_turn.
+
+        :param index: BoardIndex des aktuellen Zugs
+        """
+        head = index.game_state["you"]["body"][0]
+        width = index.width
+        occupancy = index.occupancy
+        free_turn = index.free_turns()
+        tail = index.state.bodies[index.state.you][-1]
+
+        legal = free = own_tail = 0
+        for bit, (_, (dx, dy)) in enumerate(MOVES):
+            x, y = head["x"] + dx, head["y"] + dy
+            if not index.in_bounds(x, y):
+                continue
+            cell = y * width + x
+            if not occupancy[cell]:
+                legal |= 1 << bit
+            if free_turn[cell] <= 1:
+                free |= 1 << bit
+            if occupancy[cell] - (cell == tail) <= 0:
+                own_tail |= 1 << bit
+        self.legal = legal
+        self.free = free
+        self.own_tail = own_tail
+
+    def is_legal(self, move: str) -> bool:
+        """Zielfeld liegt auf dem Brett und ist unbelegt."""
+        return bool(self.legal & (1 << _BITS[move]))
+
+    def will_be_free(self, move: str) -> bool:
+        """Zielfeld liegt auf dem Brett und ist frei, wenn wir ankommen (Schwanz rückt nach)."""
+        return bool(self.free & (1 << _BITS[move]))
+
+    def is_legal_or_own_tail(self, move: str) -> bool:
+        """Zielfeld liegt auf dem Brett und ist unbelegt oder nur unser eigenes Schwanzende."""
+        return bool(self.own_tail & (1 << _BITS[move]))
+
+    def fallback(self, default: str = "up") -> str:
+        """
+        Erster unbelegter Zug in der Reihenfolge up, down, left, right; sonst der erste Zug auf
+        ein Schwanzfeld, das frei wird; sonst default.
+
+        :param default: Zug, wenn keine Richtung sicher ist
+        :return: Zug als String
+        """
+        for mask in (self.legal, self.free):
+            for bit, (move, _) in enumerate(MOVES):
+                if mask & (1 << bit):
+                    return move
+        return default
+
+
+_BITS = {move: bit for bit, (move, _) in enumerate(MOVES)}
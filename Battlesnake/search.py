@@ -0,0 +1,457 @@
+# Gruppe 3 – Battlesnake Projekt (SS2025)
+# Mitglieder:
+# Eren Temizkan, 223201982
+# Dominik Ide, 220200046
+# Dogukan Karakoyun, 223202023
+# Alexandra Holsten, 221200813
+# Yuxiao Wu, 223200006
+
+import itertools
+import typing
+from collections import deque
+
+from Battlesnake.anytime import Deadline, iterative_deepening
+from Battlesnake.bitboard import Bitboard
+from Battlesnake.board_index import BoardIndex, neighbour_table
+from Battlesnake.board_state import BoardState
+from Battlesnake.game import Game
+from Battlesnake.safety import MOVES, MoveSafety
+from Battlesnake.utils import debug
+from Battlesnake.zobrist import EXACT, LOWER, UPPER, TranspositionTable, food_hash, food_keys, health_bucket, snake_keys
+
+MAX_HEALTH = 100
+WIN = 1_000_000            # alle Gegner ausgeschieden
+LOSS = -1_000_000          # eigene Schlange ausgeschieden
+DRAW = -500_000            # alle gleichzeitig ausgeschieden: besser als verlieren
+SPACE_WEIGHT = 10          # Gewicht des erreichbaren Platzes in der Bewertung
+LENGTH_WEIGHT = 20         # Gewicht des Längenvorsprungs vor dem längsten Gegner
+SEARCH_RADIUS = 6          # Gegner mit größerem Kopfabstand bleiben in der Suche stehen
+MAX_OPPONENTS = 2          # höchstens so viele Gegner ziehen in der Suche mit
+MAX_DEPTH = 32             # größte Tiefe in Runden (eigener Zug + Antwort der Gegner)
+MATE_RANGE = 10_000        # Werte so nah an WIN/LOSS/DRAW sind entschiedene Stellungen
+
+
+class SearchBoard:
+    """
+    Veränderliches Spielfeld für die Suche mit make/unmake nach den offiziellen Regeln.
+
+    Körper sind deques (Kopf links), die Belegung zählt Segmente pro Zelle (gestapelte
+    Schwänze zählen doppelt) und wird als Bitmaske mitgeführt. Ein Zug kostet pro Schlange
+    O(1): neuer Kopf, Schwanz entfernen, ggf. Wachstum. Nur eine ausscheidende Schlange wird
+    in O(Länge) vom Feld genommen. Der Zobrist-Hash (siehe zobrist.py) wird in make
+    inkrementell nachgeführt und in unmake aus dem Undo-Eintrag zurückgesetzt.
+
+    :ivar bodies: Körper jeder Schlange als deque von Zellindizes (y * width + x)
+    :ivar health: Lebenspunkte jeder Schlange
+    :ivar alive: Ob die Schlange noch im Spiel ist
+    :ivar occupancy: Anzahl Körpersegmente pro Zelle
+    :ivar body_mask: Bitmaske aller belegten Zellen
+    :ivar food: Futterfelder als Menge von Zellindizes
+    :ivar snake_hash: Zobrist-Hash jeder Schlange
+    :ivar hash: Zobrist-Hash der Stellung (lebende Schlangen und Futter)
+    """
+    __slots__ = ('width', 'height', 'board', 'neighbours', 'bodies', 'health', 'alive',
+                 'occupancy', 'body_mask', 'food', 'keys', 'food_keys', 'snake_hash', 'hash')
+
+    def __init__(self, state: BoardState, game: Game | None = None):
+        """
+        Baut das Suchfeld aus dem BoardState des Zugs.
+
+        :param state: BoardState des aktuellen Zugs
+        :param game: Game der Session; ist es auf demselben Zug, werden seine Hashes übernommen
+        """
+        self.width = state.width
+        self.height = state.height
+        self.board = Bitboard.for_size(state.width, state.height)
+        self.neighbours = neighbour_table(state.width, state.height)
+        self.bodies = [deque(body) for body in state.bodies]
+        self.health = list(state.health)
+        self.alive = [True] * len(self.bodies)
+        self.occupancy = [0] * (state.width * state.height)
+        self.body_mask = 0
+        self.food = set(state.food)
+        for body in self.bodies:
+            for cell in body:
+                self._add(cell)
+
+        cells = state.width * state.height
+        self.keys = [snake_keys(snake_id, cells) for snake_id in state.snake_ids]
+        self.food_keys = food_keys(cells)
+        if (game is not None and game.turn == state.turn
+                and all(snake_id in game.snakes_by_id for snake_id in state.snake_ids)):
+            self.snake_hash = [game.snakes_by_id[snake_id].zobrist for snake_id in state.snake_ids]
+        else:
+            self.snake_hash = [keys.hash(body, health)
+                               for keys, body, health in zip(self.keys, state.bodies, state.health)]
+        self.hash = food_hash(state.food, cells)
+        for value in self.snake_hash:
+            self.hash ^= value
+
+    def _add(self, cell: int) -> None:
+        if not self.occupancy[cell]:
+            self.body_mask |= 1 << cell
+        self.occupancy[cell] += 1
+
+    def _remove(self, cell: int) -> None:
+        self.occupancy[cell] -= 1
+        if not self.occupancy[cell]:
+            self.body_mask &= ~(1 << cell)
+
+    def moves(self, slot: int, tails: typing.Container[int] = ()) -> list[int]:
+        """
+        Zielfelder der Schlange, die nicht sofort tödlich sind (wie MoveSafety.will_be_free):
+        unbelegte Felder und Schwänze, die in diesem Zug nachrücken.
+
+        :param slot: Position der Schlange
+        :param tails: Schwänze, die in diesem Zug frei werden (siehe tails)
+        :return: Liste von Zellindizes
+        """
+        occupancy = self.occupancy
+        return [cell for cell in self.neighbours[self.bodies[slot][0]]
+                if not occupancy[cell] or (occupancy[cell] == 1 and cell in tails)]
+
+    def tails(self, slots: typing.Iterable[int]) -> set[int]:
+        """
+        Schwänze der ziehenden Schlangen, die im nächsten Zug frei werden (nicht gestapelt).
+
+        :param slots: Positionen der Schlangen, die in diesem Zug ziehen
+        :return: Menge von Zellindizes
+        """
+        bodies = self.bodies
+        return {bodies[slot][-1] for slot in slots
+                if self.alive[slot] and len(bodies[slot]) > 1 and bodies[slot][-1] != bodies[slot][-2]}
+
+    def make(self, targets: typing.Dict[int, int | None]) -> tuple:
+        """
+        Führt einen gleichzeitigen Zug aller Schlangen in targets aus.
+
+        Reihenfolge wie in den Standardregeln: bewegen, Lebenspunkte abziehen, fressen
+        (Lebenspunkte auf 100, Schwanz verdoppeln, Futter entfernen), danach ausscheiden
+        (Hunger, Kollision mit einem Körper, verlorener Kopf-an-Kopf-Zusammenstoß).
+        Schlangen ohne Eintrag bleiben stehen.
+
+        :param targets: Position der Schlange -> neues Kopffeld (None = kein Zug möglich oder Wand)
+        :return: Undo-Eintrag für unmake
+        """
+        bodies = self.bodies
+        saved = (self.hash, self.snake_hash[:])
+        moved = []
+        for slot, target in targets.items():
+            if target is None:
+                continue
+            body = bodies[slot]
+            keys = self.keys[slot]
+            self.hash ^= self.snake_hash[slot]
+            self.snake_hash[slot] ^= (keys.head[body[0]] ^ keys.length[len(body)]
+                                      ^ keys.health[health_bucket(self.health[slot])])
+            tail = body.pop()
+            self._remove(tail)
+            body.appendleft(target)
+            self._add(target)
+            self.snake_hash[slot] ^= keys.body[tail] ^ keys.body[target] ^ keys.head[target]
+            moved.append((slot, tail, self.health[slot]))
+            self.health[slot] -= 1
+
+        eaten = set()
+        grown = []
+        for slot, _, _ in moved:
+            body = bodies[slot]
+            if body[0] in self.food:
+                if body[0] not in eaten:
+                    self.hash ^= self.food_keys[body[0]]
+                eaten.add(body[0])
+                grown.append(slot)
+                self.health[slot] = MAX_HEALTH
+                body.append(body[-1])
+                self._add(body[-1])
+                self.snake_hash[slot] ^= self.keys[slot].body[body[-1]]
+        self.food -= eaten
+
+        for slot, _, _ in moved:
+            keys = self.keys[slot]
+            self.snake_hash[slot] ^= keys.length[len(bodies[slot])] ^ keys.health[health_bucket(self.health[slot])]
+            self.hash ^= self.snake_hash[slot]
+
+        # Wie in den Standardregeln zuerst Hunger und Wand: diese Schlangen blockieren bei den
+        # Kollisionen danach niemanden mehr
+        eliminated = [slot for slot, target in targets.items() if target is None]
+        eliminated += [slot for slot, _, _ in moved if self.health[slot] <= 0]
+        self._eliminate(eliminated)
+
+        heads: dict[int, list[int]] = {}
+        for slot, _, _ in moved:
+            if self.alive[slot]:
+                heads.setdefault(bodies[slot][0], []).append(slot)
+        collided = []
+        for head, rivals in heads.items():
+            for slot in rivals:
+                if (self.occupancy[head] > len(rivals)
+                        or any(other != slot and len(bodies[other]) >= len(bodies[slot]) for other in rivals)):
+                    collided.append(slot)
+        self._eliminate(collided)
+        return moved, grown, eaten, eliminated + collided, saved
+
+    def _eliminate(self, slots: list[int]) -> None:
+        """Nimmt die Schlangen vom Feld (Körper bleibt für unmake in der deque)."""
+        for slot in slots:
+            self.alive[slot] = False
+            self.hash ^= self.snake_hash[slot]
+            for cell in self.bodies[slot]:
+                self._remove(cell)
+
+    def unmake(self, undo: tuple) -> None:
+        """
+        Nimmt einen Zug von make vollständig zurück.
+
+        :param undo: Rückgabe von make
+        """
+        moved, grown, eaten, eliminated, (self.hash, self.snake_hash) = undo
+        bodies = self.bodies
+        for slot in eliminated:
+            self.alive[slot] = True
+            for cell in bodies[slot]:
+                self._add(cell)
+        self.food |= eaten
+        for slot in grown:
+            self._remove(bodies[slot].pop())
+        for slot, tail, health in reversed(moved):
+            body = bodies[slot]
+            self._remove(body.popleft())
+            body.append(tail)
+            self._add(tail)
+            self.health[slot] = health
+
+    def add_food(self, cells: typing.Iterable[int]) -> None:
+        """
+        Legt neues Futter aufs Feld (Futter-Spawn im Simulator) und führt den Hash nach.
+
+        :param cells: Zellindizes der neuen Futterfelder
+        """
+        for cell in cells:
+            if cell not in self.food:
+                self.food.add(cell)
+                self.hash ^= self.food_keys[cell]
+
+    def space(self, slot: int) -> int:
+        """Erreichbare freie Zellen vom Kopf der Schlange aus (Flood-Fill über die Bitmaske)."""
+        head = 1 << self.bodies[slot][0]
+        free = (self.board.full & ~self.body_mask) | head
+        return self.board.count(self.board.flood(free, head)) - 1
+
+
+class Search:
+    """
+    Paranoide Suche über gleichzeitige Züge mit Alpha-Beta.
+
+    Eine Runde besteht aus unserem Zug (Max-Knoten) und der gemeinsamen Antwort der
+    mitziehenden Gegner (Min-Knoten), die unseren Zug kennen. Mitgezogen werden nur die
+    MAX_OPPONENTS nächsten Gegner innerhalb von SEARCH_RADIUS; alle anderen bleiben stehen.
+    Die Blattbewertung nutzt die Heatmap am eigenen Kopf, den erreichbaren Platz und den
+    Längenvorsprung. Zu Beginn jeder Runde wird die Transpositionstabelle befragt: ein
+    ausreichend tiefer Eintrag beendet den Knoten, sonst wird sein bester Zug zuerst versucht.
+
+    :ivar nodes: Anzahl der besuchten Knoten
+    :ivar table: Transpositionstabelle (aus der GameSession oder neu)
+    """
+
+    def __init__(self, state: BoardState, heatmap, deadline: Deadline,
+                 root_moves: list[str] | None = None,
+                 table: TranspositionTable | None = None,
+                 game: Game | None = None):
+        """
+        :param state: BoardState des aktuellen Zugs
+        :param heatmap: Heatmap des Zugs (heatmap[x][y])
+        :param deadline: Zeitbudget des Zugs
+        :param root_moves: erlaubte eigene Züge an der Wurzel (Standard: alle auf dem Brett)
+        :param table: Transpositionstabelle, die über die Züge erhalten bleibt
+        :param game: Game der Session (liefert die Zobrist-Hashes der Wurzel)
+        """
+        self.board = SearchBoard(state, game)
+        self.table = table if table is not None else TranspositionTable()
+        self.deadline = deadline
+        self.you = state.you
+        self.width = state.width
+        self.values = [int(heatmap[cell % state.width][cell // state.width])
+                       for cell in range(state.width * state.height)]
+        self.opponents = self._opponents(state)
+        self.nodes = 0
+
+        head = state.head(state.you)
+        hx, hy = head % state.width, head // state.width
+        self.root = {}
+        for name, (dx, dy) in MOVES:
+            x, y = hx + dx, hy + dy
+            if 0 <= x < state.width and 0 <= y < state.height:
+                if root_moves is None or name in root_moves:
+                    self.root[name] = y * state.width + x
+        self.best: str | None = None
+
+    def _opponents(self, state: BoardState) -> list[int]:
+        """Die nächsten Gegner innerhalb von SEARCH_RADIUS (Manhattan-Abstand der Köpfe)."""
+        width = state.width
+        head = state.head(state.you)
+        hx, hy = head % width, head // width
+        near = []
+        for slot in range(len(state.bodies)):
+            if slot == state.you:
+                continue
+            other = state.head(slot)
+            distance = abs(other % width - hx) + abs(other // width - hy)
+            if distance <= SEARCH_RADIUS:
+                near.append((distance, slot))
+        return [slot for _, slot in sorted(near)[:MAX_OPPONENTS]]
+
+    def best_move(self, depth: int) -> str | None:
+        """
+        Sucht bis zur Tiefe depth (in Runden) und liefert den besten eigenen Zug.
+
+        :param depth: Suchtiefe in Runden
+        :return: Zug als String (None, wenn kein Zug bleibt)
+        :raises SearchTimeout: wenn das Zeitbudget während der Suche abläuft
+        """
+        key = self.board.hash
+        entry = self.table.probe(key)
+        hint = self.root.get(self.best) if self.best else (entry[3] if entry else None)
+        order = sorted(self.root, key=lambda name: (self.root[name] != hint, -self.values[self.root[name]]))
+        best, alpha = None, LOSS - 1
+        for name in order:
+            score = self._reply(self.root[name], depth, alpha, WIN + 1, 1)
+            if score > alpha:
+                best, alpha = name, score
+        if best is not None:
+            self.table.store(key, depth, _to_table(alpha, 0), EXACT, self.root[best])
+        self.best = best
+        return best
+
+    def _turn(self, depth: int, alpha: int, beta: int, ply: int) -> int:
+        """Max-Knoten: unser Zug in einer neuen Runde (mit Transpositionstabelle)."""
+        board = self.board
+        key = board.hash
+        hint = None
+        entry = self.table.probe(key)
+        if entry is not None:
+            stored_depth, score, flag, hint, current = entry
+            # Schranken nur aus der laufenden Suche, ältere Einträge liefern nur den Zughinweis
+            if current and stored_depth >= depth:
+                score = _from_table(score, ply)
+                if flag == EXACT or (flag == LOWER and score >= beta) or (flag == UPPER and score <= alpha):
+                    return score
+
+        moves = board.moves(self.you, board.tails([self.you] + self.opponents))
+        if not moves:
+            return self._reply(None, depth, alpha, beta, ply)
+        values = self.values
+        moves.sort(key=lambda cell: (cell != hint, -values[cell]))
+        best = None
+        for target in moves:
+            score = self._reply(target, depth, alpha, beta, ply)
+            if score > alpha:
+                alpha, best = score, target
+                if alpha >= beta:
+                    break
+        flag = LOWER if alpha >= beta else (EXACT if best is not None else UPPER)
+        self.table.store(key, depth, _to_table(alpha, ply), flag, best)
+        return alpha
+
+    def _reply(self, target: int | None, depth: int, alpha: int, beta: int, ply: int) -> int:
+        """Min-Knoten: alle gemeinsamen Antworten der Gegner auf unseren Zug target."""
+        board = self.board
+        opponents = [slot for slot in self.opponents if board.alive[slot]]
+        our_head = target if target is not None else board.bodies[self.you][0]
+        width = self.width
+        tails = board.tails([self.you] + opponents)
+        choices = []
+        for slot in opponents:
+            moves = board.moves(slot, tails)
+            # Züge Richtung unseres Kopfes zuerst: die gefährlichsten Antworten schneiden früh ab
+            moves.sort(key=lambda cell: abs(cell % width - our_head % width) + abs(cell // width - our_head // width))
+            choices.append(moves or [None])
+
+        for replies in itertools.product(*choices):
+            self.deadline.check()
+            self.nodes += 1
+            targets = {self.you: target}
+            targets.update(zip(opponents, replies))
+            undo = board.make(targets)
+            try:
+                score = self._terminal(ply)
+                if score is None:
+                    score = self._evaluate() if depth <= 1 else self._turn(depth - 1, alpha, beta, ply + 1)
+            finally:
+                board.unmake(undo)
+            if score < beta:
+                beta = score
+                if beta <= alpha:
+                    break
+        return beta
+
+    def _terminal(self, ply: int) -> int | None:
+        """Wert einer entschiedenen Stellung (früher Sieg / später Tod bevorzugt), sonst None."""
+        board = self.board
+        others = any(alive for slot, alive in enumerate(board.alive) if slot != self.you)
+        if not board.alive[self.you]:
+            return (LOSS if others else DRAW) + ply
+        if not others:
+            return WIN - ply
+        return None
+
+    def _evaluate(self) -> int:
+        """Blattbewertung: Heatmap am Kopf, erreichbarer Platz und Längenvorsprung."""
+        board = self.board
+        body = board.bodies[self.you]
+        longest = max((len(b) for slot, b in enumerate(board.bodies)
+                       if slot != self.you and board.alive[slot]), default=0)
+        space = min(board.space(self.you), 2 * len(body))
+        return self.values[body[0]] + SPACE_WEIGHT * space + LENGTH_WEIGHT * (len(body) - longest)
+
+
+def _to_table(score: int, ply: int) -> int:
+    """Entschiedene Werte relativ zum Knoten speichern, damit sie in jeder Tiefe gelten."""
+    if score >= WIN - MATE_RANGE:
+        return score + ply
+    if score <= DRAW + MATE_RANGE:
+        return score - ply
+    return score
+
+
+def _from_table(score: int, ply: int) -> int:
+    """Gegenstück zu _to_table."""
+    if score >= WIN - MATE_RANGE:
+        return score - ply
+    if score <= DRAW + MATE_RANGE:
+        return score + ply
+    return score
+
+
+def search_move(index: BoardIndex, heatmap, deadline: Deadline,
+                max_depth: int = MAX_DEPTH,
+                table: TranspositionTable | None = None,
+                game: Game | None = None) -> tuple[str | None, int, int]:
+    """
+    Iterativ vertiefende Suche für den aktuellen Zug, so tief wie das Zeitbudget reicht.
+
+    An der Wurzel sind nur Züge erlaubt, die die Sicherheitsprüfung (MoveSafety) besteht:
+    zuerst unbelegte Felder, sonst nachrückende Schwänze.
+
+    :param index: BoardIndex des aktuellen Zugs
+    :param heatmap: Heatmap des Zugs (heatmap[x][y])
+    :param deadline: Zeitbudget des Zugs
+    :param max_depth: größte Tiefe in Runden
+    :param table: Transpositionstabelle der GameSession (Standard: eine neue pro Aufruf)
+    :param game: Game der Session (liefert die Zobrist-Hashes der Wurzel)
+    :return: (bester Zug oder None, erreichte Tiefe, besuchte Knoten)
+    """
+    state = index.state
+    safety = MoveSafety(index)
+    root_moves = ([name for name, _ in MOVES if safety.is_legal(name)]
+                  or [name for name, _ in MOVES if safety.will_be_free(name)])
+    if not root_moves:
+        return None, 0, 0
+
+    search = Search(state, heatmap, deadline, root_moves, table, game)
+    search.table.new_search()
+    fallback = max(root_moves, key=lambda name: search.values[search.root[name]])
+    move, depth = iterative_deepening(deadline, search.best_move, fallback, max_depth)
+    debug(f"[Search] Tiefe {depth}, {search.nodes} Knoten, {search.table.hits} TT-Treffer, "
+          f"Gegner {search.opponents} → {move}")
+    return move, depth, search.nodes
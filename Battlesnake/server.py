@@ -7,14 +7,33 @@
 # Yuxiao Wu, 223200006
 
 import logging
+import multiprocessing
 import os
 import typing
 
 from flask import Flask, request
 
+from Battlesnake.board_state import BoardState, loads
+from Battlesnake.utils import debug
 
+# SERVER_MODE=production startet einen vorforkenden gunicorn-Server statt des Flask-Dev-Servers
+SERVER_MODE = os.environ.get("SERVER_MODE", "development")
 
-def run_server(handlers: typing.Dict):
+# Entscheidungsmodi, deren Zustand (Transpositionstabelle, MCTS-Baum) über die Züge eines
+# Spiels weiterverwendet wird und nur in einem einzigen Prozess Sinn ergibt
+STATEFUL_MODES = ("search", "mcts")
+
+# Feldgrößen, deren Tabellen vor dem Forken einmal berechnet werden
+STANDARD_SIZES = ((7, 7), (11, 11), (19, 19), (25, 25))
+
+
+def create_app(handlers: typing.Dict) -> Flask:
+    """
+    Baut die Flask-App mit den Routen info/start/move/end.
+
+    :param handlers: Dictionary mit den Funktionen "info", "start", "move" und "end"
+    :return: Flask-App (WSGI)
+    """
     app = Flask(__name__)
 
     @app.get("/")
@@ -23,18 +42,19 @@ def run_server(handlers: typing.Dict):
 
     @app.post("/start")
     def on_start():
-        game_state = request.get_json()
+        game_state = loads(request.get_data())
         handlers["start"](game_state)
         return "ok"
 
     @app.post("/move")
     def on_move():
-        game_state = request.get_json()
-        return handlers["move"](game_state)
+        # Body direkt in den kompakten BoardState dekodieren (orjson, falls installiert)
+        state = BoardState.decode(request.get_data())
+        return handlers["move"](state.game_state, state)
 
     @app.post("/end")
     def on_end():
-        game_state = request.get_json()
+        game_state = loads(request.get_data())
         handlers["end"](game_state)
         return "ok"
 
@@ -45,10 +65,90 @@ def run_server(handlers: typing.Dict):
         )
         return response
 
+    return app
+
+
+def preload_tables(sizes=STANDARD_SIZES) -> None:
+    """
+    Füllt die größenabhängigen Caches (Nachbartabellen, Bitboards, Zellen, Heatmap-Templates)
+    im Elternprozess, damit alle Worker sie nach dem Fork per Copy-on-Write teilen.
+
+    :param sizes: Feldgrößen als (width, height)
+    """
+    from Battlesnake.bitboard import Bitboard
+    from Battlesnake.board_index import neighbour_table
+    from Battlesnake.board_template import BoardTemplate
+    from Battlesnake.game import CellGrid
+
+    for width, height in sizes:
+        neighbour_table(width, height)
+        Bitboard.for_size(width, height)
+        CellGrid.for_size(width, height)
+        BoardTemplate.for_size(width, height)
+
+
+def server_workers() -> int:
+    """
+    Anzahl gunicorn-Worker im Produktionsmodus (WEB_CONCURRENCY, Standard 1).
+
+    Sessions (Game, Heatmap, Transpositionstabelle, MCTS-Baum) leben im Speicher eines
+    Workers, gunicorn verteilt die Züge eines Spiels aber reihum. Mit mehreren Workern baut
+    daher fast jeder /move seine Session neu auf. Standard ist deshalb ein Worker mit
+    Threads; für DECISION_MODE=search/mcts wird ein Worker erzwungen.
+
+    :return: Anzahl Worker
+    """
+    workers = max(1, int(os.environ.get("WEB_CONCURRENCY", 1)))
+    if workers > 1 and os.environ.get("DECISION_MODE", "heatmap") in STATEFUL_MODES:
+        debug(f"[server] WEB_CONCURRENCY={workers} ignoriert: DECISION_MODE braucht einen Worker")
+        return 1
+    return workers
+
+
+def serve(app: Flask, host: str, port: int) -> None:
+    """
+    Startet die App im gewählten Modus.
+
+    development: Flask-Dev-Server mit Debug-Modus (ein Prozess, Reloader).
+    production: gunicorn mit preload_app; App, ML-Modell und Tabellen werden einmal im
+    Elternprozess geladen. Standard ist ein gthread-Worker mit WEB_THREADS Threads
+    (Standard: Anzahl CPUs), damit alle Züge eines Spiels dieselbe Session treffen;
+    Anzahl Worker siehe server_workers.
+
+    :param app: Flask-App
+    :param host: Adresse
+    :param port: Port
+    """
+    if SERVER_MODE != "production":
+        app.run(host=host, port=port, debug=True)
+        return
+
+    from gunicorn.app.base import BaseApplication
+
+    class ProductionServer(BaseApplication):
+        def load_config(self):
+            self.cfg.set("bind", f"{host}:{port}")
+            self.cfg.set("workers", server_workers())
+            self.cfg.set("worker_class", "gthread")
+            self.cfg.set("threads", int(os.environ.get("WEB_THREADS", multiprocessing.cpu_count())))
+            self.cfg.set("preload_app", True)
+            self.cfg.set("timeout", 30)
+            self.cfg.set("accesslog", None)
+
+        def load(self):
+            return app
+
+    preload_tables()
+    ProductionServer().run()
+
+
+def run_server(handlers: typing.Dict):
+    app = create_app(handlers)
+
     host = "0.0.0.0"
     port = int(os.environ.get("PORT", "8000"))
 
     logging.getLogger("werkzeug").setLevel(logging.ERROR)
 
-    print(f"\nBattlesnake active at http://{host}:{port}")
-    app.run(host=host, port=port, debug=True)
+    print(f"\nBattlesnake active at http://{host}:{port} ({SERVER_MODE})")
+    serve(app, host, port)
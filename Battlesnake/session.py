@@ -0,0 +1,212 @@
+# Gruppe 3 – Battlesnake Projekt (SS2025)
+# Mitglieder:
+# Eren Temizkan, 223201982
+# Dominik Ide, 220200046
+# Dogukan Karakoyun, 223202023
+# Alexandra Holsten, 221200813
+# Yuxiao Wu, 223200006
+
+import threading
+import time
+import typing
+from collections import OrderedDict
+
+from Battlesnake.board_index import neighbour_table
+from Battlesnake.board_template import BoardTemplate
+from Battlesnake.game import Game, CellGrid
+from Battlesnake.heatmap_array import IncrementalHeatmap
+from Battlesnake.mcts import Tree
+from Battlesnake.utils import debug
+from Battlesnake.zobrist import TranspositionTable
+
+
+class GameSession:
+    """
+    Zustand eines laufenden Spiels, der über alle Züge hinweg erhalten bleibt.
+
+    Hält das Game-Objekt, das pro Zug nur noch inkrementell weitergeschoben wird,
+    sowie alle Tabellen, die nur von der Feldgröße abhängen, und das ML-Modell.
+
+    :ivar game: Aktuelles Game-Objekt
+    :ivar grid: Internierte Zellen und Nachbartupel der Feldgröße
+    :ivar neighbours: Nachbartabelle als flache Indizes
+    :ivar template: Statische Heatmap-Layer und Distanzgitter der Feldgröße
+    :ivar heatmap: Heatmap, die pro Zug nur um die Änderungen korrigiert wird
+    :ivar model: Geladenes ML-Modell (oder None)
+    :ivar last_compute_ms: Eigene Rechenzeit des letzten Zugs (für das Zeitbudget)
+    :ivar table: Transpositionstabelle der Suche; die Suche des letzten Zugs wärmt die nächste
+        (wird erst beim ersten Zugriff angelegt)
+    :ivar tree: MCTS-Baum; das Kind des gespielten Zugs wird zur nächsten Wurzel
+        (wird erst beim ersten Zugriff angelegt)
+    """
+    __slots__ = ('game_id', 'game', 'grid', 'neighbours', 'template', 'heatmap', 'model', 'last_used',
+                 'last_compute_ms', '_table', '_tree')
+
+    def __init__(self, game_state: typing.Dict, model=None):
+        """
+        Eröffnet die Session aus dem ersten Spielzustand (/start oder erster /move).
+
+        :param game_state: JSON-Zustand des Spiels
+        :param model: ML-Modell, das in dieser Session verwendet wird
+        """
+        width = game_state['board']['width']
+        height = game_state['board']['height']
+        self.game_id: str = game_state['game']['id']
+        self.game = Game(game_state)
+        self.grid = CellGrid.for_size(width, height)
+        self.neighbours = neighbour_table(width, height)
+        self.template = BoardTemplate.for_size(width, height)
+        self.heatmap = IncrementalHeatmap(self.game, self.template)
+        self.model = model
+        self.last_used = time.monotonic()
+        self.last_compute_ms: float | None = None
+        self._table: TranspositionTable | None = None
+        self._tree: Tree | None = None
+
+    @property
+    def table(self) -> TranspositionTable:
+        """Transpositionstabelle; nur im Suchmodus gebraucht, daher erst hier angelegt."""
+        if self._table is None:
+            self._table = TranspositionTable()
+        return self._table
+
+    @property
+    def tree(self) -> Tree:
+        """MCTS-Baum; nur im MCTS-Modus gebraucht, daher erst hier angelegt."""
+        if self._tree is None:
+            self._tree = Tree()
+        return self._tree
+
+    def fits(self, game_state: typing.Dict) -> bool:
+        """
+        Prüft, ob der Spielzustand zu dieser Session gehören kann: gleiche Feldgröße und kein
+        neuer Spielbeginn (Zug 0) nach bereits gespielten Zügen. Sonst passen Gitter, Heatmap,
+        Transpositionstabelle und Baum nicht mehr und die ganze Session wird neu eröffnet.
+
+        :param game_state: JSON-Zustand des Spiels
+        :return: True, wenn die Session weiterverwendet werden kann
+        """
+        board = game_state['board']
+        if (board['width'], board['height']) != (self.template.width, self.template.height):
+            return False
+        return int(game_state['turn']) != 0 or self.game.turn == 0
+
+    def advance(self, game_state: typing.Dict) -> Game:
+        """
+        Bringt das Game-Objekt auf den Stand des neuen Zugs.
+
+        Folgt der Zug direkt auf den letzten, wird nur das Delta (neue Köpfe, Schwänze,
+        Futter) verarbeitet. Bei Lücken oder Abweichungen wird das Game neu aufgebaut.
+        Die Heatmap der Session wird anschließend mit denselben Änderungen nachgezogen.
+
+        :param game_state: JSON-Zustand des neuen Zugs
+        :return: Aktuelles Game-Objekt
+        """
+        self.last_used = time.monotonic()
+        self.game = self._advance_game(game_state)
+        self.heatmap.advance(self.game)
+        return self.game
+
+    def _advance_game(self, game_state: typing.Dict) -> Game:
+        """Inkrementelles update() oder Neuaufbau des Game-Objekts (siehe advance)."""
+        turn = int(game_state['turn'])
+
+        if turn == self.game.turn and self.game.matches(game_state):
+            return self.game  # gleicher Zug noch einmal angefragt
+
+        if turn == self.game.turn + 1:
+            self.game.update(game_state)
+            if self.game.matches(game_state):
+                return self.game
+            debug(f"[session] Game {self.game_id} nach update() nicht synchron → neu aufbauen")
+
+        return Game(game_state)
+
+
+def session_key(game_state: typing.Dict) -> tuple[str, str]:
+    """
+    Schlüssel einer Session: game.id und you.id. Spielen mehrere eigene Schlangen im selben
+    Spiel (z. B. im Simulator), bekommt jede ihre eigene Session.
+
+    :param game_state: JSON-Zustand des Spiels
+    :return: (game.id, you.id)
+    """
+    return game_state['game']['id'], game_state['you']['id']
+
+
+class SessionStore:
+    """
+    Speicher für GameSessions, Schlüssel ist (game.id, you.id).
+
+    Sessions werden bei /end entfernt, nach ttl Sekunden ohne Zug verworfen und bei
+    mehr als max_sessions gleichzeitig nach LRU verdrängt.
+    """
+
+    def __init__(self, max_sessions: int = 32, ttl: float = 300.0):
+        """
+        :param max_sessions: Maximale Anzahl gleichzeitiger Sessions
+        :param ttl: Sekunden ohne Zugriff, nach denen eine Session verfällt
+        """
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self._sessions: OrderedDict[tuple[str, str], GameSession] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def open(self, game_state: typing.Dict, model=None) -> GameSession:
+        """
+        Eröffnet (oder ersetzt) die Session für das Spiel.
+
+        :param game_state: JSON-Zustand des Spiels
+        :param model: ML-Modell für die Session
+        :return: Neue GameSession
+        """
+        session = GameSession(game_state, model)
+        key = session_key(game_state)
+        with self._lock:
+            self._sessions[key] = session
+            self._sessions.move_to_end(key)
+            self._evict()
+        debug(f"[session] Session {session.game_id} eröffnet ({len(self._sessions)} aktiv)")
+        return session
+
+    def get(self, game_state: typing.Dict, model=None) -> GameSession:
+        """
+        Liefert die Session des Spiels und eröffnet sie neu, falls /start verpasst wurde oder
+        die gespeicherte Session nicht mehr passt (siehe GameSession.fits).
+
+        :param game_state: JSON-Zustand des Spiels
+        :param model: ML-Modell, falls die Session neu eröffnet wird
+        :return: GameSession
+        """
+        key = session_key(game_state)
+        with self._lock:
+            self._evict()
+            session = self._sessions.get(key)
+            if session is not None:
+                self._sessions.move_to_end(key)
+        if session is None or not session.fits(game_state):
+            session = self.open(game_state, model)
+        return session
+
+    def close(self, game_state: typing.Dict) -> None:
+        """
+        Entfernt die Session am Spielende.
+
+        :param game_state: JSON-Zustand des Spiels
+        """
+        with self._lock:
+            self._sessions.pop(session_key(game_state), None)
+
+    def _evict(self) -> None:
+        """Verwirft abgelaufene Sessions und verdrängt die ältesten über dem Limit."""
+        now = time.monotonic()
+        for key in [key for key, s in self._sessions.items() if now - s.last_used > self.ttl]:
+            del self._sessions[key]
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+
+
+sessions = SessionStore()
@@ -0,0 +1,257 @@
+# Gruppe 3 – Battlesnake Projekt (SS2025)
+# Mitglieder:
+# Eren Temizkan, 223201982
+# Dominik Ide, 220200046
+# Dogukan Karakoyun, 223202023
+# Alexandra Holsten, 221200813
+# Yuxiao Wu, 223200006
+
+import itertools
+import random
+import typing
+
+from Battlesnake.board_state import BoardState
+from Battlesnake.safety import MOVES
+from Battlesnake.search import SearchBoard
+from Battlesnake.utils import debug
+
+START_LENGTH = 3
+FIXED_SIZES = (7, 11, 19)  # Feldgrößen mit festen Startpositionen (wie die offizielle Engine)
+MEDIUM_SIZE = 11
+
+_game_numbers = itertools.count(1)  # laufende Nummer für eindeutige game.id pro Simulator
+
+MoveFunction = typing.Callable[[typing.Dict], typing.Dict]
+
+
+class Result:
+    """
+    Ergebnis eines simulierten Spiels.
+
+    :ivar winner: Name der letzten Schlange (None bei Unentschieden)
+    :ivar turns: Anzahl gespielter Züge
+    :ivar eliminated: Name -> Zug, in dem die Schlange ausgeschieden ist
+    """
+    __slots__ = ('winner', 'turns', 'eliminated')
+
+    def __init__(self, winner: str | None, turns: int, eliminated: typing.Dict[str, int]):
+        self.winner = winner
+        self.turns = turns
+        self.eliminated = eliminated
+
+    def __repr__(self):
+        return f'Result(winner={self.winner}, turns={self.turns}, eliminated={self.eliminated})'
+
+
+class Simulator:
+    """
+    Lokale Engine für die Standardregeln, ohne HTTP.
+
+    Die Regeln (bewegen, Lebenspunkte, fressen, ausscheiden) kommen aus SearchBoard.make, das
+    auch die Suche verwendet; der Simulator ergänzt Startaufstellung, Futter-Spawn und das
+    Spielende. Jede Schlange bekommt pro Zug ein game_state-Dictionary im Format der API und
+    ihre move-Funktion wird direkt aufgerufen. Mit demselben Seed (und deterministischen
+    move-Funktionen) verläuft ein Spiel immer gleich.
+    """
+
+    def __init__(self,
+                 players: typing.Sequence[tuple[str, MoveFunction]],
+                 width: int = 11,
+                 height: int = 11,
+                 seed: int = 0,
+                 minimum_food: int = 1,
+                 food_spawn_chance: int = 15,
+                 timeout: int = 500,
+                 max_turns: int | None = None):
+        """
+        :param players: (Name, move-Funktion) pro Schlange; die Funktion erhält game_state
+            und liefert {"move": ...} wie strategy.move
+        :param width: Spielfeldbreite
+        :param height: Spielfeldhöhe
+        :param seed: Seed für Startaufstellung und Futter
+        :param minimum_food: Mindestanzahl Futter auf dem Feld
+        :param food_spawn_chance: Chance in Prozent für ein zusätzliches Futter pro Zug
+        :param timeout: Timeout, der im game_state steht
+        :param max_turns: Abbruch nach so vielen Zügen (None = bis zum Spielende)
+        """
+        self.players = list(players)
+        self.width = width
+        self.height = height
+        self.seed = seed
+        self.minimum_food = minimum_food
+        self.food_spawn_chance = food_spawn_chance
+        self.timeout = timeout
+        self.max_turns = max_turns
+        self.game = {
+            "ruleset": {"name": "standard", "version": "v1.2.3",
+                        "settings": {"foodSpawnChance": food_spawn_chance, "minimumFood": minimum_food,
+                                     "hazardDamagePerTurn": 0}},
+            "map": "standard",
+            "timeout": timeout,
+            "source": "custom",
+        }
+        self.reset()
+
+    def reset(self) -> None:
+        """Stellt die Schlangen auf und legt das Startfutter (wie die offizielle Engine)."""
+        self.rng = random.Random(self.seed)
+        # Jedes Spiel bekommt eine eigene game.id, sonst fände strategy.move die Session eines früheren Spiels
+        self.game["id"] = f"sim-{self.seed}-{self.width}x{self.height}-{next(_game_numbers)}"
+        self.turn = 0
+        self.last_moves = ["up"] * len(self.players)
+        self.eliminated: dict[str, int] = {}
+
+        starts = self._start_positions()
+        state = {
+            "game": self.game, "turn": 0,
+            "board": {"width": self.width, "height": self.height, "food": [], "hazards": [],
+                      "snakes": [{"id": f"snake-{slot}", "health": 100, "body": [dict(x=x, y=y)] * START_LENGTH}
+                                 for slot, (x, y) in enumerate(starts)]},
+            "you": {"id": "snake-0"},
+        }
+        self.board = SearchBoard(BoardState(state))
+        self.board.add_food(self._start_food(starts))
+
+    def _start_positions(self) -> list[tuple[int, int]]:
+        """Feste Startpunkte (Ecken, dann Seitenmitten) auf Standardfeldern, sonst zufällig."""
+        rng = self.rng
+        count = len(self.players)
+        if self.width == self.height and self.width in FIXED_SIZES and count <= 8:
+            low, mid, high = 1, (self.width - 1) // 2, self.width - 2
+            corners = [(low, low), (low, high), (high, low), (high, high)]
+            cardinals = [(low, mid), (mid, low), (mid, high), (high, mid)]
+            rng.shuffle(corners)
+            rng.shuffle(cardinals)
+            points = corners + cardinals if rng.randrange(2) == 0 else cardinals + corners
+            return points[:count]
+        even = [(x, y) for x in range(self.width) for y in range(self.height) if (x + y) % 2 == 0]
+        return rng.sample(even, count)
+
+    def _start_food(self, starts: list[tuple[int, int]]) -> list[int]:
+        """Je ein Futter diagonal neben jeder Schlange (vom Zentrum weg), dazu eines im Zentrum."""
+        width, height = self.width, self.height
+        if not (width == height and width in FIXED_SIZES):
+            return self._random_cells(len(starts), set())
+        cx, cy = (width - 1) // 2, (height - 1) // 2
+        food = []
+        if len(starts) <= 4 or width * height >= MEDIUM_SIZE * MEDIUM_SIZE:
+            for hx, hy in starts:
+                options = []
+                for x, y in ((hx - 1, hy - 1), (hx - 1, hy + 1), (hx + 1, hy - 1), (hx + 1, hy + 1)):
+                    cell = y * width + x
+                    if (x, y) == (cx, cy) or cell in food:
+                        continue
+                    away = (x < hx < cx or cx < hx < x or y < hy < cy or cy < hy < y)
+                    corner = x in (0, width - 1) and y in (0, height - 1)
+                    if away and not corner:
+                        options.append(cell)
+                if options:
+                    food.append(self.rng.choice(options))
+        food.append(cy * width + cx)
+        return food
+
+    def _random_cells(self, count: int, occupied: set[int]) -> list[int]:
+        """
+        Zufällige freie Felder für Futter: nicht belegt und nicht direkt neben einem Kopf.
+
+        :param count: Anzahl Felder
+        :param occupied: zusätzlich belegte Felder
+        :return: Liste von Zellindizes
+        """
+        board = self.board
+        blocked = set(occupied) | board.food
+        for slot, alive in enumerate(board.alive):
+            if alive:
+                blocked.update(board.bodies[slot])
+                blocked.update(board.neighbours[board.bodies[slot][0]])
+        free = [cell for cell in range(self.width * self.height) if cell not in blocked]
+        return self.rng.sample(free, min(count, len(free)))
+
+    def _spawn_food(self, occupied: set[int]) -> None:
+        """Futter-Spawn der Standardregeln: Minimum auffüllen, sonst mit food_spawn_chance eines."""
+        missing = self.minimum_food - len(self.board.food)
+        if missing > 0:
+            self.board.add_food(self._random_cells(missing, occupied))
+        elif self.food_spawn_chance > 0 and 100 - self.rng.randrange(100) < self.food_spawn_chance:
+            self.board.add_food(self._random_cells(1, occupied))
+
+    def snake_json(self, slot: int) -> typing.Dict:
+        """Eine Schlange im Format der API."""
+        width = self.width
+        body = [{"x": cell % width, "y": cell // width} for cell in self.board.bodies[slot]]
+        return {"id": f"snake-{slot}", "name": self.players[slot][0], "latency": "0",
+                "health": self.board.health[slot], "body": body, "head": body[0], "length": len(body),
+                "shout": "", "squad": "", "customizations": {"color": "#888888", "head": "default", "tail": "default"}}
+
+    def game_states(self) -> dict[int, typing.Dict]:
+        """
+        game_state jeder lebenden Schlange für den aktuellen Zug. Das board-Dictionary wird
+        zwischen den Schlangen geteilt und darf von move-Funktionen nicht verändert werden.
+
+        :return: Position der Schlange -> game_state
+        """
+        board = self.board
+        width = self.width
+        snakes = {slot: self.snake_json(slot) for slot, alive in enumerate(board.alive) if alive}
+        shared = {"height": self.height, "width": width,
+                  "food": [{"x": cell % width, "y": cell // width} for cell in sorted(board.food)],
+                  "hazards": [], "snakes": list(snakes.values())}
+        return {slot: {"game": self.game, "turn": self.turn, "board": shared, "you": snake}
+                for slot, snake in snakes.items()}
+
+    def over(self) -> bool:
+        """Spielende: höchstens eine Schlange übrig (allein: keine), oder max_turns erreicht."""
+        alive = sum(self.board.alive)
+        if self.max_turns is not None and self.turn >= self.max_turns:
+            return True
+        return alive == 0 or (alive == 1 and len(self.players) > 1)
+
+    def step(self) -> None:
+        """Fragt alle lebenden Schlangen nach ihrem Zug und wendet die Regeln an."""
+        board = self.board
+        width, height = self.width, self.height
+        offsets = dict(MOVES)
+        targets = {}
+        for slot, game_state in self.game_states().items():
+            move = self._ask(slot, game_state)
+            head = board.bodies[slot][0]
+            dx, dy = offsets[move]
+            x, y = head % width + dx, head // width + dy
+            targets[slot] = y * width + x if 0 <= x < width and 0 <= y < height else None
+
+        before = [slot for slot, alive in enumerate(board.alive) if alive]
+        board.make(targets)
+        self.turn += 1
+
+        # Futter spawnt vor dem Ausscheiden: Körper dieses Zugs zählen noch als belegt
+        occupied = set()
+        for slot in before:
+            if not board.alive[slot]:
+                occupied.update(board.bodies[slot])
+                occupied.update(board.neighbours[board.bodies[slot][0]])
+                self.eliminated[self.players[slot][0]] = self.turn
+        self._spawn_food(occupied)
+
+    def _ask(self, slot: int, game_state: typing.Dict) -> str:
+        """Zug der Schlange; bei Fehlern oder ungültiger Antwort wie die Engine der letzte Zug."""
+        try:
+            move = self.players[slot][1](game_state)["move"]
+        except Exception as ex:
+            debug(f"[sim] {self.players[slot][0]}: Fehler in move → {ex}")
+            move = None
+        if move not in ("up", "down", "left", "right"):
+            move = self.last_moves[slot]
+        self.last_moves[slot] = move
+        return move
+
+    def run(self) -> Result:
+        """
+        Spielt das Spiel bis zum Ende.
+
+        :return: Result
+        """
+        while not self.over():
+            self.step()
+        survivors = [self.players[slot][0] for slot, alive in enumerate(self.board.alive) if alive]
+        winner = survivors[0] if len(survivors) == 1 else None
+        return Result(winner, self.turn, dict(self.eliminated))
@@ -6,43 +6,41 @@
 # Alexandra Holsten, 221200813
 # Yuxiao Wu, 223200006
 
+import csv
 import os
 import sys
+import time
 import typing
 from pathlib import Path
-import pandas as pd
 from joblib import load
-from Battlesnake.game import Cell, Game
-from Battlesnake.heatmap import is_food_contested, flood_fill_space, simulate_future_space, build_heatmap
+from Battlesnake.game import Cell
+from Battlesnake.anytime import Deadline, lookahead_move
+from Battlesnake.board_index import BoardIndex
+from Battlesnake.board_state import BoardState
 from Battlesnake.path_fallback import PathSolver
-from LightGBM.ml_features import ml_features
+from Battlesnake.safety import MoveSafety
+from Battlesnake.search import search_move
+from Battlesnake.mcts import mcts_move
+from Battlesnake.session import sessions
+from LightGBM.ml_features import FEATURE_COLUMNS, LazyFeatures, materialize, model_input
 from Battlesnake.utils import debug
-from Battlesnake.astar.astar import AStar
 
 # Setup
 ml_path = Path(__file__).resolve().parent.parent / "LightGBM"
 if str(ml_path) not in sys.path:
     sys.path.insert(0, str(ml_path))
 
-# Trainingsmodus aktivieren
-os.environ["TRAINING_MODE"] = "1"
+# Trainingsmodus: TRAINING_MODE=1 schreibt Features + gewählten Zug nach training_data.csv
+TRAINING_MODE = os.environ.get("TRAINING_MODE", "0") == "1"
+
+# Entscheidungsmodus: "heatmap" (Heatmap + Vorausschau), "search" (Alpha-Beta-Suche, search.py)
+# oder "mcts" (Monte-Carlo-Baumsuche mit Worker-Prozessen, mcts.py)
+DECISION_MODE = os.environ.get("DECISION_MODE", "heatmap")
 
 # Modellpfad definieren
 model_path = ml_path / "insane_model.pkl"
 csv_path = ml_path / "training_data.csv"
 
-# Feature-Spalten definieren
-columns = [
-    "head_x", "head_y", "health", "width", "height", "closest_food_distance",
-    "space", "future_space", "safe_up", "safe_down", "safe_left", "safe_right",
-    "open_area_up", "open_area_down", "open_area_left", "open_area_right",
-    "distance_to_nearest_wall", "tail_distance", "closest_food_is_safe", "is_biggest_snake",
-    "needs_food", "closest_enemy_head_dist", "enemy_head_is_adjacent", "enemies_within_2",
-    "kill_up", "kill_down", "kill_left", "kill_right",
-    "dir_up", "dir_down", "dir_left", "dir_right",
-    "center_bonus", "food_contest_count", "num_snakes", "path_distance_to_food"
-]
-
 #  ML-Modell laden
 try:
     ml_model = load(str(model_path))
@@ -90,19 +88,44 @@ def classify_move_quality(proba_dict, actual_move, flood_fill_space_after=None):
     else:
         return "Fehler ❌"
 
-def move(game_state: typing.Dict) -> typing.Dict:
+def log_training_row(features, move):
+    """
+    Hängt einen Feature-Vektor samt gewähltem Zug an die Trainingsdaten an. Eine neue
+    Datei bekommt zuerst die Kopfzeile FEATURE_COLUMNS + ["move"], die train_model.py erwartet.
+
+    :param features: Liste der Merkmale in FEATURE_COLUMNS-Reihenfolge
+    :param move: gewählter Zug ("up", "down", "left", "right")
+    """
+    try:
+        new_file = not csv_path.exists() or csv_path.stat().st_size == 0
+        with open(csv_path, "a", newline="") as f:
+            writer = csv.writer(f)
+            if new_file:
+                writer.writerow(FEATURE_COLUMNS + ["move"])
+            writer.writerow(list(features) + [move])
+    except OSError as e:
+        debug(f"[Training] Schreiben nach {csv_path} fehlgeschlagen: {e}")
+
+
+def move(game_state: typing.Dict, state: BoardState | None = None) -> typing.Dict:
     """
     Hauptentscheidungsfunktion für den Snake-Zug.
-    1. Versuche ML-Vorhersage mit Feature-Vektor
+    1. Heatmap-basierte Bewertung, verfeinert durch die Anytime-Vorausschau
     2. Fallback: A* mit PathSolver
-    3. Fallback: Heatmap-basierte Bewertung
+    3. Fallback: ML-Vorhersage mit Feature-Vektor
     4. Sicherheitsprüfung des Zuges
     5. Logging bei aktiviertem Trainingsmodus
     """
     debug("[move] Wähle nächsten Zug...")
+    started = time.perf_counter()
+    timings = {}  # Stufe -> Laufzeit in ms
+
+    def lap(stage, since):
+        timings[stage] = (time.perf_counter() - since) * 1000
+        return time.perf_counter()
 
     my_head_dict = game_state['you']['body'][0]
-    my_head = Cell(my_head_dict["x"], my_head_dict["y"])
+    my_head = Cell.at(my_head_dict["x"], my_head_dict["y"])
     health = game_state['you']['health']
     width = game_state['board']['width']
     height = game_state['board']['height']
@@ -116,11 +139,18 @@ def move(game_state: typing.Dict) -> typing.Dict:
         "right": (1, 0)
     }
 
-    features = ml_features(game_state)
-    if features is None:
-        debug("[move] Feature-Extraktion fehlgeschlagen → benutze 'up'")
-        return {"move": "up"}
-    debug(f"[move] Extrahierte Features: {features}")
+    # Session des Spiels: Game-Objekt wird nur um das Delta des Zugs weitergeschoben
+    session = sessions.get(game_state, ml_model)
+    game_obj = session.advance(game_state)
+
+    # Belegung einmal pro Request aufbauen und an alle Stufen weiterreichen. Den BoardState liest
+    # nur der BoardIndex; Heatmap, LazyFeatures und Game arbeiten noch auf dem game_state-Dict
+    # und erreichen die kompakte Form bei Bedarf über index.state
+    index = BoardIndex(game_state, state)
+    stage_start = lap("setup", started)
+
+    # Features werden erst berechnet, wenn die ML-Stufe oder das Training-Logging sie braucht
+    features = LazyFeatures(game_state, index, game_obj)
 
     best_move = None
     proba_dict = {}
@@ -128,7 +158,7 @@ def move(game_state: typing.Dict) -> typing.Dict:
 
     # 1. Heatmap-Primary
     debug("[Heatmap] Versuche Heatmap-basierte Entscheidung...")
-    heatmap = build_heatmap(game_state, my_head, health)
+    heatmap = session.heatmap.build(game_state, my_head, health, index)
     move_scores = {}
     for direction, (dx, dy) in moves.items():
         nx, ny = my_head.x + dx, my_head.y + dy
@@ -139,14 +169,30 @@ def move(game_state: typing.Dict) -> typing.Dict:
         debug(f"[Heatmap] Heatmap-Zug gewählt: {best_move}")
     else:
         debug("[Heatmap] Kein sicherer Heatmap-Zug gefunden")
+    stage_start = lap("heatmap", stage_start)
+
+    # 1b. Vorausschau: vertieft sich, bis das Zeitbudget des Zugs fast verbraucht ist
+    if move_scores:
+        deadline = Deadline.from_request(game_state, started, session.last_compute_ms)
+        if DECISION_MODE == "search":
+            searched, depth, _ = search_move(index, heatmap, deadline, table=session.table, game=game_obj)
+            best_move = searched or best_move
+            debug(f"[Anytime] Tiefe {depth} erreicht, Budget {deadline.budget_ms:.0f}ms → {best_move}")
+        elif DECISION_MODE == "mcts":
+            searched, rollouts = mcts_move(index, heatmap, deadline, session.tree)
+            best_move = searched or best_move
+            debug(f"[Anytime] {rollouts} Rollouts, Budget {deadline.budget_ms:.0f}ms → {best_move}")
+        else:
+            best_move, depth = lookahead_move(index, move_scores, len(game_state['you']['body']), deadline)
+            debug(f"[Anytime] Tiefe {depth} erreicht, Budget {deadline.budget_ms:.0f}ms → {best_move}")
+        stage_start = lap("lookahead", stage_start)
 
     # 2. A*-Fallback
     if best_move is None:
         debug("[A*] Aktiviere A*-Fallback...")
         try:
-            game_obj = Game(game_state)
             path_solver = PathSolver(game_obj)
-            food_goals = set([Cell(f["x"], f["y"]) for f in game_state["board"]["food"]])
+            food_goals = set([Cell.at(f["x"], f["y"]) for f in game_state["board"]["food"]])
             valid_goals = [goal for goal in food_goals if goal not in path_solver.forbidden_cells]
             if not valid_goals:
                 valid_goals = list(path_solver.neighbors(my_head))
@@ -163,17 +209,23 @@ def move(game_state: typing.Dict) -> typing.Dict:
                 debug("[A*] Kein gültiger Pfad gefunden")
         except Exception as ex:
             debug(f"[A*] Fehler: {ex}")
+        stage_start = lap("astar", stage_start)
 
     # 3. ML-Fallback
     if best_move is None:
         debug("[ML] Aktiviere ML-Fallback...")
         try:
-            if ml_model:
-                features_df = pd.DataFrame([features], columns=pd.Index(columns))
-                proba = ml_model.predict_proba(features_df)
+            model = session.model
+            values = materialize(features) if model else None
+            if values is None:
+                debug("[ML] Kein Modell geladen oder Feature-Extraktion fehlgeschlagen")
+            else:
+                debug(f"[move] Extrahierte Features: {values}")
+                features_df = model_input(values, model)
+                proba = model.predict_proba(features_df)
                 confidence = max(proba[0])
-                ml_prediction = ml_model.predict(features_df)[0]
-                proba_dict = dict(zip(ml_model.classes_, proba[0]))
+                ml_prediction = model.predict(features_df)[0]
+                proba_dict = dict(zip(model.classes_, proba[0]))
 
                 debug(f"[ML] Vorhersage: {ml_prediction}, Wahrscheinlichkeiten: {proba_dict}")
 
@@ -182,53 +234,36 @@ def move(game_state: typing.Dict) -> typing.Dict:
                     debug(f"[ML] ML-Zug gewählt: {best_move}")
                 else:
                     debug("[ML] ML-Vertrauen zu niedrig")
-            else:
-                debug("[ML] Kein Modell geladen")
         except Exception as e:
             debug(f"[ML] Vorhersage fehlgeschlagen → {e}")
+        stage_start = lap("ml", stage_start)
 
     # Final fallback
     if best_move is None:
         debug("[Fallback] Kein Algorithmus erfolgreich → benutze 'up'")
         best_move = "up"
 
-    # Sicherheitsprüfung
-    def is_safe_move(move, game_state):
-        moves_ = {"up": (0, 1), "down": (0, -1), "left": (-1, 0), "right": (1, 0)}
-        my_head = game_state["you"]["body"][0]
-        width = game_state["board"]["width"]
-        height = game_state["board"]["height"]
-        snakes = game_state["board"]["snakes"]
-        all_snake_bodies = [coord for snake in snakes for coord in snake["body"]]
-        dx, dy = moves_[move]
-        nx, ny = my_head["x"] + dx, my_head["y"] + dy
-        if not (0 <= nx < width and 0 <= ny < height):
-            return False
-        if {"x": nx, "y": ny} in all_snake_bodies:
-            return False
-        return True
-
-    if not is_safe_move(best_move, game_state):
+    # Sicherheitsprüfung: alle vier Richtungen in einem Durchlauf über das Belegungsgitter
+    safety = MoveSafety(index)
+    if not safety.is_legal(best_move):
         debug(f"[SAFETY] Zug '{best_move}' ist unsicher → Fallback")
-        for move in ["up", "down", "left", "right"]:
-            if is_safe_move(move, game_state):
-                debug(f"[SAFETY] Sicherer Alternativ-Zug: {move}")
-                return {"move": move}
-        debug("[SAFETY] Kein sicherer Zug → benutze 'up'")
-        return {"move": "up"}
-
-    # Debug-Ausgabe zur Bewertung
-    move_quality = classify_move_quality(proba_dict, best_move)
-    debug(f"[Move Quality] {move_quality}")
+        best_move = safety.fallback()
+        debug(f"[SAFETY] Alternativ-Zug: {best_move}")
+    else:
+        # Debug-Ausgabe zur Bewertung
+        move_quality = classify_move_quality(proba_dict, best_move)
+        debug(f"[Move Quality] {move_quality}")
+    stage_start = lap("safety", stage_start)
+
+    # 5. Trainingsdaten: erst hier werden alle Features berechnet
+    if TRAINING_MODE:
+        values = materialize(features)
+        if values is not None:
+            log_training_row(values, best_move)
+        lap("training", stage_start)
+
+    timings["total"] = (time.perf_counter() - started) * 1000
+    session.last_compute_ms = timings["total"]
+    debug("[Timing] " + ", ".join(f"{stage}={ms:.2f}ms" for stage, ms in timings.items()))
 
     return {"move": best_move}
-
-
-
-
-
-
-
-
-
-
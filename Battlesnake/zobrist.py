@@ -0,0 +1,165 @@
+# Gruppe 3 – Battlesnake Projekt (SS2025)
+# Mitglieder:
+# Eren Temizkan, 223201982
+# Dominik Ide, 220200046
+# Dogukan Karakoyun, 223202023
+# Alexandra Holsten, 221200813
+# Yuxiao Wu, 223200006
+
+import functools
+import random
+import typing
+
+HEALTH_BUCKET = 10         # Lebenspunkte werden in Stufen zu 10 gehasht
+BUCKETS = 100 // HEALTH_BUCKET + 1
+
+EXACT, LOWER, UPPER = 0, 1, 2  # Art des gespeicherten Werts (exakt, untere/obere Schranke)
+
+
+class SnakeKeys:
+    """
+    Zufällige 64-Bit-Schlüssel einer Schlange für das Zobrist-Hashing.
+
+    Der Hash einer Schlange ist das XOR aus je einem Schlüssel pro Körpersegment, dem
+    Schlüssel des Kopffelds, der Länge und der Lebenspunkte-Stufe. Gestapelte Schwänze heben
+    sich im Körperteil auf, die Länge unterscheidet sie trotzdem.
+
+    :ivar body: Schlüssel pro Zelle für Körpersegmente
+    :ivar head: Schlüssel pro Zelle für den Kopf
+    :ivar length: Schlüssel pro Länge
+    :ivar health: Schlüssel pro Lebenspunkte-Stufe
+    """
+    __slots__ = ('body', 'head', 'length', 'health')
+
+    def __init__(self, rng: random.Random, cells: int):
+        self.body = [rng.getrandbits(64) for _ in range(cells)]
+        self.head = [rng.getrandbits(64) for _ in range(cells)]
+        self.length = [rng.getrandbits(64) for _ in range(cells + 2)]
+        self.health = [rng.getrandbits(64) for _ in range(BUCKETS)]
+
+    def hash(self, body: typing.Iterable[int], health: int) -> int:
+        """
+        Hash der Schlange, komplett neu berechnet.
+
+        :param body: Körper als Zellindizes, Kopf zuerst
+        :param health: Lebenspunkte
+        :return: 64-Bit-Hash
+        """
+        keys = self.body
+        value = 0
+        length = 0
+        head = None
+        for cell in body:
+            if head is None:
+                head = cell
+            value ^= keys[cell]
+            length += 1
+        return value ^ self.head[head] ^ self.length[length] ^ self.health[health_bucket(health)]
+
+
+def health_bucket(health: int) -> int:
+    """Lebenspunkte-Stufe (0 bis 10) für den Hash."""
+    return max(0, min(health, 100)) // HEALTH_BUCKET
+
+
+@functools.lru_cache(maxsize=256)
+def snake_keys(snake_id: str, cells: int) -> SnakeKeys:
+    """
+    Schlüssel einer Schlange, deterministisch aus ihrer ID erzeugt. Game und Suche kommen so
+    ohne gemeinsamen Zustand auf denselben Hash, auch über Züge und Prozesse hinweg.
+
+    :param snake_id: ID der Schlange
+    :param cells: Anzahl der Felder (width * height)
+    :return: SnakeKeys
+    """
+    return SnakeKeys(random.Random(f"snake:{snake_id}:{cells}"), cells)
+
+
+@functools.lru_cache(maxsize=16)
+def food_keys(cells: int) -> tuple[int, ...]:
+    """
+    Schlüssel pro Zelle für Futter.
+
+    :param cells: Anzahl der Felder (width * height)
+    :return: Tupel von 64-Bit-Schlüsseln
+    """
+    rng = random.Random(f"food:{cells}")
+    return tuple(rng.getrandbits(64) for _ in range(cells))
+
+
+def food_hash(food: typing.Iterable[int], cells: int) -> int:
+    """
+    XOR der Futterschlüssel.
+
+    :param food: Futterfelder als Zellindizes
+    :param cells: Anzahl der Felder
+    :return: 64-Bit-Hash
+    """
+    keys = food_keys(cells)
+    value = 0
+    for cell in food:
+        value ^= keys[cell]
+    return value
+
+
+class TranspositionTable:
+    """
+    Begrenzte Transpositionstabelle für die Suche, adressiert über die unteren Bits des Hashs.
+
+    Jeder Eintrag speichert (Hash, Tiefe, Wert, Art, besten Zug, Generation). Ersetzt wird,
+    wenn der Platz leer ist, der alte Eintrag aus einer früheren Suche stammt oder die neue
+    Tiefe mindestens so groß ist. Die Tabelle lebt in der GameSession, sodass die Suche des
+    letzten Zugs die nächste vorwärmt; new_search() altert die alten Einträge nur. Werte aus
+    älteren Suchen stammen aus einer anderen Bewertung (Heatmap, Gegnerauswahl) und taugen
+    nur noch als Zughinweis, nicht als Schranke (siehe probe).
+
+    :ivar hits: Anzahl der Treffer bei probe
+    :ivar stores: Anzahl der gespeicherten Einträge
+    """
+    __slots__ = ('mask', 'entries', 'generation', 'hits', 'stores')
+
+    def __init__(self, bits: int = 16):
+        """
+        :param bits: Tabellengröße als Zweierpotenz (2^bits Einträge)
+        """
+        self.mask = (1 << bits) - 1
+        self.entries: list[tuple | None] = [None] * (1 << bits)
+        self.generation = 0
+        self.hits = 0
+        self.stores = 0
+
+    def new_search(self) -> None:
+        """Beginnt eine neue Suche; Einträge älterer Suchen dürfen verdrängt werden."""
+        self.generation += 1
+
+    def probe(self, key: int) -> tuple | None:
+        """
+        Liefert den Eintrag zum Hash.
+
+        :param key: 64-Bit-Hash der Stellung
+        :return: (Tiefe, Wert, Art, bester Zug, aktuell) oder None; aktuell ist True, wenn der
+            Eintrag aus der laufenden Suche stammt und sein Wert als Schranke gelten darf
+        """
+        entry = self.entries[key & self.mask]
+        if entry is None or entry[0] != key:
+            return None
+        self.hits += 1
+        return entry[1], entry[2], entry[3], entry[4], entry[5] == self.generation
+
+    def store(self, key: int, depth: int, score: int, flag: int, move: int | None) -> None:
+        """
+        Speichert einen Eintrag nach der Ersetzungsstrategie (siehe Klasse).
+
+        :param key: 64-Bit-Hash der Stellung
+        :param depth: verbleibende Suchtiefe des Werts
+        :param score: Wert der Stellung
+        :param flag: EXACT, LOWER oder UPPER
+        :param move: bester Zug als Zielfeld (oder None)
+        """
+        slot = key & self.mask
+        entry = self.entries[slot]
+        if entry is None or entry[5] != self.generation or depth >= entry[1] or entry[0] == key:
+            if move is None and entry is not None and entry[0] == key:
+                move = entry[4]  # besten Zug derselben Stellung nicht verlieren
+            self.entries[slot] = (key, depth, score, flag, move, self.generation)
+            self.stores += 1
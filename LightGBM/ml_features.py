@@ -6,23 +6,59 @@
 # Alexandra Holsten, 221200813
 # Yuxiao Wu, 223200006
 
-from Battlesnake.path_fallback import next_step
+from Battlesnake.path_fallback import GridPathSolver, plan_step
 from Battlesnake.utils import debug
-from collections import deque
-import heapq
-import typing
+import functools
+import pandas as pd
 from Battlesnake.game import Cell
-from typing import Iterable
+from Battlesnake.board_index import BoardIndex
+from Battlesnake.board_template import BoardTemplate
+from Battlesnake.safety import MoveSafety
 from Battlesnake.heatmap import flood_fill_space, simulate_future_space, is_food_contested
 
+# Spaltennamen des Feature-Vektors (Reihenfolge wie in ml_features)
+FEATURE_COLUMNS = [
+    "head_x", "head_y", "health", "width", "height", "closest_food_distance",
+    "space", "future_space", "safe_up", "safe_down", "safe_left", "safe_right",
+    "open_area_up", "open_area_down", "open_area_left", "open_area_right",
+    "distance_to_nearest_wall", "tail_distance", "closest_food_is_safe", "is_biggest_snake",
+    "needs_food", "closest_enemy_head_dist", "enemy_head_is_adjacent", "enemies_within_2",
+    "kill_up", "kill_down", "kill_left", "kill_right",
+    "dir_up", "dir_down", "dir_left", "dir_right",
+    "center_bonus", "food_contest_count", "num_snakes", "path_distance_to_food",
+    "my_territory", "largest_enemy_territory",
+    "pocket_up", "pocket_down", "pocket_left", "pocket_right",
+    "closest_food_path_distance", "closest_enemy_head_path_dist", "enemies_within_2_path",
+    "future_space_deep", "will_be_free_up", "will_be_free_down", "will_be_free_left", "will_be_free_right",
+    "next_step_path_length"
+]
+
+
+def model_input(features, model):
+    """
+    Baut den DataFrame für model.predict aus dem Feature-Vektor.
+
+    Neue Features werden immer hinten angehängt und bestehende Spalten ändern ihre Bedeutung
+    nicht (eine neue Variante wird eine neue Spalte). Ein Modell, das mit weniger Spalten
+    trainiert wurde, bekommt daher genau die ersten n_features_in_ Spalten mit denselben
+    Werten wie beim Training.
+
+    :param features: Feature-Liste aus ml_features
+    :param model: geladenes ML-Modell
+    :return: pandas DataFrame mit einer Zeile
+    """
+    n_features = getattr(model, "n_features_in_", len(FEATURE_COLUMNS))
+    return pd.DataFrame([features[:n_features]], columns=pd.Index(FEATURE_COLUMNS[:n_features]))
 
-def closest_food_is_safe(my_head, food, game_state):
+
+def closest_food_is_safe(my_head, food, game_state, index=None):
     """
     Bestimmt, ob das nächstgelegene Futter von anderen Schlangen umkämpft wird.
 
     :param my_head: Aktuelle Position des Schlangenkopfes (Cell-Objekt).
     :param food: Liste von Futterpositionen auf dem Spielfeld.
     :param game_state: Der aktuelle Spielzustand im JSON-Format.
+    :param index: BoardIndex des aktuellen Zugs (Kopf-Nachbarschaft als Lookup).
     :return: 1, wenn das Futter sicher (nicht umkämpft) ist, 0 andernfalls.
     """
     try:
@@ -38,15 +74,15 @@ def closest_food_is_safe(my_head, food, game_state):
         closest_food = food_sorted[0]
 
         # Erstelle ein Cell-Objekt für die Position des nächstgelegenen Futters
-        closest_food_cell = Cell(closest_food["x"], closest_food["y"])
+        closest_food_cell = Cell.at(closest_food["x"], closest_food["y"])
 
         # Überprüfe, ob das Futter umkämpft ist
-        if is_food_contested(closest_food_cell, game_state):
+        if is_food_contested(closest_food_cell, game_state, index):
             return 0  # Futter ist umkämpft, daher nicht sicher
 
         return 1  # Futter ist sicher, also nicht umkämpft
     except Exception as e:
-        print(f"[ERROR] closest_food_is_safe failed: {e}")
+        debug(f"[ERROR] closest_food_is_safe failed: {e}")
         return 0  # Default to unsafe if error occurs
 
 
@@ -66,253 +102,545 @@ def starvation_risk(health, closest_food_dist, food_safe):
     return 0  # Kein Verhungern-Risiko
 
 
-def ml_features(game_state):
+def recursive_future_space(index, head_pos, turns=2, visited=None, memo=None):
     """
-    Extrahiert Merkmale aus dem aktuellen Spielzustand für das ML-Modell,
-    einschließlich der Logik, um Verhungern zu vermeiden, und integriert Pfadfindung für Bewegungsentscheidungen.
+    Vorausschau für future_space, so wie das Modell trainiert wurde: rekursiv über alle Felder
+    auf dem Brett (Körper blockieren unterwegs nicht, nur der eigene Weg), am Ende Flood-Fill.
+    Für die tail-aware Bitmasken-Variante siehe simulate_future_space (future_space_deep).
+
+    :param index: BoardIndex des aktuellen Zugs (Flood-Fill über die Regionen)
+    :param head_pos: Aktuelle Kopfposition als Cell
+    :param turns: Wie viele Züge voraus simuliert werden sollen
+    :param visited: Menge der bereits besuchten Zellen in dieser Rekursion (Cycle Prevention)
+    :param memo: Zwischenspeicher für bereits berechnete (head_pos, turns)
+    :return: Anzahl erreichbarer Felder nach N Zügen
+    """
+    if visited is None:
+        visited = set()
+    if memo is None:
+        memo = {}
+
+    key = (head_pos.x, head_pos.y, turns)
+    if key in memo:
+        return memo[key]
+
+    if turns == 0:
+        result = index.flood_fill_space(head_pos)
+        memo[key] = result
+        return result
+
+    visited.add((head_pos.x, head_pos.y))
+
+    best = -1
+    for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+        nx, ny = head_pos.x + dx, head_pos.y + dy
+        if index.in_bounds(nx, ny) and (nx, ny) not in visited:
+            score = recursive_future_space(index, Cell.at(nx, ny), turns - 1, visited.copy(), memo)
+            best = max(best, score)
+
+    memo[key] = best if best != -1 else 0
+    return memo[key]
+
+
+def trained_path_distance_to_food(game_state, closest_food_dist):
+    """
+    path_distance_to_food so, wie das Modell trainiert wurde. Die damalige Wegsuche brach ab,
+    sobald sie einen Weg zum Futter oder ein freies Nachbarfeld gefunden hatte (Flood-Fill mit
+    dem Game-Objekt), und der Wert fiel auf die Manhattan-Distanz zum nächsten Futter zurück.
+    Nur wenn kein Weg und kein freies Nachbarfeld existierte, war der Wert 0.
+
+    Ausgewertet werden dieselben Ziele und verbotenen Felder wie damals: Wände als äußerer
+    Ring, Felder neben mindestens gleich langen Gegnerköpfen und Körperteile, die beim
+    Ankommen noch belegt sind.
 
     :param game_state: Der aktuelle Spielzustand im JSON-Format.
-    :return: Eine Liste von Merkmalen, die das Modell verwenden kann.
+    :param closest_food_dist: Manhattan-Distanz zum nächstgelegenen Futter.
+    :return: closest_food_dist oder 0
     """
-    try:
-        print("[DEBUG] Feature extraction started...")
-        print(f"[DEBUG] game_state type: {type(game_state)}")
-        print(
-            f"[DEBUG] game_state keys: {list(game_state.keys()) if isinstance(game_state, dict) else 'not a dict'}"
-        )
-
-        # Überprüfe, ob game_state die notwendigen Schlüssel enthält
-        if not isinstance(game_state, dict):
-            print("[ERROR] game_state is not a dictionary"
-                  )  # for debugging purposes
-            return None
+    width = game_state["board"]["width"]
+    height = game_state["board"]["height"]
+    me = game_state["you"]
+    head = Cell.at(me["body"][0]["x"], me["body"][0]["y"])
+    food = {Cell.at(f["x"], f["y"]) for f in game_state["board"]["food"]}
+    enemies = [s for s in game_state["board"]["snakes"] if s["id"] != me["id"]]
+    my_length = len(me["body"])
+
+    # Ziele: Futter neben einem Gegnerkopf nur, wenn wir direkt daneben und länger sind
+    goals = set()
+    for cell in food:
+        contested = False
+        for snake in enemies:
+            enemy_head = Cell.at(snake["body"][0]["x"], snake["body"][0]["y"])
+            if cell.distance(enemy_head) == 1 and (cell.distance(head) > 1 or len(snake["body"]) >= my_length):
+                contested = True
+                break
+        if not contested:
+            goals.add(cell)
+
+    solver = GridPathSolver(width, height)
+    forbidden = {Cell.at(x, y) for x in range(width) for y in (0, height - 1)}
+    forbidden.update(Cell.at(x, y) for x in (0, width - 1) for y in range(height))
+    for snake in enemies:
+        body = [Cell.at(c["x"], c["y"]) for c in snake["body"]]
+        if len(body) < 2:
+            return closest_food_dist  # damals IndexError beim Hals → Rückfall
+        by_food = False
+        for cell in solver.neighbors(body[0]):
+            if cell == body[1]:
+                continue
+            by_food = by_food or cell in food
+            if len(body) >= my_length and cell.distance(head) < 2:
+                forbidden.add(cell)
+        for i, cell in enumerate(body):
+            if len(body) - i + (1 if by_food else 0) >= cell.distance(head):
+                forbidden.add(cell)
+    for i, c in enumerate(me["body"][1:], start=1):
+        cell = Cell.at(c["x"], c["y"])
+        if my_length - i + 1 >= cell.distance(head):
+            forbidden.add(cell)
+
+    solver.forbidden_cells = forbidden
+    if solver.paths_to(head, goals) or any(cell not in forbidden for cell in solver.neighbors(head)):
+        return closest_food_dist
+    return 0
+
+
+# Suchtiefe der Vorausschau: future_space wie beim Training des Modells, future_space_deep
+# mit der Bitmasken-Frontier (Kosten linear in der Tiefe)
+FUTURE_SPACE_TURNS = 2
+FUTURE_SPACE_DEEP_TURNS = 8
+
+DIRECTIONS = {
+    "up": (0, 1),
+    "down": (0, -1),
+    "left": (-1, 0),
+    "right": (1, 0)
+}
+
+
+class LazyFeatures:
+    """
+    Feature-Vektor, dessen Merkmale erst beim ersten Zugriff berechnet und dann gemerkt werden.
 
-        # Extrahiere die Kopfposition der Schlange
-        my_head_dict = game_state["you"]["body"][0]
-        my_head = Cell(my_head_dict["x"], my_head_dict["y"])
-
-        # Extrahiere grundlegende Spielfeldinformationen
-        health = game_state["you"].get("health", 100)
-        width = game_state["board"].get("width", 11)
-        height = game_state["board"].get("height", 11)
-        food = game_state["board"].get("food", [])
-        snakes = game_state["board"].get("snakes", [])
-        my_id = game_state["you"]["id"]
-        my_length = len(game_state["you"].get("body", []))
-
-        # Berechne die Koordinaten aller gegnerischen Schlangenkörper
-        all_snake_bodies = [
-            coord for snake in snakes if snake["id"] != my_id
-            for coord in snake["body"]
-        ]
-
-        # Berechne die Manhattan-Distanz zum nächstgelegenen Futter
-        if not food:
-            print("[ERROR] No food available in the game state.")
-            closest_food_dist = width + height
-        else:
-            closest_food_dist = min([
-                abs(f["x"] - my_head.x) + abs(f["y"] - my_head.y) for f in food
-            ],
-                                    default=width + height)
-
-        # Verwende PathSolver, um den nächsten besten Schritt zu finden (integriert A*-Pfadfindung)
+    Jede Spalte aus FEATURE_COLUMNS ist ein gleichnamiges Attribut. So kostet ein Zug, in dem
+    das ML-Modell gar nicht gefragt wird, nichts; teure Merkmale wie path_distance_to_food
+    (Wegsuche) oder future_space (Vorausschau) werden nur bei Bedarf gerechnet.
+    """
+
+    def __init__(self, game_state, index=None, game=None):
+        """
+        :param game_state: Der aktuelle Spielzustand im JSON-Format.
+        :param index: BoardIndex des aktuellen Zugs; wird sonst bei Bedarf gebaut.
+        :param game: Game-Objekt aus der Session; wird sonst bei Bedarf gebaut.
+        """
+        self.game_state = game_state
+        self._index = index
+        self._game = game
+
+    def values(self):
+        """
+        Berechnet alle noch fehlenden Merkmale und gibt sie in Spaltenreihenfolge zurück.
+
+        :return: Liste mit len(FEATURE_COLUMNS) Einträgen
+        """
+        return [getattr(self, column) for column in FEATURE_COLUMNS]
+
+    # ----------------------------------------------------------------- Grunddaten
+
+    @functools.cached_property
+    def index(self):
+        """BoardIndex des Zugs (Belegung, Regionen, Distanzfelder)."""
+        return self._index if self._index is not None else BoardIndex(self.game_state)
+
+    @functools.cached_property
+    def my_head(self):
+        my_head_dict = self.game_state["you"]["body"][0]
+        return Cell.at(my_head_dict["x"], my_head_dict["y"])
+
+    @functools.cached_property
+    def my_id(self):
+        return self.game_state["you"]["id"]
+
+    @functools.cached_property
+    def my_length(self):
+        return len(self.game_state["you"].get("body", []))
+
+    @functools.cached_property
+    def food(self):
+        return self.game_state["board"].get("food", [])
+
+    @functools.cached_property
+    def snakes(self):
+        return self.game_state["board"].get("snakes", [])
+
+    @functools.cached_property
+    def enemy_heads(self):
+        return [snake["body"][0] for snake in self.snakes if snake["id"] != self.my_id]
+
+    @functools.cached_property
+    def head_x(self):
+        return self.my_head.x
+
+    @functools.cached_property
+    def head_y(self):
+        return self.my_head.y
+
+    @functools.cached_property
+    def health(self):
+        return self.game_state["you"].get("health", 100)
+
+    @functools.cached_property
+    def width(self):
+        return self.game_state["board"].get("width", 11)
+
+    @functools.cached_property
+    def height(self):
+        return self.game_state["board"].get("height", 11)
+
+    @functools.cached_property
+    def num_snakes(self):
+        return len(self.snakes)
+
+    # ----------------------------------------------------------------- Futter
+
+    @functools.cached_property
+    def closest_food_distance(self):
+        """Manhattan-Distanz zum nächstgelegenen Futter."""
+        if not self.food:
+            debug("[ERROR] No food available in the game state.")
+            return self.width + self.height
+        return min([abs(f["x"] - self.my_head.x) + abs(f["y"] - self.my_head.y) for f in self.food],
+                   default=self.width + self.height)
+
+    @functools.cached_property
+    def closest_food_path_distance(self):
+        """Echte Wegdistanz (BFS-Distanzfeld) zum nächstgelegenen Futter."""
+        food_distances = [self.index.path_distance(self.my_id, f["x"], f["y"]) for f in self.food]
+        return min([d for d in food_distances if d >= 0], default=self.width + self.height)
+
+    @functools.cached_property
+    def closest_food_is_safe(self):
+        return closest_food_is_safe(self.my_head, self.food, self.game_state, self.index)
+
+    @functools.cached_property
+    def food_contest_count(self):
+        """Anzahl der umkämpften Futterfelder."""
+        try:
+            return sum(self.index.is_contested(f["x"], f["y"]) for f in self.food)
+        except Exception as e:
+            debug(f"[ERROR] food_contest_count failed: {e}")
+            debug(f"[DEBUG] food type: {type(self.food)}, food content: {self.food}")
+            return 0
+
+    @functools.cached_property
+    def path_distance_to_food(self):
+        """Wert wie beim Training (siehe trained_path_distance_to_food)."""
+        try:
+            return trained_path_distance_to_food(self.game_state, self.closest_food_distance)
+        except Exception as e:
+            debug(f"[ERROR] path_distance_to_food failed: {e}")
+            return self.closest_food_distance
+
+    @functools.cached_property
+    def next_step_path_length(self):
+        """Länge des Wegs zum Futter, den next_step wählt (0 ohne Weg)."""
         try:
             from Battlesnake.game import Game
-            game_obj = Game(game_state)
-            next_cell = next_step(game_obj)  # Pass Game object
-            path_distance_to_food = abs(my_head.x - next_cell.x) + abs(
-                my_head.y - next_cell.y) if next_cell else 0
+            game_obj = self._game if self._game is not None else Game(self.game_state)
+            return plan_step(game_obj, self.index)[1]
+        except Exception as e:
+            debug(f"[ERROR] next_step failed: {e}")
+            return 0
+
+    @functools.cached_property
+    def is_biggest_snake(self):
+        """Ist die Schlange die größte auf dem Feld?"""
+        return int(all(len(s["body"]) < self.my_length or s["id"] == self.my_id for s in self.snakes))
+
+    @functools.cached_property
+    def needs_food(self):
+        return int(self.health < 30 and not self.is_biggest_snake)
+
+    # ----------------------------------------------------------------- Platz
+
+    @functools.cached_property
+    def space(self):
+        """Freier Raum um den Schlangenkopf (Flood-Fill)."""
+        try:
+            return flood_fill_space(self.game_state, self.my_head, self.index) or 0
         except Exception as e:
-            print(f"[ERROR] next_step failed: {e}")
-            # For synthetic data, use a simple fallback
-            path_distance_to_food = closest_food_dist  # Fallback to closest food distance
+            debug(f"[ERROR] flood_fill_space failed: {e}")
+            return 0
 
-        # Berechne den freien Raum um den Schlangenkopf mit Flood-Fill
+    @functools.cached_property
+    def future_space(self):
+        """Verfügbarer Raum, wenn sich die Schlange bewegt (Vorausschau)."""
         try:
-            space = flood_fill_space(game_state, my_head) or 0
+            return recursive_future_space(self.index, self.my_head, FUTURE_SPACE_TURNS) or 0
         except Exception as e:
-            print(f"[ERROR] flood_fill_space failed: {e}")
-            space = 0
+            debug(f"[ERROR] simulate_future_space failed: {e}")
+            return 0
 
-        # Simuliere den verfügbaren Raum, wenn sich die Schlange bewegt
+    @functools.cached_property
+    def future_space_deep(self):
+        """Tail-aware Vorausschau (Bitmasken-Frontier) über FUTURE_SPACE_DEEP_TURNS Züge."""
         try:
-            future_space = simulate_future_space(game_state, my_head) or 0
+            return simulate_future_space(self.game_state, self.my_head, FUTURE_SPACE_DEEP_TURNS, self.index) or 0
         except Exception as e:
-            print(f"[ERROR] simulate_future_space failed: {e}")
-            future_space = 0
-
-        # Berechne die Distanz zum Mittelpunkt des Spielfelds für offensive Verhaltensweise
-        cx, cy = width // 2, height // 2
-        dist_to_center = abs(my_head.x - cx) + abs(my_head.y - cy)
-        center_bonus = max(0, 10 - dist_to_center)
-
-        # Überprüfe das Risiko des Verhungerns
-        food_safe = closest_food_is_safe(my_head, food, game_state)
-        hunger_risk = starvation_risk(health, closest_food_dist, food_safe)
-
-        # Überprüfe, ob ein Zug sicher ist (keine Wand, keine Selbstkollision)
-        def is_safe(move):
-            move_dx, move_dy = move
-            x, y = my_head.x + move_dx, my_head.y + move_dy
-
-            # Überprüfe, ob die Position innerhalb des Spielfelds liegt
-            if not (0 <= x < width and 0 <= y < height):
-                return 0
-
-            # Überprüfe, ob die Position von einer anderen Schlange besetzt ist
-            if {"x": x, "y": y} in all_snake_bodies:
-                return 0
-
-            # Überprüfe, ob die Position mit dem eigenen Körper kollidiert (außer Schwanz)
-            my_body = game_state["you"]["body"]
-            if len(my_body) > 1:  # Only check if snake has body parts
-                # Check if position collides with body (excluding tail which will move)
-                for i, body_part in enumerate(my_body[:-1]):  # Exclude tail
-                    if body_part["x"] == x and body_part["y"] == y:
-                        return 0
-
-            return 1
-
-        # Überprüfe, ob eine Bewegung in jede Richtung sicher ist
-        safe_up = is_safe((0, 1))
-        safe_down = is_safe((0, -1))
-        safe_left = is_safe((-1, 0))
-        safe_right = is_safe((1, 0))
-
-        # Überprüfe den verfügbaren Bereich in jede Richtung mithilfe von Flood-Fill
-        def open_area(move):
-            dx, dy = move
-            x, y = my_head.x + dx, my_head.y + dy
-            if not (0 <= x < width and 0 <= y < height):
-                return 0
-            try:
-                return flood_fill_space(game_state, Cell(x, y)) or 0
-            except Exception as e:
-                print(f"[ERROR] open_area flood_fill failed at ({x},{y}): {e}")
-                return 0
-
-        open_area_up = open_area((0, 1))
-        open_area_down = open_area((0, -1))
-        open_area_left = open_area((-1, 0))
-        open_area_right = open_area((1, 0))
-
-        # Berechne die Distanz zur nächsten Wand
-        distance_to_nearest_wall = min(my_head.x, width - 1 - my_head.x,
-                                       my_head.y, height - 1 - my_head.y)
-
-        # Berechne die Distanz zum Schlangenschwanz
-        tail = game_state["you"]["body"][-1]
-        tail_distance = abs(tail["x"] - my_head.x) + abs(tail["y"] - my_head.y)
-
-        # Überprüfe, ob die Schlange die größte auf dem Feld ist
-        def am_i_biggest():
-            return int(
-                all(
-                    len(s["body"]) < my_length or s["id"] == my_id
-                    for s in snakes))
-
-        is_biggest = am_i_biggest()
-        needs_food = int(health < 30 and not is_biggest)
-
-        # Holen der Positionen der gegnerischen Schlangenköpfe
-        enemy_heads = [
-            snake["body"][0] for snake in snakes if snake["id"] != my_id
-        ]
-        closest_enemy_head_dist = min([
-            abs(h["x"] - my_head.x) + abs(h["y"] - my_head.y)
-            for h in enemy_heads
-        ],
-                                      default=width + height)
-        enemy_head_is_adjacent = int(
-            any(
-                abs(h["x"] - my_head.x) + abs(h["y"] - my_head.y) == 1
-                for h in enemy_heads))
-        enemies_within_2 = sum(
-            abs(h["x"] - my_head.x) + abs(h["y"] - my_head.y) <= 2
-            for h in enemy_heads)
-
-        # Zähle die Anzahl der umkämpften Futterfelder
+            debug(f"[ERROR] simulate_future_space failed: {e}")
+            return 0
+
+    def _open_area(self, direction):
+        dx, dy = DIRECTIONS[direction]
+        x, y = self.my_head.x + dx, self.my_head.y + dy
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return 0
         try:
-            food_contest_count = sum(
-                is_food_contested(Cell(f["x"], f["y"]), game_state)
-                for f in food)
+            return flood_fill_space(self.game_state, Cell.at(x, y), self.index) or 0
         except Exception as e:
-            print(f"[ERROR] food_contest_count failed: {e}")
-            print(f"[DEBUG] food type: {type(food)}, food content: {food}")
-            print(
-                f"[DEBUG] game_state keys: {list(game_state.keys()) if isinstance(game_state, dict) else 'not a dict'}"
-            )
-            food_contest_count = 0
-
-        # Zähle die Anzahl der Schlangen auf dem Spielfeld
-        num_snakes = len(snakes)
-
-        # Berechne die Tötungsrichtungen (angenommen, die Schlange kann Feinde töten, wenn der Feind kleiner ist)
-        kill_up = kill_down = kill_left = kill_right = 0
-        directions = {
-            "up": (0, 1),
-            "down": (0, -1),
-            "left": (-1, 0),
-            "right": (1, 0)
-        }
-        for dir_name, (dx, dy) in directions.items():
-            nx, ny = my_head.x + dx, my_head.y + dy
-            for s in snakes:
-                if s["id"] == my_id:
-                    continue
-                if s["body"][0]["x"] == nx and s["body"][0]["y"] == ny and len(
-                        s["body"]) < my_length:
-                    if dir_name == "up": kill_up = 1
-                    elif dir_name == "down": kill_down = 1
-                    elif dir_name == "left": kill_left = 1
-                    elif dir_name == "right": kill_right = 1
-
-        # Bestimme die aktuelle Richtung der Schlange
-        if len(game_state["you"]["body"]) >= 2:
-            neck = game_state["you"]["body"][1]
-            dx = my_head.x - neck["x"]
-            dy = my_head.y - neck["y"]
-            if dx == 0 and dy == 1:
-                current_dir = "up"
-            elif dx == 0 and dy == -1:
-                current_dir = "down"
-            elif dx == 1 and dy == 0:
-                current_dir = "right"
-            elif dx == -1 and dy == 0:
-                current_dir = "left"
-            else:
-                current_dir = "up"
-        else:
-            current_dir = "up"
-
-        dir_up = int(current_dir == "up")
-        dir_down = int(current_dir == "down")
-        dir_left = int(current_dir == "left")
-        dir_right = int(current_dir == "right")
-
-        # Kombiniere alle Merkmale in eine Liste
-        features = [
-            my_head.x, my_head.y, health, width, height, closest_food_dist,
-            space, future_space, safe_up, safe_down, safe_left, safe_right,
-            open_area_up, open_area_down, open_area_left, open_area_right,
-            distance_to_nearest_wall, tail_distance, food_safe, is_biggest,
-            needs_food, closest_enemy_head_dist, enemy_head_is_adjacent,
-            enemies_within_2, kill_up, kill_down, kill_left, kill_right,
-            dir_up, dir_down, dir_left, dir_right, center_bonus,
-            food_contest_count, num_snakes, path_distance_to_food
-        ]
+            debug(f"[ERROR] open_area flood_fill failed at ({x},{y}): {e}")
+            return 0
+
+    @functools.cached_property
+    def open_area_up(self):
+        return self._open_area("up")
+
+    @functools.cached_property
+    def open_area_down(self):
+        return self._open_area("down")
+
+    @functools.cached_property
+    def open_area_left(self):
+        return self._open_area("left")
+
+    @functools.cached_property
+    def open_area_right(self):
+        return self._open_area("right")
+
+    @functools.cached_property
+    def my_territory(self):
+        """Voronoi-Territorium: Zellen, die wir zuerst erreichen."""
+        return self.index.territory_of(self.my_id)
+
+    @functools.cached_property
+    def largest_enemy_territory(self):
+        return max([self.index.territory_of(s["id"]) for s in self.snakes if s["id"] != self.my_id], default=0)
+
+    def _pocket(self, direction):
+        """Kleinstes Teil, das der Nachbar in dieser Richtung abtrennt (0 = kein Engpass)."""
+        dx, dy = DIRECTIONS[direction]
+        return min(self.index.chokepoint(self.my_head.x + dx, self.my_head.y + dy), default=0)
+
+    @functools.cached_property
+    def pocket_up(self):
+        return self._pocket("up")
+
+    @functools.cached_property
+    def pocket_down(self):
+        return self._pocket("down")
+
+    @functools.cached_property
+    def pocket_left(self):
+        return self._pocket("left")
+
+    @functools.cached_property
+    def pocket_right(self):
+        return self._pocket("right")
+
+    # ----------------------------------------------------------------- Sicherheit
+
+    @functools.cached_property
+    def safety(self):
+        """Sicherheit aller vier Richtungen (gemeinsames Orakel mit strategy und run.py)."""
+        return MoveSafety(self.index)
+
+    def _is_safe(self, direction):
+        """Ist ein Zug sicher (keine Wand, keine Kollision; nur der eigene Schwanz gilt als frei)?"""
+        return int(self.safety.is_legal_or_own_tail(direction))
+
+    @functools.cached_property
+    def safe_up(self):
+        return self._is_safe("up")
+
+    @functools.cached_property
+    def safe_down(self):
+        return self._is_safe("down")
+
+    @functools.cached_property
+    def safe_left(self):
+        return self._is_safe("left")
+
+    @functools.cached_property
+    def safe_right(self):
+        return self._is_safe("right")
+
+    def _will_be_free(self, direction):
+        """Ist das Feld im nächsten Zug frei (auf dem Brett, frei oder frei werdender Schwanz)?"""
+        return int(self.safety.will_be_free(direction))
+
+    @functools.cached_property
+    def will_be_free_up(self):
+        return self._will_be_free("up")
+
+    @functools.cached_property
+    def will_be_free_down(self):
+        return self._will_be_free("down")
+
+    @functools.cached_property
+    def will_be_free_left(self):
+        return self._will_be_free("left")
+
+    @functools.cached_property
+    def will_be_free_right(self):
+        return self._will_be_free("right")
+
+    @functools.cached_property
+    def template(self):
+        """Distanzgitter der Feldgröße (gecacht pro width/height)."""
+        return BoardTemplate.for_size(self.width, self.height)
+
+    @functools.cached_property
+    def distance_to_nearest_wall(self):
+        return int(self.template.wall_distance[self.my_head.x, self.my_head.y])
+
+    @functools.cached_property
+    def tail_distance(self):
+        tail = self.game_state["you"]["body"][-1]
+        return abs(tail["x"] - self.my_head.x) + abs(tail["y"] - self.my_head.y)
+
+    @functools.cached_property
+    def center_bonus(self):
+        """Nähe zum Mittelpunkt des Spielfelds für offensive Verhaltensweise."""
+        return int(self.template.center_bonus[self.my_head.x, self.my_head.y])
+
+    # ----------------------------------------------------------------- Gegner
+
+    @functools.cached_property
+    def _enemy_head_distances(self):
+        """Manhattan-Distanzen zu den gegnerischen Köpfen."""
+        return [abs(h["x"] - self.my_head.x) + abs(h["y"] - self.my_head.y) for h in self.enemy_heads]
+
+    @functools.cached_property
+    def _enemy_head_path_distances(self):
+        """Wegdistanzen zu den gegnerischen Köpfen aus dem Distanzfeld (Körper blockieren)."""
+        distances = (self.index.path_distance(self.my_id, h["x"], h["y"]) for h in self.enemy_heads)
+        return [d for d in distances if d >= 0]
+
+    @functools.cached_property
+    def closest_enemy_head_dist(self):
+        return min(self._enemy_head_distances, default=self.width + self.height)
+
+    @functools.cached_property
+    def closest_enemy_head_path_dist(self):
+        return min(self._enemy_head_path_distances, default=self.width + self.height)
+
+    @functools.cached_property
+    def enemy_head_is_adjacent(self):
+        return int(any(snake_id != self.my_id
+                       for snake_id, _ in self.index.adjacent_heads(self.my_head.x, self.my_head.y)))
+
+    @functools.cached_property
+    def enemies_within_2(self):
+        return sum(d <= 2 for d in self._enemy_head_distances)
+
+    @functools.cached_property
+    def enemies_within_2_path(self):
+        return sum(d <= 2 for d in self._enemy_head_path_distances)
+
+    def _kill(self, direction):
+        """Kann in diese Richtung ein kleinerer gegnerischer Kopf geschlagen werden?"""
+        dx, dy = DIRECTIONS[direction]
+        return int(self.index.kill_target(self.my_id, self.my_head.x + dx, self.my_head.y + dy))
+
+    @functools.cached_property
+    def kill_up(self):
+        return self._kill("up")
+
+    @functools.cached_property
+    def kill_down(self):
+        return self._kill("down")
+
+    @functools.cached_property
+    def kill_left(self):
+        return self._kill("left")
+
+    @functools.cached_property
+    def kill_right(self):
+        return self._kill("right")
+
+    # ----------------------------------------------------------------- Richtung
+
+    @functools.cached_property
+    def current_dir(self):
+        """Aktuelle Richtung der Schlange (Kopf relativ zum Hals)."""
+        body = self.game_state["you"]["body"]
+        if len(body) < 2:
+            return "up"
+        dx = self.my_head.x - body[1]["x"]
+        dy = self.my_head.y - body[1]["y"]
+        for name, delta in DIRECTIONS.items():
+            if delta == (dx, dy):
+                return name
+        return "up"
+
+    @functools.cached_property
+    def dir_up(self):
+        return int(self.current_dir == "up")
+
+    @functools.cached_property
+    def dir_down(self):
+        return int(self.current_dir == "down")
+
+    @functools.cached_property
+    def dir_left(self):
+        return int(self.current_dir == "left")
+
+    @functools.cached_property
+    def dir_right(self):
+        return int(self.current_dir == "right")
+
+
+def materialize(features):
+    """
+    Berechnet alle Merkmale eines LazyFeatures-Objekts und prüft den Vektor.
+
+    :param features: LazyFeatures des Zugs
+    :return: Eine Liste von Merkmalen, die das Modell verwenden kann, oder None bei Fehlern.
+    """
+    try:
+        values = features.values()
 
         # Überprüfe die Merkmalsliste auf ungültige Werte
-        if any(f is None for f in features) or len(features) != 36:
-            print(
-                "[WARNING] Feature vector contains invalid values → Logging skipped."
-            )
+        if any(f is None for f in values) or len(values) != len(FEATURE_COLUMNS):
+            debug("[WARNING] Feature vector contains invalid values → Logging skipped.")
             return None
 
-        print(f"[DEBUG] Extracted features: {features}")
-        return features
+        debug(f"[DEBUG] Extracted features: {values}")
+        return values
 
     except Exception as fatal_error:
-        print(f"[FATAL] Error during feature computation: {fatal_error}")
+        debug(f"[FATAL] Error during feature computation: {fatal_error}")
+        return None
+
+
+def ml_features(game_state, index=None, game=None):
+    """
+    Extrahiert Merkmale aus dem aktuellen Spielzustand für das ML-Modell,
+    einschließlich der Logik, um Verhungern zu vermeiden, und integriert Pfadfindung für Bewegungsentscheidungen.
+
+    Berechnet alle Merkmale sofort; für die Berechnung nur bei Bedarf siehe LazyFeatures.
+
+    :param game_state: Der aktuelle Spielzustand im JSON-Format.
+    :param index: BoardIndex des aktuellen Zugs; wird sonst hier einmalig gebaut.
+    :param game: Game-Objekt aus der Session; wird sonst aus game_state gebaut.
+    :return: Eine Liste von Merkmalen, die das Modell verwenden kann.
+    """
+    debug("[DEBUG] Feature extraction started...")
+    debug(f"[DEBUG] game_state type: {type(game_state)}")
+
+    # Überprüfe, ob game_state die notwendigen Schlüssel enthält
+    if not isinstance(game_state, dict):
+        debug("[ERROR] game_state is not a dictionary")
         return None
+
+    return materialize(LazyFeatures(game_state, index, game))
@@ -8,12 +8,15 @@
 
 import os
 from flask import Flask, request, jsonify
-import pandas as pd
 import traceback
 from joblib import load
 from pathlib import Path
 
-from LightGBM.ml_features import ml_features
+from Battlesnake.board_index import BoardIndex
+from Battlesnake.board_state import BoardState
+from Battlesnake.safety import MOVES, MoveSafety
+from Battlesnake.server import serve
+from LightGBM.ml_features import ml_features, model_input, FEATURE_COLUMNS
 
 app = Flask(__name__)
 
@@ -44,6 +47,7 @@ def load_model(path):
 
 
 model = load_model(model_path)
+_MOVE_NAMES = {move for move, _ in MOVES}
 
 
 @app.route("/start", methods=["POST"])
@@ -82,18 +86,17 @@ def move():
     try:
         # Validierung des Request-JSON
         try:
-            game_state = request.get_json()
-            if not game_state:
-                print("[ERROR] Ungültiges JSON im Request erhalten.")
-                return jsonify({"move": "up"})
+            state = BoardState.decode(request.get_data())
+            game_state = state.game_state
         except Exception as e:
             print(f"[ERROR] Fehler beim Parsen des Request-JSON: {e}")
             return jsonify({"move": "up"})
 
-        # Extrahiere Features
-        features = ml_features(game_state)
+        # Extrahiere Features (ein BoardIndex für Features und Sicherheitsprüfung)
+        index = BoardIndex(game_state, state)
+        features = ml_features(game_state, index)
 
-        if not features or len(features) != 36:
+        if not features or len(features) != len(FEATURE_COLUMNS):
             print(
                 "[ERROR] Ungültiger Merkmalsvektor erhalten, Vorhersage wird übersprungen."
             )
@@ -107,62 +110,19 @@ def move():
             return jsonify({"move": "up"})  # Oder ein sicherer Fallback-Zug
 
         try:
-            columns = [
-                "head_x", "head_y", "health", "width", "height",
-                "closest_food_distance", "space", "future_space", "safe_up",
-                "safe_down", "safe_left", "safe_right", "open_area_up",
-                "open_area_down", "open_area_left", "open_area_right",
-                "distance_to_nearest_wall", "tail_distance",
-                "closest_food_is_safe", "is_biggest_snake", "needs_food",
-                "closest_enemy_head_dist", "enemy_head_is_adjacent",
-                "enemies_within_2", "kill_up", "kill_down", "kill_left",
-                "kill_right", "dir_up", "dir_down", "dir_left", "dir_right",
-                "center_bonus", "food_contest_count", "num_snakes",
-                "path_distance_to_food"
-            ]
-            # Only use columns for DataFrame creation
-            features_df = pd.DataFrame([features],
-                                       columns=columns)  # type: ignore
+            features_df = model_input(features, model)
             prediction = model.predict(features_df)[0]
             print(f"[ML] Vorhergesagter Zug: {prediction}")
 
             # --- Final move safety check ---
-            def is_safe_move(move, game_state):
-                moves = {
-                    "up": (0, 1),
-                    "down": (0, -1),
-                    "left": (-1, 0),
-                    "right": (1, 0)
-                }
-                my_head = game_state["you"]["body"][0]
-                width = game_state["board"]["width"]
-                height = game_state["board"]["height"]
-                snakes = game_state["board"]["snakes"]
-                my_id = game_state["you"]["id"]
-                all_snake_bodies = [
-                    coord for snake in snakes for coord in snake["body"]
-                ]
-                dx, dy = moves[move]
-                nx, ny = my_head["x"] + dx, my_head["y"] + dy
-                # Check wall
-                if not (0 <= nx < width and 0 <= ny < height):
-                    return False
-                # Check self or other snake collision
-                if {"x": nx, "y": ny} in all_snake_bodies:
-                    return False
-                return True
-
-            if not is_safe_move(prediction, game_state):
+            safety = MoveSafety(index)
+            if prediction not in _MOVE_NAMES or not safety.is_legal(prediction):
                 print(
                     f"[SAFETY] ML predicted move '{prediction}' is unsafe! Choosing fallback."
                 )
-                # Try to pick a safe move
-                for move in ["up", "down", "left", "right"]:
-                    if is_safe_move(move, game_state):
-                        print(f"[SAFETY] Fallback safe move: {move}")
-                        return jsonify({"move": move})
-                print("[SAFETY] No safe moves found. Returning 'up'.")
-                return jsonify({"move": "up"})
+                fallback = safety.fallback()
+                print(f"[SAFETY] Fallback move: {fallback}")
+                return jsonify({"move": fallback})
             # --- End safety check ---
             return jsonify({"move": prediction})
         except Exception as ml_error:
@@ -182,6 +142,8 @@ if __name__ == "__main__":
     """
     Startet den Battlesnake-Server lokal auf Port 8000.
     Der Debug-Modus ist aktiviert. Dieser kann in der Datei 'utils.py' durch Setzen von DEBUG = False deaktiviert werden.
+    Mit SERVER_MODE=production läuft stattdessen gunicorn (siehe server.serve); das Modell
+    ist dann schon beim Import im Elternprozess geladen.
     """
     print("[INFO] Starte Battlesnake-Server...")
-    app.run(host="0.0.0.0", port=8000, debug=True)
+    serve(app, "0.0.0.0", 8000)
@@ -16,52 +16,15 @@ from sklearn.preprocessing import StandardScaler
 from joblib import dump
 import matplotlib.pyplot as plt
 from imblearn.under_sampling import RandomUnderSampler
+from LightGBM.ml_features import FEATURE_COLUMNS
 
 # Basis-Verzeichnis festlegen
 base_dir = Path(__file__).resolve().parent.parent
 csv_path = base_dir / "simple_synthetic_data.csv"  # Use our synthetic data
 model_path = base_dir / "insane_model.pkl"  # Match the expected model name
 
-# Erwartete Spaltennamen
-expected_columns = [
-    "head_x",
-    "head_y",
-    "health",
-    "width",
-    "height",
-    "closest_food_distance",
-    "space",
-    "future_space",
-    "safe_up",
-    "safe_down",
-    "safe_left",
-    "safe_right",
-    "open_area_up",
-    "open_area_down",
-    "open_area_left",
-    "open_area_right",
-    "distance_to_nearest_wall",
-    "tail_distance",
-    "closest_food_is_safe",
-    "is_biggest_snake",
-    "needs_food",
-    "closest_enemy_head_dist",
-    "enemy_head_is_adjacent",
-    "enemies_within_2",
-    "kill_up",
-    "kill_down",
-    "kill_left",
-    "kill_right",
-    "dir_up",
-    "dir_down",
-    "dir_left",
-    "dir_right",
-    "center_bonus",
-    "food_contest_count",
-    "num_snakes",
-    "path_distance_to_food",  # New column
-    "move"  # Zielspalte
-]
+# Erwartete Spaltennamen (Features + Zielspalte)
+expected_columns = FEATURE_COLUMNS + ["move"]
 
 # Überprüfe, ob die CSV-Datei existiert
 if not csv_path.exists():
@@ -86,7 +49,9 @@ if "move" not in data.columns:
     print(
         "[INFO] Keine Spaltenüberschriften gefunden — werden automatisch gesetzt."
     )
-    data = pd.read_csv(csv_path, names=expected_columns)
+    # Ältere Dateien haben weniger Features; die Breite ergibt sich aus der Zeilenlänge
+    data = pd.read_csv(csv_path, header=None)
+    data.columns = FEATURE_COLUMNS[:len(data.columns) - 1] + ["move"]
 
 # Duplikate entfernen
 data.drop_duplicates(inplace=True)
@@ -103,16 +68,8 @@ if "move" not in data.columns:
     print("[FEHLER] Spalte 'move' fehlt – Trainingsdaten ungültig.")
     exit()
 
-feature_columns = [
-    "head_x", "head_y", "health", "width", "height", "closest_food_distance",
-    "space", "future_space", "safe_up", "safe_down", "safe_left", "safe_right",
-    "open_area_up", "open_area_down", "open_area_left", "open_area_right",
-    "distance_to_nearest_wall", "tail_distance", "closest_food_is_safe",
-    "is_biggest_snake", "needs_food", "closest_enemy_head_dist",
-    "enemy_head_is_adjacent", "enemies_within_2", "kill_up", "kill_down",
-    "kill_left", "kill_right", "dir_up", "dir_down", "dir_left", "dir_right",
-    "center_bonus", "food_contest_count", "num_snakes", "path_distance_to_food"
-]
+# Ältere CSV-Dateien enthalten die später angehängten Features noch nicht
+feature_columns = [col for col in FEATURE_COLUMNS if col in data.columns]
 
 X = data[feature_columns]
 y = data["move"]
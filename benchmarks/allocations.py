@@ -0,0 +1,72 @@
+# Gruppe 3 – Battlesnake Projekt (SS2025)
+# Mitglieder:
+# Eren Temizkan, 223201982
+# Dominik Ide, 220200046
+# Dogukan Karakoyun, 223202023
+# Alexandra Holsten, 221200813
+# Yuxiao Wu, 223200006
+
+"""
+Zählt die pro Zug neu erzeugten Cell-Objekte (Heatmap, Features, A*-Fallback).
+
+Aufruf aus dem Projektverzeichnis:  python -m benchmarks.allocations
+"""
+
+import Battlesnake.utils as utils
+from Battlesnake.board_index import BoardIndex
+from Battlesnake.game import Cell, Game
+from Battlesnake.heatmap import build_heatmap
+from Battlesnake.path_fallback import PathSolver
+from LightGBM.ml_features import ml_features
+from benchmarks.boards import board_suite
+from benchmarks.quiet import quiet
+
+
+def count_cell_allocations():
+    """
+    Zählt jeden Aufruf von Cell.__init__ mit.
+
+    :return: Zähler-Dictionary
+    """
+    counter = {"cells": 0}
+    original = Cell.__init__
+
+    def counting(self, x, y):
+        counter["cells"] += 1
+        original(self, x, y)
+
+    Cell.__init__ = counting
+    return counter
+
+
+def run_move_pipeline(game_state):
+    """
+    Heatmap, Features und A*-Fallback eines Zugs.
+
+    :param game_state: Spielzustand
+    """
+    head = game_state["you"]["body"][0]
+    index = BoardIndex(game_state)
+    ml_features(game_state, index)
+    build_heatmap(game_state, Cell.at(head["x"], head["y"]), game_state["you"]["health"], index)
+
+    game = Game(game_state)
+    solver = PathSolver(game)
+    for food in game.ownfood:
+        solver.astar(game.you.body[0], food)
+
+
+def main():
+    utils.DEBUG = False
+    counter = count_cell_allocations()
+    print(f"{'board':>8} {'Cell allocations/move':>22}")
+    for name, game_state in board_suite():
+        with quiet():
+            run_move_pipeline(game_state)  # Aufwärmen (Tabellen pro Feldgröße)
+            counter["cells"] = 0
+            run_move_pipeline(game_state)
+        print(f"{name:>8} {counter['cells']:>22}")
+
+
+if __name__ == "__main__":
+    main()
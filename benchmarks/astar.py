@@ -0,0 +1,59 @@
+# Gruppe 3 – Battlesnake Projekt (SS2025)
+# Mitglieder:
+# Eren Temizkan, 223201982
+# Dominik Ide, 220200046
+# Dogukan Karakoyun, 223202023
+# Alexandra Holsten, 221200813
+# Yuxiao Wu, 223200006
+
+"""
+Mikro-Benchmark für die A*-Suche: expandierte Knoten pro Sekunde auf 11x11, 19x19 und 25x25.
+
+Aufruf aus dem Projektverzeichnis:  python -m benchmarks.astar
+"""
+
+import random
+import time
+
+from Battlesnake.game import Cell, Game
+from Battlesnake.path_fallback import PathSolver
+from benchmarks.boards import random_game_state
+
+
+class CountingPathSolver(PathSolver):
+    """PathSolver, der jede Knotenexpansion mitzählt."""
+
+    def __init__(self, game: Game):
+        super().__init__(game)
+        self.expansions = 0
+
+    def path_neighbors(self, node):
+        self.expansions += 1
+        return super().path_neighbors(node)
+
+
+def main():
+    repeats = 50
+    print(f"{'board':>8} {'expansions':>11} {'ms/search':>10} {'expansions/s':>13}")
+    for size in (11, 19, 25):
+        game = Game(random_game_state(size, size, 1, seed=size, min_length=1, max_length=1, num_food=0))
+        rng = random.Random(size)
+        solver = CountingPathSolver(game)
+        # zufällige Hindernisse (ca. 25 %), Start und Ziel in gegenüberliegenden Ecken
+        start, goal = Cell.at(0, 0), Cell.at(size - 1, size - 1)
+        solver.forbidden_cells = {
+            Cell.at(x, y) for x in range(size) for y in range(size)
+            if rng.random() < 0.25 and Cell.at(x, y) not in (start, goal)
+        }
+
+        began = time.perf_counter()
+        for _ in range(repeats):
+            solver.astar(start, goal)
+        elapsed = time.perf_counter() - began
+        expansions = solver.expansions / repeats
+        print(f"{size}x{size:<5} {expansions:>11.0f} {elapsed * 1000 / repeats:>10.2f} "
+              f"{solver.expansions / elapsed:>13.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# Gruppe 3 – Battlesnake Projekt (SS2025)
+# Mitglieder:
+# Eren Temizkan, 223201982
+# Dominik Ide, 220200046
+# Dogukan Karakoyun, 223202023
+# Alexandra Holsten, 221200813
+# Yuxiao Wu, 223200006
+
+"""
+Zählt, wie oft pro Zug die blockierten Felder aufgebaut werden.
+
+Aufruf aus dem Projektverzeichnis:  python -m benchmarks.board_index
+"""
+
+import time
+
+import Battlesnake.utils as utils
+from Battlesnake.board_index import BoardIndex
+from Battlesnake.game import Cell
+from Battlesnake.heatmap import build_heatmap
+from LightGBM.ml_features import ml_features
+from benchmarks.boards import board_suite
+from benchmarks.quiet import quiet
+
+
+def run_move_pipeline(game_state):
+    """
+    Führt Heatmap und Feature-Extraktion so aus wie strategy.move (ein Index pro Zug).
+
+    :param game_state: Spielzustand
+    """
+    head = game_state["you"]["body"][0]
+    index = BoardIndex(game_state)
+    ml_features(game_state, index)
+    build_heatmap(game_state, Cell.at(head["x"], head["y"]), game_state["you"]["health"], index)
+
+
+def count_queries():
+    """
+    Zählt die Flood-Fill-Anfragen am Index. Vor dem BoardIndex hat jede dieser Anfragen
+    die blockierten Felder komplett neu aufgebaut.
+
+    :return: Zähler-Dictionary, das bei jedem Aufruf hochgezählt wird
+    """
+    counter = {"queries": 0}
+    original = BoardIndex.flood_fill_space
+
+    def counting(self, start):
+        counter["queries"] += 1
+        return original(self, start)
+
+    BoardIndex.flood_fill_space = counting
+    return counter
+
+
+def main():
+    utils.DEBUG = False
+    repeats = 20
+    counter = count_queries()
+    print(f"{'board':>8} {'flood fills/move':>17} {'builds/move':>12} {'ms/move':>10}")
+    for name, game_state in board_suite():
+        BoardIndex.builds = 0
+        counter["queries"] = 0
+        start = time.perf_counter()
+        with quiet():
+            for _ in range(repeats):
+                run_move_pipeline(game_state)
+        elapsed = (time.perf_counter() - start) * 1000 / repeats
+        print(f"{name:>8} {counter['queries'] / repeats:>17.1f} "
+              f"{BoardIndex.builds / repeats:>12.1f} {elapsed:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# Gruppe 3 – Battlesnake Projekt (SS2025)
+# Mitglieder:
+# Eren Temizkan, 223201982
+# Dominik Ide, 220200046
+# Dogukan Karakoyun, 223202023
+# Alexandra Holsten, 221200813
+# Yuxiao Wu, 223200006
+
+import random
+import typing
+
+DIRECTIONS = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+
+
+def random_game_state(width: int = 11,
+                      height: int = 11,
+                      num_snakes: int = 4,
+                      seed: int = 0,
+                      min_length: int = 3,
+                      max_length: int = 30,
+                      num_food: int = 6) -> typing.Dict:
+    """
+    Erzeugt einen zufälligen, aber gültigen game_state im Format der Battlesnake-API.
+
+    Schlangen werden als zufällige, sich nicht überschneidende Pfade gelegt. Der erste
+    Eintrag in board.snakes ist immer "you".
+
+    :param width: Spielfeldbreite
+    :param height: Spielfeldhöhe
+    :param num_snakes: Anzahl Schlangen
+    :param seed: Seed für reproduzierbare Bretter
+    :param min_length: minimale Schlangenlänge
+    :param max_length: maximale Schlangenlänge
+    :param num_food: Anzahl Futterfelder
+    :return: game_state als Dictionary
+    """
+    rng = random.Random(seed)
+    occupied: set[tuple[int, int]] = set()
+    snakes = []
+
+    for i in range(num_snakes):
+        free = [(x, y) for x in range(width) for y in range(height) if (x, y) not in occupied]
+        if not free:
+            break
+        body = [rng.choice(free)]
+        occupied.add(body[0])
+        target = rng.randint(min_length, max_length)
+        while len(body) < target:
+            cx, cy = body[-1]
+            options = [(cx + dx, cy + dy) for dx, dy in DIRECTIONS
+                       if 0 <= cx + dx < width and 0 <= cy + dy < height
+                       and (cx + dx, cy + dy) not in occupied]
+            if not options:
+                break
+            cell = rng.choice(options)
+            body.append(cell)
+            occupied.add(cell)
+
+        body_json = [{"x": x, "y": y} for x, y in body]
+        snakes.append({
+            "id": f"snake-{i}",
+            "name": f"snake-{i}",
+            "health": rng.randint(1, 100),
+            "body": body_json,
+            "latency": "0",
+            "head": dict(body_json[0]),
+            "length": len(body_json),
+            "shout": "",
+            "customizations": {}
+        })
+
+    food = []
+    free = [(x, y) for x in range(width) for y in range(height) if (x, y) not in occupied]
+    for x, y in rng.sample(free, min(num_food, len(free))):
+        food.append({"x": x, "y": y})
+
+    return {
+        "game": {"id": f"bench-{seed}", "ruleset": {"name": "standard", "version": "v1.0.0"},
+                 "map": "standard", "timeout": 500, "source": "custom"},
+        "turn": rng.randint(0, 300),
+        "board": {"width": width, "height": height, "food": food, "hazards": [], "snakes": snakes},
+        "you": snakes[0]
+    }
+
+
+def board_suite(seed: int = 0) -> list[tuple[str, typing.Dict]]:
+    """
+    Standard-Bretter für alle Benchmarks: 11x11 bis 25x25, jeweils mit 8 Schlangen.
+
+    :param seed: Seed für reproduzierbare Bretter
+    :return: Liste von (Name, game_state)
+    """
+    return [
+        (f"{size}x{size}", random_game_state(size, size, 8, seed))
+        for size in (11, 19, 25)
+    ]
@@ -0,0 +1,77 @@
+# Gruppe 3 – Battlesnake Projekt (SS2025)
+# Mitglieder:
+# Eren Temizkan, 223201982
+# Dominik Ide, 220200046
+# Dogukan Karakoyun, 223202023
+# Alexandra Holsten, 221200813
+# Yuxiao Wu, 223200006
+
+"""
+Parsen + Umwandeln eines /move-Bodys: Dictionary-Pfad (json + Walk über die Dictionaries)
+gegen BoardState (orjson + flache Zellindizes) jeweils inklusive Aufbau des BoardIndex.
+
+Aufruf aus dem Projektverzeichnis:  python -m benchmarks.decode
+"""
+
+import json
+import time
+
+from Battlesnake import board_state
+from Battlesnake.board_index import BoardIndex
+from Battlesnake.board_state import BoardState
+from benchmarks.boards import random_game_state
+
+
+def dict_path(payload: bytes):
+    """
+    Bisheriger Weg: request.get_json() und danach Koordinaten pro Segment aus den
+    Dictionaries lesen (so wie der BoardIndex es vor dem BoardState getan hat).
+    """
+    game_state = json.loads(payload)
+    width = game_state["board"]["width"]
+    occupancy = bytearray(width * game_state["board"]["height"])
+    body_mask = 0
+    for snake in game_state["board"]["snakes"]:
+        for seg in snake["body"]:
+            index = seg["y"] * width + seg["x"]
+            occupancy[index] += 1
+            body_mask |= 1 << index
+    return occupancy, body_mask
+
+
+def state_path(payload: bytes):
+    """Neuer Weg des Servers: BoardState.decode und BoardIndex aus den flachen Arrays."""
+    state = BoardState.decode(payload)
+    index = BoardIndex(state.game_state, state)
+    return index.occupancy, index.body_mask
+
+
+def main():
+    repeats = 500
+    print(f"{'board':>8} {'bytes':>7} {'dict ms':>9} {'state ms':>9} {'state (json) ms':>16}")
+    for size in (11, 19, 25):
+        game_state = random_game_state(size, size, 8, seed=1, min_length=size, max_length=size * 3)
+        payload = json.dumps(game_state).encode()
+        assert dict_path(payload) == state_path(payload)
+
+        timings = []
+        for func in (dict_path, state_path):
+            start = time.perf_counter()
+            for _ in range(repeats):
+                func(payload)
+            timings.append((time.perf_counter() - start) * 1000 / repeats)
+
+        # gleicher BoardState-Weg ohne orjson, um den Anteil des Parsers zu zeigen
+        orjson, board_state.orjson = board_state.orjson, None
+        start = time.perf_counter()
+        for _ in range(repeats):
+            state_path(payload)
+        timings.append((time.perf_counter() - start) * 1000 / repeats)
+        board_state.orjson = orjson
+
+        name = f"{size}x{size}"
+        print(f"{name:>8} {len(payload):>7} {timings[0]:>9.3f} {timings[1]:>9.3f} {timings[2]:>16.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# Gruppe 3 – Battlesnake Projekt (SS2025)
+# Mitglieder:
+# Eren Temizkan, 223201982
+# Dominik Ide, 220200046
+# Dogukan Karakoyun, 223202023
+# Alexandra Holsten, 221200813
+# Yuxiao Wu, 223200006
+
+"""
+Vergleicht die Listen-Heatmap (heatmap.py) mit der NumPy-Heatmap (heatmap_array.py).
+
+Aufruf aus dem Projektverzeichnis:  python -m benchmarks.heatmap
+"""
+
+import time
+
+import numpy as np
+
+import Battlesnake.utils as utils
+from Battlesnake import heatmap, heatmap_array
+from Battlesnake.board_index import BoardIndex
+from Battlesnake.game import Cell
+from benchmarks.boards import board_suite
+
+
+def timed(build, game_state, index, repeats):
+    """
+    Misst nur die Layer von build_heatmap. Der BoardIndex (Distanzfelder, Regionen) ist
+    schon aufgebaut, da er pro Zug ohnehin für alle Stufen gebaut wird.
+
+    :return: (letzte Heatmap, ms pro Aufruf)
+    """
+    head = game_state["you"]["body"][0]
+    my_head = Cell.at(head["x"], head["y"])
+    health = game_state["you"]["health"]
+    start = time.perf_counter()
+    for _ in range(repeats):
+        result = build(game_state, my_head, health, index)
+    return result, (time.perf_counter() - start) * 1000 / repeats
+
+
+def main():
+    utils.DEBUG = False
+    repeats = 200
+    print(f"{'board':>8} {'list ms':>9} {'numpy ms':>9} {'speedup':>8}")
+    for name, game_state in board_suite():
+        index = BoardIndex(game_state)
+        index.distance_fields()
+        index.label_regions()
+        as_list, list_ms = timed(heatmap.build_heatmap, game_state, index, repeats)
+        as_array, array_ms = timed(heatmap_array.build_heatmap, game_state, index, repeats)
+        assert np.array_equal(np.array(as_list), as_array)
+        print(f"{name:>8} {list_ms:>9.3f} {array_ms:>9.3f} {list_ms / array_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
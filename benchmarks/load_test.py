@@ -0,0 +1,80 @@
+# Gruppe 3 – Battlesnake Projekt (SS2025)
+# Mitglieder:
+# Eren Temizkan, 223201982
+# Dominik Ide, 220200046
+# Dogukan Karakoyun, 223202023
+# Alexandra Holsten, 221200813
+# Yuxiao Wu, 223200006
+
+"""
+Lasttest gegen einen laufenden Server: mehrere Spiele gleichzeitig, jedes mit /start,
+einer Reihe von /move-Requests und /end. Gemessen werden Durchsatz und Latenzen.
+
+Server starten (z. B. SERVER_MODE=production WEB_THREADS=8 python -m Battlesnake.main),
+dann aus dem Projektverzeichnis:
+
+    python -m benchmarks.load_test --url http://localhost:8000 --games 16 --moves 50
+"""
+
+import argparse
+import json
+import statistics
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.boards import random_game_state
+
+
+def post(url: str, payload: dict) -> float:
+    """
+    Sendet einen POST-Request und misst die Antwortzeit.
+
+    :return: Latenz in ms
+    """
+    data = json.dumps(payload).encode()
+    req = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"})
+    start = time.perf_counter()
+    with urllib.request.urlopen(req, timeout=10) as response:
+        response.read()
+    return (time.perf_counter() - start) * 1000
+
+
+def play(url: str, game: int, moves: int, size: int) -> list[float]:
+    """
+    Spielt ein Spiel gegen den Server: /start, `moves` mal /move, /end.
+
+    :return: Latenzen der /move-Requests in ms
+    """
+    states = [random_game_state(size, size, 8, seed=game * 1000 + turn) for turn in range(moves)]
+    for turn, game_state in enumerate(states):
+        game_state["game"]["id"] = f"load-{game}"
+        game_state["turn"] = turn
+
+    post(f"{url}/start", states[0])
+    latencies = [post(f"{url}/move", game_state) for game_state in states]
+    post(f"{url}/end", states[-1])
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--games", type=int, default=16, help="gleichzeitige Spiele")
+    parser.add_argument("--moves", type=int, default=50, help="Züge pro Spiel")
+    parser.add_argument("--size", type=int, default=11, help="Feldgröße")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.games) as pool:
+        results = list(pool.map(lambda g: play(args.url, g, args.moves, args.size), range(args.games)))
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(ms for game in results for ms in game)
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(f"{len(latencies)} moves in {elapsed:.2f}s → {len(latencies) / elapsed:.1f} moves/s")
+    print(f"latency ms: p50={statistics.median(latencies):.2f} p99={p99:.2f} max={latencies[-1]:.2f}")
+
+
+if __name__ == "__main__":
+    main()
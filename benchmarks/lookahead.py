@@ -0,0 +1,70 @@
+# Gruppe 3 – Battlesnake Projekt (SS2025)
+# Mitglieder:
+# Eren Temizkan, 223201982
+# Dominik Ide, 220200046
+# Dogukan Karakoyun, 223202023
+# Alexandra Holsten, 221200813
+# Yuxiao Wu, 223200006
+
+"""
+Kosten der Vorausschau (simulate_future_space) in Abhängigkeit von der Suchtiefe.
+
+Die alte Rekursion lief jeden Pfad einzeln ab (bis zu 4 * 3^(t-1) Blätter, jedes mit eigenem
+Flood-Fill); die Frontier-Masken wachsen nur linear mit der Tiefe.
+
+Aufruf aus dem Projektverzeichnis:  python -m benchmarks.lookahead
+"""
+
+import time
+
+from Battlesnake.board_index import BoardIndex
+from Battlesnake.game import Cell
+from Battlesnake.lookahead import future_space
+from benchmarks.boards import board_suite
+
+
+def recursive_paths(index, x, y, turns, visited):
+    """
+    Nachbau der früheren Rekursion (ohne Memo), als Vergleich für die Pfadanzahl.
+
+    :return: Anzahl der besuchten Blätter
+    """
+    if turns == 0:
+        index.flood_fill_space(Cell.at(x, y))
+        return 1
+    visited = visited | {(x, y)}
+    leaves = 0
+    for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+        nx, ny = x + dx, y + dy
+        if index.in_bounds(nx, ny) and (nx, ny) not in visited:
+            leaves += recursive_paths(index, nx, ny, turns - 1, visited)
+    return leaves
+
+
+def timed(func, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        result = func()
+    return result, (time.perf_counter() - start) * 1000 / repeats
+
+
+def main():
+    repeats = 20
+    print(f"{'board':>8} {'turns':>6} {'frontier ms':>12} {'paths':>8} {'recursive ms':>13}")
+    for name, game_state in board_suite():
+        head = game_state["you"]["body"][0]
+        start = Cell.at(head["x"], head["y"])
+        for turns in (2, 4, 6, 8, 10):
+            index = BoardIndex(game_state)
+            _, frontier_ms = timed(lambda: future_space(index, start, turns), repeats)
+            if turns <= 8:
+                paths, recursive_ms = timed(
+                    lambda: recursive_paths(index, start.x, start.y, turns, set()), 1)
+                recursive = f"{paths:>8} {recursive_ms:>13.2f}"
+            else:
+                recursive = f"{'-':>8} {'-':>13}"
+            print(f"{name:>8} {turns:>6} {frontier_ms:>12.3f} {recursive}")
+
+
+if __name__ == "__main__":
+    main()
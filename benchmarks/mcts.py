@@ -0,0 +1,69 @@
+# Gruppe 3 – Battlesnake Projekt (SS2025)
+# Mitglieder:
+# Eren Temizkan, 223201982
+# Dominik Ide, 220200046
+# Dogukan Karakoyun, 223202023
+# Alexandra Holsten, 221200813
+# Yuxiao Wu, 223200006
+
+"""
+Rollouts pro Sekunde und Kern der MCTS (mcts.py): im eigenen Prozess und mit dem Worker-Pool.
+
+Aufruf aus dem Projektverzeichnis:  python -m benchmarks.mcts [Worker]
+"""
+
+import os
+import sys
+import time
+
+import Battlesnake.utils as utils
+from Battlesnake.anytime import Deadline
+from Battlesnake.board_index import BoardIndex
+from Battlesnake.game import Cell
+from Battlesnake.heatmap_array import build_heatmap
+from Battlesnake.mcts import Engine, Tree
+from benchmarks.search import search_boards
+
+BUDGET_MS = 200
+
+
+def measure(engine: Engine, boards) -> tuple[int, float]:
+    """
+    Lässt die Engine jedes Brett BUDGET_MS lang durchsuchen.
+
+    :return: (Rollouts gesamt, Zeit gesamt in ms)
+    """
+    total = 0
+    elapsed = 0.0
+    for _, game_state in boards:
+        head = game_state["you"]["body"][0]
+        index = BoardIndex(game_state)
+        heatmap = build_heatmap(game_state, Cell.at(head["x"], head["y"]), game_state["you"]["health"], index)
+        start = time.perf_counter()
+        _, rollouts = engine.search(index, heatmap, Deadline(BUDGET_MS, start), Tree())
+        elapsed += (time.perf_counter() - start) * 1000
+        total += rollouts
+    return total, elapsed
+
+
+def main():
+    utils.DEBUG = False
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count() or 1
+    boards = search_boards()
+    print(f"{'mode':>14} {'cores':>6} {'rollouts':>9} {'ms':>8} {'rollouts/s':>11} {'per core':>9}")
+    for count in (0, workers):
+        engine = Engine(count)
+        try:
+            if count:
+                measure(engine, boards[:1])  # Worker aufwärmen
+            total, elapsed = measure(engine, boards)
+        finally:
+            engine.close()
+        cores = max(1, count)
+        rate = total / elapsed * 1000
+        mode = "in-process" if not count else f"pool({count})"
+        print(f"{mode:>14} {cores:>6} {total:>9} {elapsed:>8.0f} {rate:>11.0f} {rate / cores:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
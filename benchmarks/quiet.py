@@ -0,0 +1,19 @@
+# Gruppe 3 – Battlesnake Projekt (SS2025)
+# Mitglieder:
+# Eren Temizkan, 223201982
+# Dominik Ide, 220200046
+# Dogukan Karakoyun, 223202023
+# Alexandra Holsten, 221200813
+# Yuxiao Wu, 223200006
+
+import contextlib
+import io
+
+
+def quiet():
+    """
+    Unterdrückt die print-Ausgaben (z. B. aus ml_features) während einer Messung.
+
+    :return: Kontextmanager
+    """
+    return contextlib.redirect_stdout(io.StringIO())
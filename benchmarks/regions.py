@@ -0,0 +1,70 @@
+# Gruppe 3 – Battlesnake Projekt (SS2025)
+# Mitglieder:
+# Eren Temizkan, 223201982
+# Dominik Ide, 220200046
+# Dogukan Karakoyun, 223202023
+# Alexandra Holsten, 221200813
+# Yuxiao Wu, 223200006
+
+"""
+Vergleicht einzelne Flood-Fills pro Abfrage mit einer einmaligen Regionen-Zerlegung.
+
+Aufruf aus dem Projektverzeichnis:  python -m benchmarks.regions
+"""
+
+import time
+
+from Battlesnake.board_index import BoardIndex
+from benchmarks.boards import board_suite
+
+DIRECTIONS = [(0, 1), (0, -1), (-1, 0), (1, 0)]
+
+
+def query_cells(game_state):
+    """
+    Die Zellen, die ein Zug abfragt: Kopf, seine Nachbarn (Heatmap + open_area) und die
+    Nachbarn der Nachbarn (Blätter von simulate_future_space).
+
+    :param game_state: Spielzustand
+    :return: Liste von (x, y)
+    """
+    head = game_state["you"]["body"][0]
+    first = [(head["x"] + dx, head["y"] + dy) for dx, dy in DIRECTIONS]
+    second = [(x + dx, y + dy) for x, y in first for dx, dy in DIRECTIONS]
+    return [(head["x"], head["y"])] + first * 2 + second
+
+
+def per_query(index, cells):
+    board = index.board
+    total = 0
+    for x, y in cells:
+        if index.in_bounds(x, y):
+            total += board.count(board.flood(index.free_mask, board.bit(x, y)))
+    return total
+
+
+def labelled(index, cells):
+    index.regions = None  # Zerlegung pro Zug neu rechnen
+    return sum(index.region_size(x, y) for x, y in cells)
+
+
+def main():
+    repeats = 200
+    print(f"{'board':>8} {'queries':>8} {'per-query ms':>13} {'labelled ms':>12} {'speedup':>8}")
+    for name, game_state in board_suite():
+        index = BoardIndex(game_state)
+        cells = query_cells(game_state)
+        assert per_query(index, cells) == labelled(index, cells)
+
+        timings = []
+        for func in (per_query, labelled):
+            start = time.perf_counter()
+            for _ in range(repeats):
+                func(index, cells)
+            timings.append((time.perf_counter() - start) * 1000 / repeats)
+        print(f"{name:>8} {len(cells):>8} {timings[0]:>13.3f} {timings[1]:>12.3f} "
+              f"{timings[0] / timings[1]:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
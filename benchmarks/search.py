@@ -0,0 +1,67 @@
+# Gruppe 3 – Battlesnake Projekt (SS2025)
+# Mitglieder:
+# Eren Temizkan, 223201982
+# Dominik Ide, 220200046
+# Dogukan Karakoyun, 223202023
+# Alexandra Holsten, 221200813
+# Yuxiao Wu, 223200006
+
+"""
+Knoten pro Sekunde und erreichte Tiefe der Alpha-Beta-Suche (search.py) in 200 ms.
+
+Jedes Brett wird zweimal durchsucht: kalt mit leerer Transpositionstabelle und warm mit der
+Tabelle der ersten Suche (wie im nächsten Zug einer GameSession).
+
+Aufruf aus dem Projektverzeichnis:  python -m benchmarks.search
+"""
+
+import time
+
+import Battlesnake.utils as utils
+from Battlesnake.anytime import Deadline
+from Battlesnake.board_index import BoardIndex
+from Battlesnake.game import Cell
+from Battlesnake.heatmap_array import build_heatmap
+from Battlesnake.search import search_move
+from Battlesnake.zobrist import TranspositionTable
+from benchmarks.boards import random_game_state
+
+BUDGET_MS = 200
+
+
+def search_boards(count: int = 8):
+    """
+    Bretter mit kurzen Schlangen, damit es an der Wurzel echte Alternativen gibt.
+
+    :param count: Anzahl Bretter pro Größe
+    :return: Liste von (Name, game_state)
+    """
+    return [(f"{size}x{size}/{seed}", random_game_state(size, size, 4, seed, 3, 10))
+            for size in (11, 19) for seed in range(count)]
+
+
+def main():
+    utils.DEBUG = False
+    print(f"{'board':>10} {'depth':>6} {'nodes':>8} {'ms':>8} {'nodes/s':>10} {'warm depth':>11} {'tt hits':>8}")
+    total_nodes = total_ms = 0.0
+    for name, game_state in search_boards():
+        head = game_state["you"]["body"][0]
+        index = BoardIndex(game_state)
+        heatmap = build_heatmap(game_state, Cell.at(head["x"], head["y"]), game_state["you"]["health"], index)
+        table = TranspositionTable()
+
+        start = time.perf_counter()
+        _, depth, nodes = search_move(index, heatmap, Deadline(BUDGET_MS, start), table=table)
+        elapsed = (time.perf_counter() - start) * 1000
+        total_nodes += nodes
+        total_ms += elapsed
+
+        table.hits = 0
+        _, warm_depth, _ = search_move(index, heatmap, Deadline(BUDGET_MS), table=table)
+        print(f"{name:>10} {depth:>6} {nodes:>8} {elapsed:>8.1f} {nodes / elapsed * 1000:>10.0f} "
+              f"{warm_depth:>11} {table.hits:>8}")
+    print(f"{'gesamt':>10} {'':>6} {int(total_nodes):>8} {total_ms:>8.1f} {total_nodes / total_ms * 1000:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# Gruppe 3 – Battlesnake Projekt (SS2025)
+# Mitglieder:
+# Eren Temizkan, 223201982
+# Dominik Ide, 220200046
+# Dogukan Karakoyun, 223202023
+# Alexandra Holsten, 221200813
+# Yuxiao Wu, 223200006
+
+"""
+Züge pro Sekunde des lokalen Simulators (simulator.py): einmal mit einer billigen
+Zufalls-Policy (Kosten der Regeln und der game_state-Dictionaries) und einmal mit
+strategy.move für alle Schlangen (Selbstspiel).
+
+Aufruf aus dem Projektverzeichnis:  python -m benchmarks.simulator
+"""
+
+import random
+import time
+
+import Battlesnake.utils as utils
+from Battlesnake.simulator import Simulator
+from benchmarks.quiet import quiet
+
+DIRECTIONS = {"up": (0, 1), "down": (0, -1), "left": (-1, 0), "right": (1, 0)}
+
+
+def random_player(seed: int):
+    """
+    Zieht zufällig auf ein Feld, das auf dem Brett liegt und kein Körperteil (außer Schwanz) ist.
+
+    :param seed: Seed der Policy
+    :return: move-Funktion
+    """
+    rng = random.Random(seed)
+
+    def move(game_state):
+        board = game_state["board"]
+        blocked = {(c["x"], c["y"]) for snake in board["snakes"] for c in snake["body"][:-1]}
+        head = game_state["you"]["head"]
+        options = [name for name, (dx, dy) in DIRECTIONS.items()
+                   if 0 <= head["x"] + dx < board["width"] and 0 <= head["y"] + dy < board["height"]
+                   and (head["x"] + dx, head["y"] + dy) not in blocked]
+        return {"move": rng.choice(options) if options else "up"}
+
+    return move
+
+
+def play(make_player, games: int, snakes: int = 4) -> tuple[int, float, list]:
+    """
+    Spielt mehrere Spiele mit festen Seeds.
+
+    :param make_player: Fabrik (Seed -> move-Funktion)
+    :param games: Anzahl Spiele
+    :param snakes: Schlangen pro Spiel
+    :return: (Züge gesamt, Sekunden, Ergebnisse)
+    """
+    turns = 0
+    results = []
+    start = time.perf_counter()
+    for seed in range(games):
+        players = [(f"snake-{i}", make_player(seed * snakes + i)) for i in range(snakes)]
+        result = Simulator(players, seed=seed).run()
+        turns += result.turns
+        results.append(result)
+    return turns, time.perf_counter() - start, results
+
+
+def main():
+    utils.DEBUG = False
+    with quiet():
+        from Battlesnake.strategy import move as strategy_move
+
+    print(f"{'players':>10} {'games':>6} {'turns':>7} {'s':>7} {'turns/s':>9} {'deterministic':>14}")
+    for name, make_player, games in (("random", random_player, 200),
+                                     ("strategy", lambda seed: strategy_move, 5)):
+        with quiet():
+            turns, seconds, results = play(make_player, games)
+            _, _, again = play(make_player, min(games, 3))
+        same = all(repr(a) == repr(b) for a, b in zip(results, again))
+        print(f"{name:>10} {games:>6} {turns:>7} {seconds:>7.2f} {turns / seconds:>9.0f} {str(same):>14}")
+
+
+if __name__ == "__main__":
+    main()